@@ -0,0 +1,59 @@
+"""
+Benchmark comparing the memory and time needed to load a large list of dataclasses as a List or as a Columnar field
+"""
+
+import argparse
+from dataclasses import dataclass
+import time
+import tracemalloc
+from typing import List
+
+from nectarine import dictionary, load
+from nectarine.columnar import Columnar
+
+
+@dataclass
+class Rule:
+    source: str
+    port: int
+    weight: float
+    enabled: bool
+
+
+@dataclass
+class ListRules:
+    rules: List[Rule]
+
+
+@dataclass
+class ColumnarRules:
+    rules: Columnar[Rule]
+
+
+def _measure(target, value):
+    tracemalloc.start()
+    start = time.perf_counter()
+    config = load(target, [dictionary(value)])
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del config
+    return elapsed, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=500_000)
+    args = parser.parse_args()
+
+    value = {"rules": [
+        {"source": f"10.{i % 256}.0.0/16", "port": i % 65536, "weight": i / 7, "enabled": i % 2 == 0}
+        for i in range(args.size)
+    ]}
+    for target in (ListRules, ColumnarRules):
+        elapsed, size = _measure(target, value)
+        print(f"{target.__name__:<15} {elapsed * 1000:9.2f} ms {size / 2 ** 20:9.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
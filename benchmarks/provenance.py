@@ -0,0 +1,57 @@
+"""
+Benchmark measuring the time and memory needed to record provenance, for a configuration with many values
+"""
+
+import argparse
+from dataclasses import dataclass
+import time
+import tracemalloc
+from typing import Dict
+
+from nectarine import dictionary, env, load
+
+
+@dataclass
+class Service:
+    host: str
+    port: int
+    weight: float
+
+
+@dataclass
+class Services:
+    services: Dict[str, Service]
+
+
+def _measure(providers, provenance: bool):
+    start = time.perf_counter()
+    config = load(Services, providers, provenance=provenance)
+    elapsed = time.perf_counter() - start
+    del config
+    tracemalloc.start()  # Measured separately, since tracing allocations slows loading down
+    config = load(Services, providers, provenance=provenance)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del config
+    return elapsed, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=35_000, help="number of services (each one has 3 values)")
+    args = parser.parse_args()
+
+    defaults = {"services": {
+        f"service-{i}": {"host": f"10.0.{i // 256 % 256}.{i % 256}", "port": 8000 + i % 1000, "weight": 1.}
+        for i in range(args.size)
+    }}
+    overrides = {"services": {f"service-{i}": {"weight": 2.} for i in range(0, args.size, 10)}}
+    providers = [env(), dictionary(overrides), dictionary(defaults)]
+    _measure(providers, False)  # Warm up caches
+    for provenance in (False, True):
+        elapsed, size = _measure(providers, provenance)
+        print(f"provenance={provenance!s:<6} {elapsed * 1000:9.2f} ms {size / 2 ** 20:9.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
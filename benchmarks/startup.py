@@ -0,0 +1,48 @@
+"""
+Benchmark measuring the time needed to import Nectarine in a fresh interpreter
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+SNIPPETS = {
+    "import nectarine": "import nectarine",
+    "import nectarine + env provider": "import nectarine; nectarine.env",
+    "import nectarine + all built-in providers": "import nectarine; nectarine.arguments; nectarine.env; nectarine.json",
+}
+
+
+def _import_time_us(snippet: str) -> int:
+    """
+    Run a snippet with -X importtime and sum the cumulative time of the top-level imports it triggered
+    """
+    baseline = subprocess.run([sys.executable, "-X", "importtime", "-c", "pass"], capture_output=True, text=True)
+    already_imported = {line.split('|')[-1].strip() for line in baseline.stderr.splitlines()}
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", snippet], capture_output=True, text=True,
+                             check=True)
+    total = 0
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or line.endswith("| package"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split('|')
+        if name.strip() in already_imported:
+            continue
+        if not name.startswith("  "):  # Top-level imports only, nested ones are included in the cumulative time
+            total += int(cumulative)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    for label, snippet in SNIPPETS.items():
+        timings = [_import_time_us(snippet) for _ in range(args.runs)]
+        print(f"{label:<45} median {statistics.median(timings) / 1000:7.2f} ms   min {min(timings) / 1000:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+Benchmark measuring the time needed to validate large lists of Literal values through the dictionary provider
+"""
+
+import argparse
+from dataclasses import dataclass
+import timeit
+from typing import List, Literal
+
+from nectarine import dictionary, load
+
+REGIONS = tuple(f"region-{i}" for i in range(400))
+Region = Literal[REGIONS]
+
+
+@dataclass
+class Configuration:
+    regions: List[Region]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    value = {"regions": [REGIONS[i % len(REGIONS)] for i in range(args.size)]}
+    timings = timeit.repeat(lambda: load(Configuration, [dictionary(value)]), number=1, repeat=args.runs)
+    print(f"load of {args.size} Literal values: min {min(timings) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
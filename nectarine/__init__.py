@@ -2,58 +2,84 @@
 Main Nectarine module
 """
 
-from functools import reduce
-from typing import Any, Callable, Dict, List, Type
+from importlib import import_module
+from typing import List, Type
 
-from nectarine.configuration_provider import ConfigurationProvider
-from nectarine.dataclasses import dataclass_from_dict
-from nectarine.providers.env import env
-from nectarine.providers.arguments import arguments
-from nectarine.providers.dictionary import dictionary
-from nectarine.providers.json import json
+from nectarine.configuration_provider import ConfigurationProvider, Path
+from nectarine.dataclasses import dataclass_from_dict, get_paths, get_section_type
+from nectarine.deduplication import Deduplicator
+from nectarine.merging import Merger, MergeStrategy, MergeStrategies, make_merger
+from nectarine.provenance import build_provenance, explain, record_provenance
+from nectarine.registry import available_providers, get_provider, register_provider
 
-Merger = Callable[[Dict[str, Any], Dict[str, Any]], Dict[str, Any]]
-MergeStrategy = Callable[[str, Any, Any, Merger], Any]
+# Features living in their own modules, imported on first access like providers
+_LAZY_ATTRIBUTES = {
+    "apply_patch": "nectarine.patching",
+    "ConfigCache": "nectarine.caching",
+    "compile_config": "nectarine.compilation",
+    "derive": "nectarine.deriving",
+    "open_compiled": "nectarine.compilation",
+    "LiveConfig": "nectarine.live",
+    "ReloadResult": "nectarine.reloading",
+    "reload": "nectarine.reloading",
+    "Session": "nectarine.session",
+    "iter_load": "nectarine.streaming",
+}
 
 
-def _merge_by_merging_containers_or_replacing(_: str, value1: Any, value2: Any, merge: Merger):
-    if isinstance(value1, dict) and isinstance(value2, dict):
-        return merge(value1, value2)
-    if isinstance(value1, list) and isinstance(value2, list):
-        return value1 + value2
-    return value2
+def __getattr__(name: str):
+    # Providers (nectarine.env, nectarine.json, ...) are imported on first access, to keep "import nectarine" cheap
+    if name.startswith('_'):
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    if name in _LAZY_ATTRIBUTES:
+        return getattr(import_module(_LAZY_ATTRIBUTES[name]), name)
+    try:
+        return get_provider(name)
+    except LookupError:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from None
 
 
-def _merge_dicts(lh_dict: Dict[str, Any], rh_dict: Dict[str, Any], strategy: MergeStrategy) -> Dict[str, Any]:
-    for key, rh_value in rh_dict.items():
-        lh_value = lh_dict.get(key)
-        if lh_value is None:
-            lh_dict[key] = rh_value
-        else:
-            lh_dict[key] = _merge_by_merging_containers_or_replacing(
-                key,
-                lh_value,
-                rh_value,
-                lambda a, b: _merge_dicts(a, b, strategy)
-            )
-    return lh_dict
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(available_providers()))
 
 
 def load(
         target: Type,
         providers: List[ConfigurationProvider],
         strict: bool = False,
+        deduplicator: Deduplicator = None,
+        merge: MergeStrategies = None,
+        provenance: bool = False,
+        path: Path = (),
 ):
     """
-    Load a dataclass instance using the given providers
+    Load a dataclass instance using the given providers, or only one of its sections
 
     :param target:                      the target dataclass type
     :param providers:                   the list of providers to use, in order of priority
     :param strict:                      activate strict mode (reject extra values, ...)
+    :param deduplicator:                the deduplicator used to share repeated values (or None to disable sharing)
+    :param merge:                       the merge strategy, or a dictionary mapping paths (tuples) or types to merge
+                                        strategies (see nectarine.merging, default is to merge dictionaries and
+                                        concatenate lists)
+    :param provenance:                  record which provider supplied each value, see explain
+    :param path:                        the path to the section to load, e.g. ("database",), in which case an instance
+                                        of the section's dataclass is returned, only its values being read and merged
+                                        (default is an empty tuple, to load the whole target)
     """
+    section_type = get_section_type(target, path)
     results = []
     for provider in reversed(providers):
-        r = provider.load_configuration(target, strict=strict)
+        if path:
+            r = provider.load_section(target, path, strict=strict)
+        else:
+            r = provider.load_configuration(target, strict=strict)
         results.append(r)
-    result = reduce(lambda acc, new: _merge_dicts(acc, new, _merge_by_merging_containers_or_replacing), results, {})
-    return dataclass_from_dict(target, result)
+    types = None
+    if isinstance(merge, dict):
+        types = {field_path: field.type for field_path, field in get_paths(section_type, path)}
+    result = make_merger(merge, types).merge(path, [{}, *results])
+    config = dataclass_from_dict(section_type, result, deduplicator)
+    if provenance:
+        record_provenance(config, build_provenance(providers, results[::-1]))
+    return config
@@ -0,0 +1,66 @@
+"""
+Command line interface of Nectarine
+
+    $ nectarine compile-config myapp.config:Configuration -o config.nconf -s env:MYAPP_ -s json:config.json
+"""
+
+import argparse
+import sys
+from importlib import import_module
+from typing import List, Type
+
+from nectarine.compilation import compile_config
+from nectarine.configuration_provider import ConfigurationProvider
+from nectarine.errors import NectarineError
+from nectarine.registry import get_provider
+
+
+def _import_target(reference: str) -> Type:
+    module_name, _, qualified_name = reference.partition(':')
+    if not qualified_name:
+        raise argparse.ArgumentTypeError(f"expected a target of the form 'module:Type', got '{reference}'")
+    target = import_module(module_name)
+    for name in qualified_name.split('.'):
+        target = getattr(target, name)
+    return target
+
+
+def _make_provider(source: str) -> ConfigurationProvider:
+    name, separator, argument = source.partition(':')
+    factory = get_provider(name)
+    return factory(argument) if separator else factory()
+
+
+def _compile_config(args: argparse.Namespace):
+    providers = [_make_provider(source) for source in args.sources]
+    compile_config(args.target, providers, args.output, strict=args.strict)
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(prog="nectarine")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    compile_parser = commands.add_parser(
+        "compile-config",
+        help="load and validate a configuration, and write it in the compiled format",
+    )
+    compile_parser.add_argument("target", type=_import_target, help="the target dataclass, as 'module:Type'")
+    compile_parser.add_argument("-o", "--output", required=True, help="the path to the compiled file to write")
+    compile_parser.add_argument(
+        "-s", "--source", dest="sources", action="append", default=[], metavar="PROVIDER[:ARGUMENT]",
+        help="a provider to load from, in order of priority (e.g. 'env:PREFIX_' or 'json:config.json')",
+    )
+    compile_parser.add_argument("--strict", action="store_true", help="activate strict mode")
+    compile_parser.set_defaults(handler=_compile_config)
+
+    args = parser.parse_args(argv)
+    try:
+        args.handler(args)
+    except NectarineError as e:
+        print(f"nectarine: error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""
+Internal module providing helper functions shared by the modules modifying configurations (deriving, patching)
+"""
+
+from copy import copy
+from typing import Dict, Type
+
+from nectarine.configuration_provider import Path
+from nectarine.dataclasses import compile_converter, get_fields, get_paths
+from nectarine.errors import NectarineInvalidValueError, NectarineStrictLoadingError
+from nectarine.providers.dictionary import extract_configuration
+from nectarine.typing import compile_validator, get_generic_args, is_dataclass, is_linear_collection, is_mapping, \
+    is_optional, is_tuple
+from nectarine._utils import cached_per_hint
+
+
+@cached_per_hint
+def _field_types(type_: Type) -> Dict[str, Type]:
+    return {field.name: field.type for field in get_fields(type_)}
+
+
+def child_type(hint: Type, key, path: Path) -> Type:
+    """
+    Retrieve the type of the value found under a given key of a value of a given type
+
+    :param hint:                        the type of the value
+    :param key:                         the key (field name, dictionary key or index)
+    :param path:                        the path to the child, reported if the key is not part of the type
+    """
+    if is_optional(hint):
+        hint = get_generic_args(hint)[0]
+    if is_dataclass(hint):
+        child = _field_types(hint).get(key)
+        if child is None:
+            raise NectarineStrictLoadingError(offending_keys=[path])
+        return child
+    if is_mapping(hint):
+        return get_generic_args(hint)[1]
+    if is_linear_collection(hint) and isinstance(key, int):
+        return get_generic_args(hint)[0]
+    if is_tuple(hint) and isinstance(key, int) and key < len(get_generic_args(hint)):
+        return get_generic_args(hint)[key]
+    raise NectarineStrictLoadingError(offending_keys=[path])
+
+
+def check_value(hint: Type, value):
+    """
+    Validate a new value and convert it to the type of its field, like a value obtained from a provider
+
+    :param hint:                        the type of the field
+    :param value:                       the value to check
+    """
+    if isinstance(value, list) and is_tuple(hint):
+        value = tuple(value)
+    if not compile_validator(hint)(value):
+        raise NectarineInvalidValueError(expected_type=hint, value=value)
+    dataclass_type = get_generic_args(hint)[0] if is_optional(hint) else hint
+    if isinstance(value, dict) and is_dataclass(dataclass_type):
+        # Values of the nested fields are checked like by the dictionary provider, unknown keys being rejected like
+        # unknown paths
+        value = extract_configuration(dict(get_paths(dataclass_type)), value, strict=True)
+    return compile_converter(hint)(value, None)
+
+
+def copy_instance(value):
+    """
+    Create a shallow copy of a dataclass instance, without going through its __init__ (which also works for frozen
+    dataclasses)
+
+    :param value:                       the instance to copy
+    """
+    try:
+        state = value.__dict__
+    except AttributeError:  # Instances of slotted dataclasses
+        return copy(value)
+    result = object.__new__(type(value))
+    result.__dict__.update(state)
+    return result
@@ -2,7 +2,9 @@
 Internal module providing helper functions
 """
 
-from typing import Any, Dict, Type
+from functools import wraps
+from typing import Any, Callable, Dict, Type, TypeVar
+
 from nectarine.errors import NectarineInvalidValueError
 
 
@@ -17,7 +19,52 @@ def insert_at_path(d: Dict[str, Any], path, value: Any):
 
 
 def try_convert(value, type_: Type):
+    from nectarine.converters import convert, find_converter  # Imported on first use, like in nectarine.typing
+
+    if find_converter(type_) is not None:
+        return convert(type_, value)
     try:
         return type_(value)
     except ValueError:
         raise NectarineInvalidValueError(type_, value)
+
+
+class Identity:
+    """
+    Hashable reference to an object, compared by identity (e.g. to use an unhashable object in a cache key)
+    """
+
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        return id(self.value)
+
+    def __eq__(self, other):
+        return isinstance(other, Identity) and other.value is self.value
+
+
+R = TypeVar('R')
+
+
+def cached_per_hint(function: Callable[[Type], R]) -> Callable[[Type], R]:
+    """
+    Cache the results of a function taking a type hint, using the identity of the hint as the key
+
+    Hints are not hashed, since hashing some of them (e.g. a large Literal) is about as costly as using them.
+    """
+    cache = {}
+
+    @wraps(function)
+    def wrapper(hint: Type) -> R:
+        cached = cache.get(id(hint))
+        if cached is not None and cached[0] is hint:
+            return cached[1]
+        result = function(hint)
+        cache[id(hint)] = hint, result  # Keeping a reference to the hint ensures its id is not reused
+        return result
+
+    wrapper.cache_clear = cache.clear
+    return wrapper
@@ -0,0 +1,197 @@
+"""
+Module providing a bounded cache of loaded configurations
+
+Configurations are cached by target type and by the fingerprints of the providers (see
+ConfigurationProvider.fingerprint), which identify the data each provider would load: a file's status, a dictionary's
+identity, the values of environment variables, ... A configuration is therefore loaded again as soon as one of its
+sources changes.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Type
+
+from nectarine import load
+from nectarine.configuration_provider import ConfigurationProvider
+from nectarine.deduplication import Deduplicator
+from nectarine.merging import MergeStrategies
+
+
+def estimate_size(value) -> int:
+    """
+    Estimate the memory used by a value and everything it references, counting shared objects once
+
+    :param value:                       the value to estimate the size of
+    """
+    seen = set()
+    size = 0
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+        size += sys.getsizeof(value)
+        if isinstance(value, dict):
+            stack.extend(value.keys())
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            stack.extend(value)
+        elif hasattr(value, '__dict__') and not isinstance(value, type):
+            stack.append(value.__dict__)
+    return size
+
+
+@dataclass
+class _Entry:
+    config: Any
+    size: int
+    expires_at: Optional[float]
+
+
+class _Flight:
+    """
+    Load in progress, which concurrent requests for the same key wait for
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.config = None
+        self.error: Optional[BaseException] = None
+
+
+class ConfigCache:
+    """
+    Cache of loaded configurations, bounded in number of entries and in memory, with least-recently-used eviction
+
+    Concurrent requests for a configuration that is not cached load it once, the other requests waiting for the result.
+    Configurations are shared by everyone getting them from the cache, and must therefore be treated as read-only.
+    """
+
+    def __init__(
+            self,
+            max_entries: int = 128,
+            max_bytes: int = None,
+            ttl: float = None,
+            strict: bool = False,
+            deduplicator: Deduplicator = None,
+            merge: MergeStrategies = None,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param max_entries:             the maximum number of cached configurations
+        :param max_bytes:               the maximum estimated memory used by cached configurations (or None for no
+                                        limit)
+        :param ttl:                     the time after which cached configurations are loaded again, in seconds (or
+                                        None to keep them as long as their sources do not change)
+        :param strict:                  activate strict mode when loading (reject extra values, ...)
+        :param deduplicator:            the deduplicator used to share repeated values (or None to disable sharing)
+        :param merge:                   the merge strategies (see load)
+        :param clock:                   the function giving the current time, in seconds
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.strict = strict
+        self.deduplicator = deduplicator
+        self.merge = merge
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
+        self._entries: 'OrderedDict[Hashable, _Entry]' = OrderedDict()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def key(self, target: Type, providers: List[ConfigurationProvider]) -> Optional[Hashable]:
+        """
+        Compute the key identifying a configuration, or None if one of the providers cannot identify its data
+
+        :param target:                  the target dataclass type
+        :param providers:               the list of providers to use, in order of priority
+        """
+        fingerprints = []
+        for provider in providers:
+            fingerprint = provider.fingerprint(target)
+            if fingerprint is None:
+                return None
+            fingerprints.append(fingerprint)
+        return target, tuple(fingerprints)
+
+    def get(self, target: Type, providers: List[ConfigurationProvider]):
+        """
+        Retrieve a configuration from the cache, loading it if it is not cached (see load)
+
+        :param target:                  the target dataclass type
+        :param providers:               the list of providers to use, in order of priority
+        """
+        key = self.key(target, providers)
+        if key is None:  # Uncacheable
+            with self._lock:
+                self.misses += 1
+            return self._load(target, providers)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires_at is None or self.clock() < entry.expires_at:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry.config
+                self._remove(key)
+                self.evictions += 1
+            self.misses += 1
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.config
+        try:
+            flight.config = config = self._load(target, providers)
+            self._store(key, config)
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return config
+
+    def _load(self, target: Type, providers: List[ConfigurationProvider]):
+        return load(target, providers, strict=self.strict, deduplicator=self.deduplicator, merge=self.merge)
+
+    def _store(self, key: Hashable, config):
+        size = estimate_size(config) if self.max_bytes is not None else 0
+        expires_at = self.clock() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(config, size, expires_at)
+            self.size += size
+            while self._entries and (len(self._entries) > self.max_entries or
+                                     (self.max_bytes is not None and self.size > self.max_bytes)):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key: Hashable):
+        entry = self._entries.pop(key)
+        self.size -= entry.size
+
+    def clear(self):
+        """
+        Remove every configuration from the cache
+        """
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,205 @@
+"""
+Module providing a columnar ("struct of arrays") container for large lists of dataclass instances
+
+A field annotated as Columnar[T] (where T is a dataclass) is loaded from a list just like a List[T] field, but instead
+of one instance per item, each field of T is stored as a column: numbers and booleans in compact arrays, strings in a
+deduplicated string table. Items are accessed through lightweight row views, and whole columns can be retrieved at once.
+"""
+
+from array import array
+from dataclasses import MISSING
+from typing import Any, Callable, Dict, Generic, Iterator, List, Sequence, Type, TypeVar
+
+from nectarine.deduplication import Deduplicator
+from nectarine.dataclasses import compile_converter, get_default_value, get_fields
+from nectarine.errors import NectarineInvalidValueError, NectarineMissingValueError
+from nectarine.typing import compile_validator, get_generic_args, is_literal
+
+T = TypeVar('T')
+
+
+class StringColumn(Sequence[str]):
+    """
+    Column of strings, stored as indexes into a table of distinct strings
+    """
+
+    def __init__(self, table: List[str], indexes: array):
+        self.table = table
+        self.indexes = indexes
+
+    def __len__(self) -> int:
+        return len(self.indexes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.table[i] for i in self.indexes[index]]
+        return self.table[self.indexes[index]]
+
+    def __iter__(self) -> Iterator[str]:
+        table = self.table
+        return (table[i] for i in self.indexes)
+
+    def __eq__(self, other):
+        if not isinstance(other, StringColumn):
+            return NotImplemented
+        return list(self) == list(other)
+
+
+def _make_strings(values: List[str], deduplicator: Deduplicator) -> StringColumn:
+    table: List[str] = []
+    index_of: Dict[str, int] = {}
+    indexes = array('I')
+    for value in values:
+        index = index_of.get(value)
+        if index is None:
+            index = index_of[value] = len(table)
+            table.append(deduplicator.deduplicate(value) if deduplicator is not None else value)
+        indexes.append(index)
+    return StringColumn(table, indexes)
+
+
+def _make_ints(values: List[int], _: Deduplicator) -> Sequence[int]:
+    try:
+        return array('q', values)
+    except OverflowError:  # Some values do not fit in 64 bits, keep them boxed
+        return values
+
+
+def _make_floats(values: List[float], _: Deduplicator) -> Sequence[float]:
+    return array('d', values)
+
+
+def _make_bools(values: List[bool], _: Deduplicator) -> Sequence[int]:
+    return array('b', values)
+
+
+def _column_maker(type_: Type) -> Callable[[List[Any], Deduplicator], Sequence]:
+    if is_literal(type_):
+        args = get_generic_args(type_)
+        if all(type(arg) is str for arg in args):
+            return _make_strings
+        if all(type(arg) is int for arg in args):
+            return _make_ints
+    return {str: _make_strings, int: _make_ints, float: _make_floats, bool: _make_bools}.get(type_)
+
+
+class ColumnarRow:
+    """
+    View on a single row of a columnar container, giving access to its fields as attributes
+
+    Like namedtuple, its own methods are prefixed with an underscore so that they cannot clash with field names.
+    """
+
+    __slots__ = ('_container', '_index')
+
+    def __init__(self, container: 'Columnar', index: int):
+        self._container = container
+        self._index = index
+
+    def __getattr__(self, name: str):
+        getter = self._container.getters.get(name)
+        if getter is None:
+            raise AttributeError(f"'{self._container.row_type.__name__}' has no field '{name}'")
+        return getter(self._index)
+
+    def _asdict(self) -> Dict[str, Any]:
+        return {name: getter(self._index) for name, getter in self._container.getters.items()}
+
+    def _asdataclass(self):
+        return self._container.row_type(**self._asdict())
+
+    def __eq__(self, other):
+        if isinstance(other, ColumnarRow):
+            return self._asdict() == other._asdict()
+        if isinstance(other, self._container.row_type):
+            return self._asdataclass() == other
+        return NotImplemented
+
+    def __repr__(self):
+        fields = ', '.join(f"{name}={value!r}" for name, value in self._asdict().items())
+        return f"{self._container.row_type.__name__}Row({fields})"
+
+
+class Columnar(Generic[T]):
+    """
+    Columnar container of dataclass instances, used as the type of a field: Columnar[T]
+    """
+
+    __columnar__ = True  # See nectarine.typing.is_columnar
+
+    def __init__(self, row_type: Type[T], columns: Dict[str, Sequence], length: int):
+        self.row_type = row_type
+        self.columns = columns
+        self.length = length
+        self.getters: Dict[str, Callable[[int], Any]] = {}
+        for name, column in columns.items():
+            if isinstance(column, array) and column.typecode == 'b':
+                self.getters[name] = lambda i, column=column: bool(column[i])
+            else:
+                self.getters[name] = column.__getitem__
+
+    @staticmethod
+    def from_rows(row_type: Type[T], rows: List[Any], deduplicator: Deduplicator = None) -> 'Columnar[T]':
+        """
+        Build a columnar container from a list of dictionaries (or instances of the row type)
+
+        :param row_type:                the dataclass type of the rows
+        :param rows:                    the rows
+        :param deduplicator:            the deduplicator to share repeated values with (or None to disable sharing)
+        """
+        columns = {}
+        for field in get_fields(row_type):
+            check = compile_validator(field.type)
+            values = []
+            default = MISSING
+            for row in rows:
+                value = row.get(field.name, MISSING) if isinstance(row, dict) else getattr(row, field.name)
+                if value is MISSING:
+                    if default is MISSING:
+                        default = get_default_value(field)
+                        if default is MISSING:
+                            raise NectarineMissingValueError(field.name)
+                    value = default
+                if not check(value):
+                    raise NectarineInvalidValueError(field.type, value)
+                values.append(value)
+            make_column = _column_maker(field.type)
+            if make_column is not None:
+                columns[field.name] = make_column(values, deduplicator)
+            else:
+                convert = compile_converter(field.type)
+                columns[field.name] = [convert(value, deduplicator) for value in values]
+        return Columnar(row_type, columns, len(rows))
+
+    def column(self, name: str) -> Sequence:
+        """
+        Retrieve all the values of a field at once
+
+        :param name:                    the name of the field
+        """
+        return self.columns[name]
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [ColumnarRow(self, i) for i in range(*index.indices(self.length))]
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("columnar index out of range")
+        return ColumnarRow(self, index)
+
+    def __iter__(self) -> Iterator[ColumnarRow]:
+        return (ColumnarRow(self, i) for i in range(self.length))
+
+    def __eq__(self, other):
+        if not isinstance(other, Columnar):
+            return NotImplemented
+        return self.row_type is other.row_type and self.length == other.length and self.columns == other.columns
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Columnar[{self.row_type.__name__}]({self.length} rows)"
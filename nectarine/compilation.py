@@ -0,0 +1,284 @@
+"""
+Module providing a compact binary format for validated configurations, which can be read lazily through mmap
+
+A compiled file is made of a header followed by encoded values. Each value starts with a one-byte tag; containers and
+dataclass records store a table of offsets to their items, so that any field can be reached without decoding the
+others. The header embeds a hash of the schema the configuration was validated against, so that a matching target type
+can skip validation entirely.
+
+Layout of the header (little-endian): magic (4 bytes), format version (4 bytes), schema hash (32 bytes), root offset
+(4 bytes).
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Type
+
+from nectarine import load
+from nectarine.columnar import Columnar
+from nectarine.configuration_provider import ConfigurationProvider
+from nectarine.converters import find_converter
+from nectarine.dataclasses import Field, dataclass_from_dict, get_fields
+from nectarine.errors import NectarineSchemaMismatchError
+from nectarine.typing import get_generic_args, get_origin, is_dataclass, is_generic, is_literal, is_optional
+
+MAGIC = b"NECT"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sI32sI")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_PAIR = struct.Struct("<II")
+
+_NONE, _FALSE, _TRUE, _INT, _BIG_INT, _FLOAT, _STR, _LIST, _TUPLE, _DICT, _RECORD, _SET, _FROZENSET = range(13)
+
+
+def _describe(type_: Type) -> str:
+    if is_dataclass(type_):
+        fields = ','.join(f"{f.name}:{_describe(f.type)}" for f in get_fields(type_))
+        return f"{type_.__module__}.{type_.__qualname__}{{{fields}}}"
+    if is_literal(type_):
+        return f"Literal[{','.join(repr(v) for v in get_generic_args(type_))}]"
+    if is_generic(type_):
+        args = ','.join('...' if a is Ellipsis else _describe(a) for a in get_generic_args(type_))
+        return f"{_describe(get_origin(type_))}[{args}]"
+    return getattr(type_, '__qualname__', repr(type_))
+
+
+@lru_cache(maxsize=None)
+def schema_hash(type_: Type) -> bytes:
+    """
+    Compute a hash identifying the schema of a type, i.e. its fields and their types, recursively
+
+    :param type_:                       the type to compute the hash of
+    """
+    return hashlib.sha256(_describe(type_).encode()).digest()
+
+
+class _Encoder:
+    def __init__(self):
+        self.buffer = bytearray(_HEADER.size)
+        self.strings: Dict[str, int] = {}
+
+    def _append(self, tag: int, *chunks: bytes) -> int:
+        offset = len(self.buffer)
+        self.buffer.append(tag)
+        for chunk in chunks:
+            self.buffer += chunk
+        return offset
+
+    def _encode_table(self, tag: int, offsets: List[int]) -> int:
+        return self._append(tag, _U32.pack(len(offsets)), struct.pack(f"<{len(offsets)}I", *offsets))
+
+    def encode(self, value) -> int:
+        if value is None:
+            return self._append(_NONE)
+        if value is True or value is False:
+            return self._append(_TRUE if value else _FALSE)
+        if isinstance(value, int):
+            if -2 ** 63 <= value < 2 ** 63:
+                return self._append(_INT, _I64.pack(value))
+            return self._append(_BIG_INT, self._encode_str_payload(str(value)))
+        if isinstance(value, float):
+            return self._append(_FLOAT, _F64.pack(value))
+        if isinstance(value, str):
+            offset = self.strings.get(value)
+            if offset is None:
+                offset = self._append(_STR, self._encode_str_payload(value))
+                self.strings[value] = offset
+            return offset
+        if is_dataclass(type(value)):
+            pairs = [(self.encode(f.name), self.encode(getattr(value, f.name))) for f in get_fields(type(value))]
+            return self._encode_pairs(_RECORD, pairs)
+        if isinstance(value, dict):
+            pairs = [(self.encode(k), self.encode(v)) for k, v in value.items()]
+            return self._encode_pairs(_DICT, pairs)
+        if isinstance(value, Columnar):  # Stored row by row, it is rebuilt from the list when decoded
+            return self._encode_table(_LIST, [self.encode(row._asdataclass()) for row in value])
+        for type_, tag in ((list, _LIST), (tuple, _TUPLE), (set, _SET), (frozenset, _FROZENSET)):
+            if isinstance(value, type_):
+                return self._encode_table(tag, [self.encode(v) for v in value])
+        converter = find_converter(type(value))
+        if converter is not None:  # Stored as its dumped value, converted back when the configuration is built
+            return self.encode(converter.dump(value))
+        raise TypeError(f"cannot compile a value of type '{type(value).__name__}'")
+
+    @staticmethod
+    def _encode_str_payload(value: str) -> bytes:
+        data = value.encode()
+        return _U32.pack(len(data)) + data
+
+    def _encode_pairs(self, tag: int, pairs: List[Tuple[int, int]]) -> int:
+        flat = [offset for pair in pairs for offset in pair]
+        return self._append(tag, _U32.pack(len(pairs)), struct.pack(f"<{len(flat)}I", *flat))
+
+
+def compile_value(target_type: Type, value) -> bytes:
+    """
+    Encode an instance of a dataclass into the compiled format
+
+    :param target_type:                 the type the value was validated against
+    :param value:                       the value to encode
+    """
+    encoder = _Encoder()
+    root = encoder.encode(value)
+    _HEADER.pack_into(encoder.buffer, 0, MAGIC, VERSION, schema_hash(target_type), root)
+    return bytes(encoder.buffer)
+
+
+def compile_config(
+        target: Type,
+        providers: List[ConfigurationProvider],
+        output: str,
+        strict: bool = False,
+):
+    """
+    Load a dataclass instance using the given providers, and write it to a file in the compiled format
+
+    :param target:                      the target dataclass type
+    :param providers:                   the list of providers to use, in order of priority
+    :param output:                      the path to the file to write
+    :param strict:                      activate strict mode (reject extra values, ...)
+    """
+    data = compile_value(target, load(target, providers, strict=strict))
+    temporary = f"{output}.tmp"
+    with open(temporary, 'wb') as f:
+        f.write(data)
+    os.replace(temporary, output)  # Readers either see the previous file or the new one, never a partial one
+
+
+class CompiledFile:
+    """
+    Class representing a compiled configuration file, mapped in memory
+    """
+
+    def __init__(self, file: str):
+        with open(file, 'rb') as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.schema_hash, self.root = _HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"'{file}' is not a compiled configuration file")
+
+    def matches(self, type_: Type) -> bool:
+        """
+        Check whether the file was compiled for the schema of a given type
+
+        :param type_:                   the type to check
+        """
+        return self.schema_hash == schema_hash(type_)
+
+    def tag(self, offset: int) -> int:
+        return self.data[offset]
+
+    def _table(self, offset: int, width: int) -> Tuple[int, ...]:
+        count, = _U32.unpack_from(self.data, offset + 1)
+        return struct.unpack_from(f"<{count * width}I", self.data, offset + 5)
+
+    def record_field_offset(self, offset: int, index: int) -> int:
+        return _U32.unpack_from(self.data, offset + 5 + _PAIR.size * index + 4)[0]
+
+    def section_offset(self, type_: Type, path: Tuple[str, ...]) -> Optional[int]:
+        """
+        Find the offset of the record of a section, or None if it is missing
+
+        :param type_:                   the type the file was compiled for
+        :param path:                    the path to the section (see nectarine.dataclasses.get_section_type)
+        """
+        offset = self.root
+        for name in path:
+            if self.tag(offset) != _RECORD:
+                return None
+            index, field = _field_indexes(type_)[name]
+            offset = self.record_field_offset(offset, index)
+            type_ = field.type
+        return offset if self.tag(offset) == _RECORD else None
+
+    def decode(self, offset: int):
+        """
+        Decode the value at a given offset, records being decoded as dictionaries
+
+        :param offset:                  the offset of the value
+        """
+        tag = self.data[offset]
+        if tag == _NONE:
+            return None
+        if tag == _FALSE or tag == _TRUE:
+            return tag == _TRUE
+        if tag == _INT:
+            return _I64.unpack_from(self.data, offset + 1)[0]
+        if tag == _FLOAT:
+            return _F64.unpack_from(self.data, offset + 1)[0]
+        if tag == _STR or tag == _BIG_INT:
+            length, = _U32.unpack_from(self.data, offset + 1)
+            text = str(self.data[offset + 5:offset + 5 + length], 'utf-8')
+            return text if tag == _STR else int(text)
+        if tag == _DICT or tag == _RECORD:
+            flat = self._table(offset, 2)
+            return {self.decode(flat[i]): self.decode(flat[i + 1]) for i in range(0, len(flat), 2)}
+        origin = {_LIST: list, _TUPLE: tuple, _SET: set, _FROZENSET: frozenset}[tag]
+        return origin(self.decode(item) for item in self._table(offset, 1))
+
+
+@lru_cache(maxsize=None)
+def _field_indexes(type_: Type) -> Dict[str, Tuple[int, Field]]:
+    return {field.name: (i, field) for i, field in enumerate(get_fields(type_))}
+
+
+def _record_type(type_: Type):
+    if is_optional(type_):
+        type_ = get_generic_args(type_)[0]
+    return type_ if is_dataclass(type_) else None
+
+
+class CompiledView:
+    """
+    Read-only view on a dataclass record of a compiled file, decoding each field on first access
+    """
+
+    def __init__(self, file: CompiledFile, offset: int, type_: Type):
+        self._file = file
+        self._offset = offset
+        self._type = type_
+
+    def __getattr__(self, name: str):
+        try:
+            index, field = _field_indexes(self._type)[name]
+        except KeyError:
+            raise AttributeError(f"'{self._type.__name__}' has no field '{name}'") from None
+        offset = self._file.record_field_offset(self._offset, index)
+        record_type = _record_type(field.type)
+        if record_type is not None and self._file.tag(offset) == _RECORD:
+            value = CompiledView(self._file, offset, record_type)
+        else:
+            value = dataclass_from_dict(field.type, self._file.decode(offset))
+        self.__dict__[name] = value  # Later accesses do not go through __getattr__ anymore
+        return value
+
+    def __repr__(self):
+        return f"CompiledView[{self._type.__name__}]"
+
+
+def materialize(view: CompiledView):
+    """
+    Convert a view to an instance of its dataclass, decoding all of its fields
+
+    :param view:                        the view to convert
+    """
+    return dataclass_from_dict(view._type, view._file.decode(view._offset))
+
+
+def open_compiled(target: Type, file: str) -> CompiledView:
+    """
+    Open a compiled configuration file without decoding it, fields being decoded when they are accessed
+
+    :param target:                      the target dataclass type, which must match the one the file was compiled for
+    :param file:                        the path to the compiled file
+    """
+    compiled = CompiledFile(file)
+    if not compiled.matches(target):
+        raise NectarineSchemaMismatchError(target)
+    return CompiledView(compiled, compiled.root, target)
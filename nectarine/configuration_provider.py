@@ -1,5 +1,5 @@
 from abc import ABCMeta, abstractmethod
-from typing import Any, Dict, Tuple, Type
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Type
 
 Path = Tuple[str, ...]
 
@@ -18,3 +18,42 @@ class ConfigurationProvider(metaclass=ABCMeta):
         :param strict:                  whether or not strict mode should be used (see each provider's documentation)
         """
         pass
+
+    def load_section(self, target_type: Type, path: Path, strict=False) -> Dict[str, Any]:
+        """
+        Load the configuration for the section of a given type at a given path (see nectarine.dataclasses
+        .get_section_type), values being named exactly as when loading the whole type
+
+        The default implementation loads the whole configuration and keeps the section; providers able to only read
+        the values of the section override it.
+
+        :param target_type:             the type containing the section
+        :param path:                    the path to the section, e.g. ("database",)
+        :param strict:                  whether or not strict mode should be used (see each provider's documentation)
+        """
+        value = self.load_configuration(target_type, strict=strict)
+        for key in path:
+            value = value.get(key) if isinstance(value, dict) else None
+        return value if isinstance(value, dict) else {}
+
+    def snapshot(self, target_types: List[Type]) -> 'ConfigurationProvider':
+        """
+        Capture the data of the provider once, returning a provider able to load each of the given types from it
+
+        The default implementation returns the provider itself, which is suitable for providers that already hold their
+        data in memory.
+
+        :param target_types:            the types that will be loaded from the snapshot
+        """
+        return self
+
+    def fingerprint(self, target_type: Type) -> Optional[Hashable]:
+        """
+        Identify the data the provider would load for a given type, so that loaded configurations can be cached (see
+        nectarine.caching): equal fingerprints must mean that the same data would be loaded
+
+        The default implementation returns None, meaning that the data cannot be identified without loading it.
+
+        :param target_type:             the type to identify the data of
+        """
+        return None
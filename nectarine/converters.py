@@ -0,0 +1,259 @@
+"""
+Module providing the registry of converters used to build values of custom types from raw configuration values
+
+Converters are looked up by type, following the method resolution order like functools.singledispatch, and lookups
+are cached per type. A class defining a static "parse" method is its own converter.
+
+Converters can be registered for a "module:qualname" reference rather than a type, so that the module is not imported
+for nothing: the reference is only resolved once the module has been imported by someone else, which must be the case
+before any of its types is looked up. Built-in converters are registered this way, keeping "import nectarine" cheap.
+"""
+
+from dataclasses import dataclass
+import re
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+
+from nectarine.errors import NectarineInvalidValueError
+from nectarine.typing import compile_validator
+
+ConvertFunction = Callable[[Type, Any], Any]
+DumpFunction = Callable[[Any], Any]
+
+
+@dataclass(frozen=True)
+class Converter:
+    """
+    Class representing a converter for a type (and its subclasses)
+    """
+
+    convert: ConvertFunction
+    accepts: Tuple[Type, ...] = (str,)
+    dump: DumpFunction = str
+
+
+def _parse(type_: Type, value):
+    return type_.parse(value)
+
+
+_PARSE_CONVERTER = Converter(_parse, accepts=(str,))  # Instances are dumped with str, which "parse" should invert
+
+
+class ConverterRegistry:
+    """
+    Class holding converters by type
+    """
+
+    def __init__(self):
+        self._converters: Dict[Type, Converter] = {}
+        self._lazy: Dict[str, List[Tuple[str, Converter]]] = {}  # Converters by module, then qualified name
+        self._cache: Dict[Type, Optional[Converter]] = {}
+        self._listeners: List[Callable[[], None]] = []
+
+    def register(
+            self,
+            type_: Union[Type, str],
+            convert: ConvertFunction,
+            accepts: Tuple[Type, ...] = (str,),
+            dump: DumpFunction = str,
+    ):
+        """
+        Register a converter for a type and its subclasses
+
+        :param type_:                   the type to register the converter for, or a "module:qualname" reference to
+                                        it, resolved once the module is imported
+        :param convert:                 the conversion function, called with the target type and the raw value
+        :param accepts:                 the types of the raw values the function can convert
+        :param dump:                    the function converting an instance back to a raw value (see
+                                        nectarine.serialization)
+        """
+        converter = Converter(convert, tuple(accepts), dump)
+        if isinstance(type_, str):
+            module_name, _, qualname = type_.partition(':')
+            self._lazy.setdefault(module_name, []).append((qualname, converter))
+        else:
+            self._converters[type_] = converter
+        self._cache.clear()
+        for listener in self._listeners:
+            listener()
+
+    def _resolve_lazy(self):
+        # Types of modules that are not imported yet cannot be looked up, their converters are resolved later
+        for module_name in [name for name in self._lazy if name in sys.modules]:
+            for qualname, converter in self._lazy.pop(module_name):
+                type_ = sys.modules[module_name]
+                for name in qualname.split('.'):
+                    type_ = getattr(type_, name)
+                self._converters.setdefault(type_, converter)  # Converters registered with the type itself win
+
+    def on_change(self, listener: Callable[[], None]):
+        """
+        Register a function to call when a converter is registered, e.g. to clear caches depending on the registry
+
+        :param listener:                the function to call
+        """
+        self._listeners.append(listener)
+
+    def find(self, type_: Type) -> Optional[Converter]:
+        """
+        Retrieve the converter for a type, or None if the type has no converter
+
+        :param type_:                   the type to retrieve the converter for
+        """
+        try:
+            return self._cache[type_]
+        except KeyError:
+            pass
+        except TypeError:  # Unhashable hints cannot have a converter
+            return None
+        if self._lazy:
+            self._resolve_lazy()
+        converter = None
+        for cls in getattr(type_, '__mro__', ()) if isinstance(type_, type) else ():
+            converter = self._converters.get(cls)
+            if converter is None and isinstance(vars(cls).get('parse'), staticmethod):
+                converter = _PARSE_CONVERTER
+            if converter is not None:
+                break
+        self._cache[type_] = converter
+        return converter
+
+    def convert(self, type_: Type, value):
+        """
+        Convert a raw value to an instance of a type, using the type's converter
+
+        :param type_:                   the type to convert the value to
+        :param value:                   the raw value
+        """
+        if isinstance(value, type_):
+            return value
+        converter = self.find(type_)
+        if converter is None or not isinstance(value, converter.accepts):
+            raise NectarineInvalidValueError(type_, value)
+        try:
+            return converter.convert(type_, value)
+        except (ValueError, TypeError, KeyError, ArithmeticError):
+            raise NectarineInvalidValueError(type_, value)
+
+
+converters = ConverterRegistry()
+converters.on_change(compile_validator.cache_clear)
+
+
+def register_converter(
+        type_: Union[Type, str],
+        convert: ConvertFunction,
+        accepts: Tuple[Type, ...] = (str,),
+        dump: DumpFunction = str,
+):
+    """
+    Register a converter for a type and its subclasses, in the default registry
+
+    :param type_:                       the type to register the converter for, or a "module:qualname" reference to it
+    :param convert:                     the conversion function, called with the target type and the raw value
+    :param accepts:                     the types of the raw values the function can convert
+    :param dump:                        the function converting an instance back to a raw value (see
+                                        nectarine.serialization)
+    """
+    converters.register(type_, convert, accepts, dump)
+
+
+def find_converter(type_: Type) -> Optional[Converter]:
+    """
+    Retrieve the converter for a type from the default registry, or None if the type has no converter
+
+    :param type_:                       the type to retrieve the converter for
+    """
+    return converters.find(type_)
+
+
+def convert(type_: Type, value):
+    """
+    Convert a raw value to an instance of a type, using the default registry
+
+    :param type_:                       the type to convert the value to
+    :param value:                       the raw value
+    """
+    return converters.convert(type_, value)
+
+
+def _call(type_: Type, value):
+    return type_(value)
+
+
+def _from_iso_format(type_: Type, value: str):
+    return type_.fromisoformat(value)
+
+
+_TIMEDELTA_PATTERN = r"(?:(?P<days>-?\d+) days?, )?(?P<hours>\d+):(?P<minutes>\d{2}):(?P<seconds>\d{2}(\.\d+)?)"
+
+
+def _to_timedelta(type_: Type, value):
+    """
+    Convert a number of seconds, or a string formatted like str(timedelta), to a timedelta
+    """
+    if isinstance(value, str):
+        match = re.fullmatch(_TIMEDELTA_PATTERN, value.strip())  # Compiled on first use, and cached by re
+        if match is None:
+            value = float(value)
+        else:
+            return type_(
+                days=int(match["days"] or 0),
+                hours=int(match["hours"]),
+                minutes=int(match["minutes"]),
+                seconds=float(match["seconds"]),
+            )
+    return type_(seconds=value)
+
+
+def _to_decimal(type_: Type, value):
+    from decimal import InvalidOperation  # Already imported, since Decimal is
+
+    if isinstance(value, float):
+        value = repr(value)  # Decimal(0.1) would keep the binary approximation of 0.1
+    try:
+        return type_(value)
+    except InvalidOperation:
+        raise ValueError(value)
+
+
+def _to_enum(type_: Type, value):
+    """
+    Convert a value to a member of an enumeration, by name first, then by value
+    """
+    if isinstance(value, str) and value in type_.__members__:
+        return type_[value]
+    try:
+        return type_(value)
+    except ValueError:
+        if not isinstance(value, str):
+            raise
+    for member in type_:  # Values read from text sources are strings, compare them with the members' values as text
+        if str(member.value) == value:
+            return member
+    raise ValueError(value)
+
+
+def _to_iso_format(value) -> str:
+    return value.isoformat()
+
+
+def _total_seconds(value) -> float:
+    return value.total_seconds()
+
+
+def _enum_name(value) -> str:
+    return value.name
+
+
+for _name in ("datetime", "date", "time"):
+    register_converter(f"datetime:{_name}", _from_iso_format, dump=_to_iso_format)
+register_converter("datetime:timedelta", _to_timedelta, accepts=(str, int, float), dump=_total_seconds)
+register_converter("decimal:Decimal", _to_decimal, accepts=(str, int, float))
+for _name in ("IPv4Address", "IPv6Address"):
+    register_converter(f"ipaddress:{_name}", _call, accepts=(str, int))
+for _name in ("IPv4Network", "IPv6Network", "IPv4Interface", "IPv6Interface"):
+    register_converter(f"ipaddress:{_name}", _call)
+register_converter("pathlib:PurePath", _call)
+register_converter("uuid:UUID", _call)
+register_converter("enum:Enum", _to_enum, accepts=(object,), dump=_enum_name)
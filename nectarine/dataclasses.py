@@ -1,9 +1,12 @@
 from dataclasses import dataclass, _FIELD, Field as DataclassField, _FIELD_INITVAR, MISSING
-from typing import Any, Callable, Iterator, Type
+from typing import Any, Callable, List, Optional, Tuple, Type
 
-from nectarine.errors import NectarineMissingValueError, NectarineInvalidValueError
-from nectarine.typing import get_generic_args, hintify, \
-    is_dataclass, is_mapping, is_optional, is_linear_collection, is_union, is_literal, is_conform_to_hint
+from nectarine.converters import convert as convert_custom, converters as converter_registry, find_converter
+from nectarine.deduplication import Deduplicator
+from nectarine.errors import NectarineMissingValueError, NectarineInvalidValueError, NectarineStrictLoadingError
+from nectarine.typing import compile_validator, get_generic_args, get_origin, hintify, \
+    is_columnar, is_dataclass, is_mapping, is_optional, is_linear_collection, is_union, is_literal
+from nectarine._utils import cached_per_hint
 
 
 @dataclass
@@ -32,7 +35,8 @@ class Field:
         )
 
 
-def get_fields(type_: Type) -> Iterator[Field]:
+@cached_per_hint
+def get_fields(type_: Type) -> Tuple[Field, ...]:
     """
     Retrieve the interesting fields of a dataclass, i.e. fields that are needed for an instance to be initialized
 
@@ -40,8 +44,8 @@ def get_fields(type_: Type) -> Iterator[Field]:
     """
     assert is_dataclass(type_)
     fields = getattr(type_, '__dataclass_fields__')
-    return (Field.from_dataclass_field(f) for f in fields.values()
-            if f._field_type in (_FIELD, _FIELD_INITVAR) and f.init is True)
+    return tuple(Field.from_dataclass_field(f) for f in fields.values()
+                 if f._field_type in (_FIELD, _FIELD_INITVAR) and f.init is True)
 
 
 def get_paths(type_: Type, path=()):
@@ -58,6 +62,23 @@ def get_paths(type_: Type, path=()):
         yield (*path, field.name), field
 
 
+def get_section_type(type_: Type, path: Tuple[str, ...]) -> Type:
+    """
+    Retrieve the type of the section of a dataclass at a given path, which must lead to a nested dataclass
+
+    :param type_:                       the dataclass type containing the section
+    :param path:                        the path to the section, e.g. ("database",)
+    """
+    for i, name in enumerate(path):
+        field = next((f for f in get_fields(type_) if f.name == name), None)
+        if field is None:
+            raise NectarineStrictLoadingError(offending_keys=[path[:i + 1]])
+        if not is_dataclass(field.type):
+            raise TypeError(f"'{'.'.join(path[:i + 1])}' is not a section of '{type_.__name__}'")
+        type_ = field.type
+    return type_
+
+
 def get_default_value(field: Field):
     """
     Retrieve the default value of a field if any, or MISSING
@@ -73,38 +94,119 @@ def get_default_value(field: Field):
     return MISSING
 
 
-def dataclass_from_dict(target_type: Type, value):
-    if is_dataclass(target_type) and not is_dataclass(value):  # XXX: 2nd call is kind-of a misuse: value is not a type
+Converter = Callable[[Any, Optional[Deduplicator]], Any]
+
+
+def dataclass_from_dict(target_type: Type, value, deduplicator: Deduplicator = None):
+    """
+    Convert a value (usually a dictionary obtained from providers) to an instance of the target type
+
+    :param target_type:                 the type to convert the value to
+    :param value:                       the value to convert
+    :param deduplicator:                the deduplicator to share repeated values with (or None to disable sharing)
+    """
+    return compile_converter(target_type)(value, deduplicator)
+
+
+@cached_per_hint
+def compile_converter(target_type: Type) -> Converter:
+    """
+    Retrieve a function converting values to instances of the target type (see dataclass_from_dict)
+
+    The type is only interpreted once: the resulting function is cached, and so are the ones it is built from.
+
+    :param target_type:                 the type to convert values to
+    """
+    convert = _compile_converter(target_type)
+
+    def convert_and_deduplicate(value, deduplicator: Optional[Deduplicator]):
+        result = convert(value, deduplicator)
+        if deduplicator is not None:
+            result = deduplicator.deduplicate(result)
+        return result
+
+    return convert_and_deduplicate
+
+
+converter_registry.on_change(compile_converter.cache_clear)
+
+
+def _compile_converter(target_type: Type) -> Converter:
+    if is_dataclass(target_type):
+        return _compile_dataclass_converter(target_type)
+    if is_columnar(target_type):
+        from nectarine.columnar import Columnar  # Imported here since the columnar module depends on this one
+        row_type = get_generic_args(target_type)[0]
+        return lambda value, deduplicator: \
+            value if isinstance(value, Columnar) else Columnar.from_rows(row_type, value, deduplicator)
+    if is_linear_collection(target_type):
+        convert_item = compile_converter(get_generic_args(target_type)[0])
+        return lambda value, deduplicator: type(value)(convert_item(x, deduplicator) for x in value)
+    if is_mapping(target_type):
+        key_type, value_type = get_generic_args(target_type)
+        convert_key = compile_converter(key_type)
+        convert_value = compile_converter(value_type)
+        return lambda value, deduplicator: type(value)(
+            (convert_key(k, deduplicator), convert_value(v, deduplicator)) for k, v in value.items()
+        )
+    if is_union(target_type):
+        members = tuple((compile_converter(t), _compile_result_check(t)) for t in get_generic_args(target_type))
+
+        def convert_union(value, deduplicator: Optional[Deduplicator]):
+            for convert, check in members:
+                try:
+                    result = convert(value, deduplicator)
+                except (NectarineMissingValueError, Exception):
+                    continue
+                if check(result):  # Members without conversion return the value as-is, whatever it is
+                    return result
+            raise NectarineInvalidValueError(target_type, value)
+
+        return convert_union
+    if is_literal(target_type):
+        check = compile_validator(target_type)
+
+        def convert_literal(value, _: Optional[Deduplicator]):
+            if not check(value):
+                raise NectarineInvalidValueError(target_type, value)
+            return value
+
+        return convert_literal
+    if find_converter(target_type) is not None:
+        return lambda value, _: convert_custom(target_type, value)
+    return lambda value, _: value
+
+
+def _compile_result_check(target_type: Type) -> Callable[[Any], bool]:
+    # Checks that a value was converted to the target type: raw values accepted by validators are not enough
+    if is_dataclass(target_type) or find_converter(target_type) is not None:
+        return lambda value: isinstance(value, target_type)
+    if is_columnar(target_type):
+        origin = get_origin(target_type)
+        return lambda value: isinstance(value, origin)
+    return compile_validator(target_type)
+
+
+def _compile_dataclass_converter(target_type: Type) -> Converter:
+    # Fields are only inspected on first use, so that recursive dataclasses do not lead to an infinite recursion
+    fields: Optional[List[Tuple[Field, Converter]]] = None
+
+    def convert_dataclass(value, deduplicator: Optional[Deduplicator]):
+        nonlocal fields
+        if is_dataclass(value):  # XXX: kind-of a misuse: value is not a type
+            return value
         if isinstance(value, str):
             return target_type.parse(value)
-        fields = get_fields(target_type)
+        if fields is None:
+            fields = [(field, compile_converter(field.type)) for field in get_fields(target_type)]
         kwargs = {}
-        for field in fields:
+        for field, convert_field in fields:
             field_value = value.get(field.name, MISSING)
             if field_value is MISSING:
                 field_value = get_default_value(field)
                 if field_value is MISSING:
                     raise NectarineMissingValueError(field.name)
-            field_value = dataclass_from_dict(field.type, field_value)
-            kwargs[field.name] = field_value
+            kwargs[field.name] = convert_field(field_value, deduplicator)
         return target_type(**kwargs)
-    if is_linear_collection(target_type):
-        origin = type(value)
-        value_type = get_generic_args(target_type)[0]
-        return origin(map(lambda x: dataclass_from_dict(value_type, x), value))
-    if is_mapping(target_type):
-        origin = type(value)
-        key_type, value_type = get_generic_args(target_type)
-        return origin((dataclass_from_dict(key_type, k), dataclass_from_dict(value_type, v)) for k, v in value.items())
-    if is_union(target_type):
-        types = get_generic_args(target_type)
-        for t in types:
-            try:
-                return dataclass_from_dict(t, value)
-            except (NectarineMissingValueError, Exception):
-                pass
-        raise NectarineInvalidValueError(target_type, value)
-    if is_literal(target_type):
-        if not is_conform_to_hint(value, target_type):
-            raise NectarineInvalidValueError(target_type, value)
-    return value
+
+    return convert_dataclass
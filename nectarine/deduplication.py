@@ -0,0 +1,69 @@
+"""
+Module providing a deduplication table used to share equal immutable values while loading a configuration
+"""
+
+import sys
+from dataclasses import fields
+from typing import Any, Dict
+
+from nectarine.typing import is_dataclass
+
+
+def _is_frozen_dataclass(value) -> bool:
+    return is_dataclass(type(value)) and type(value).__dataclass_params__.frozen
+
+
+def _key_of(value):
+    """
+    Compute a key identifying a value by both its type and its content
+
+    Using the value alone as a key is not enough, since 1, 1.0 and True are equal (and hash equally) while being
+    distinct values for the configuration.
+    """
+    type_ = type(value)
+    if type_ is tuple:
+        return type_, tuple(_key_of(v) for v in value)
+    if type_ is frozenset:
+        return type_, frozenset(_key_of(v) for v in value)
+    if _is_frozen_dataclass(value):
+        return type_, tuple(_key_of(getattr(value, f.name)) for f in fields(value))
+    return type_, value
+
+
+class Deduplicator:
+    """
+    Table used to deduplicate the values of a configuration while it is being converted
+
+    Strings are interned, and equal immutable values (tuples, frozensets, frozen dataclasses) are shared, so that
+    repeated values are only kept once in memory. A deduplicator is meant to be used for a single load, after which
+    saved_bytes tells how much memory was spared.
+    """
+
+    def __init__(self):
+        self.table: Dict[Any, Any] = {}
+        self.saved_bytes = 0
+        self.shared_values = 0
+
+    def deduplicate(self, value):
+        """
+        Retrieve a shared instance equal to the given value, registering the value if it is the first of its kind
+
+        :param value:                   the value to deduplicate
+        """
+        type_ = type(value)
+        if type_ is str:
+            return self._lookup((str, value), value)
+        if type_ is tuple or type_ is frozenset or _is_frozen_dataclass(value):
+            try:
+                key = _key_of(value)
+                return self._lookup(key, value)
+            except TypeError:  # The value contains something unhashable, it cannot be shared
+                return value
+        return value
+
+    def _lookup(self, key, value):
+        shared = self.table.setdefault(key, value)
+        if shared is not value:
+            self.saved_bytes += sys.getsizeof(value)
+            self.shared_values += 1
+        return shared
@@ -0,0 +1,82 @@
+"""
+Module providing a way to derive a configuration from another one by overriding a few values
+
+The derived configuration shares every sub-object that is not on the path to an override with the base configuration,
+so the cost of deriving depends on the number of overrides rather than on the size of the configuration. Like for reloads,
+configurations must then be treated as read-only.
+"""
+
+from dataclasses import MISSING
+from typing import Any, Dict, Mapping, Type, Union
+
+from nectarine.configuration_provider import Path
+from nectarine.errors import NectarineMissingValueError
+from nectarine._modifying import check_value, child_type, copy_instance
+
+
+class _Override:
+    """
+    Node of the tree of overrides: the value replacing the one at this path (if any), then the overrides below it
+    """
+
+    __slots__ = ('value', 'children')
+
+    def __init__(self):
+        self.value = MISSING
+        self.children: Dict[Any, '_Override'] = {}
+
+
+def _build_tree(type_: Type, overrides: Mapping[Union[Path, str], Any]) -> _Override:
+    root = _Override()
+    for path, value in overrides.items():
+        path = (path,) if isinstance(path, str) else tuple(path)
+        hint = type_
+        node = root
+        for i, key in enumerate(path):
+            hint = child_type(hint, key, path[:i + 1])
+            child = node.children.get(key)
+            if child is None:
+                child = node.children[key] = _Override()
+            node = child
+        node.value = check_value(hint, value)
+    return root
+
+
+def _apply(value, node: _Override, key=None):
+    if node.value is not MISSING:
+        value = node.value
+    if not node.children:
+        return value
+    if value is None:  # Values below a missing value cannot be overridden, it must be overridden as a whole
+        raise NectarineMissingValueError(key)
+    if isinstance(value, dict):
+        result = dict(value)
+        for k, child in node.children.items():
+            result[k] = _apply(value.get(k), child, k)
+        return result
+    if isinstance(value, (list, tuple)):
+        result = list(value)
+        for index, child in node.children.items():
+            if not -len(result) <= index < len(result):
+                raise NectarineMissingValueError(index)
+            result[index] = _apply(result[index], child, index)
+        return result if isinstance(value, list) else tuple(result)
+    result = copy_instance(value)
+    for name, child in node.children.items():  # object.__setattr__ also works for frozen dataclasses
+        object.__setattr__(result, name, _apply(getattr(value, name), child, name))
+    return result
+
+
+def derive(config, overrides: Mapping[Union[Path, str], Any]):
+    """
+    Create a copy of a configuration with some values overridden, sharing every other value with the original
+
+    Only the overrides are validated, against the types of their fields. Paths go through dataclass fields, dictionary
+    keys and list indexes; a value overridden along with values below it is replaced first.
+
+    :param config:                      the base configuration
+    :param overrides:                   the new values, by path (a tuple of keys, or a single field name)
+    """
+    if not overrides:
+        return config
+    return _apply(config, _build_tree(type(config), overrides))
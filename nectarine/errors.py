@@ -49,3 +49,49 @@ class NectarineMissingValueError(NectarineError):
 
     def __str__(self):
         return f"missing value for key '{self.missing_key}'"
+
+
+class NectarineSchemaMismatchError(NectarineError):
+    """
+    Exception class representing an error related to data that was produced for a different schema
+    """
+
+    def __init__(self, expected_type: Type):
+        self.expected_type = expected_type
+
+    def __str__(self):
+        return f"data does not match the schema of type '{self.expected_type}'"
+
+
+class NectarinePatchError(NectarineError):
+    """
+    Exception class representing an error related to a patch operation that cannot be applied
+    """
+
+    def __init__(self, path: Path, reason: str):
+        self.path = path
+        self.reason = reason
+
+    def __str__(self):
+        return f"""cannot patch '{".".join(str(key) for key in self.path)}': {self.reason}"""
+
+
+class NectarineLateRegistrationError(NectarineError):
+    """
+    Exception class representing an error related to a target type registered in a session after it started loading
+    """
+
+    def __init__(self, target_type: Type):
+        self.target_type = target_type
+
+    def __str__(self):
+        return f"cannot register '{self.target_type.__name__}' after the session started loading"
+
+
+class NectarineMissingProvenanceError(NectarineError):
+    """
+    Exception class representing an error related to a configuration whose provenance was not recorded
+    """
+
+    def __str__(self):
+        return "no provenance was recorded for this configuration, load it with provenance=True"
@@ -2,21 +2,16 @@
 Module providing a ConfigurationProvider backed by a YAML file
 """
 
+from typing import IO, Any, Dict
+
 import yaml as _yaml
 
-from nectarine.providers.dictionary import Dictionary
+from nectarine.providers.file import File
 
 
-class Yaml(Dictionary):
-    def __init__(self, file: str, must_exist: bool = True):
-        try:
-            with open(file, 'r') as f:
-                value = _yaml.safe_load(f)
-        except FileNotFoundError:
-            if must_exist:
-                raise
-            value = {}
-        super().__init__(value)
+class Yaml(File):
+    def parse(self, f: IO) -> Dict[str, Any]:
+        return _yaml.safe_load(f)
 
 
 def yaml(file: str, must_exist: bool = True):
@@ -0,0 +1,126 @@
+"""
+Module providing a field type referencing a file, whose content is only read when it is used
+
+Providers resolve a FileRef field from a path, checking that the file exists without reading it, so that large payloads
+(certificates, templates, models, ...) cost nothing until they are accessed. The content is then cached, and read again
+if the file changes.
+"""
+
+import mmap as _mmap
+import os
+import threading
+from typing import IO, Any, Dict, Optional, Tuple, Union
+
+
+def _stat_key(path: str) -> Tuple[int, int, int]:
+    stat = os.stat(path)
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+class FileRef(os.PathLike):
+    """
+    Reference to a file, to be used as the type of a field, e.g. "certificate: FileRef"
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+        self.stat_key = _stat_key(self.path)  # Also checks that the file exists
+        self._lock = threading.Lock()
+        self._cache_key: Optional[Tuple[int, int, int]] = None
+        self._content: Optional[bytes] = None
+        self._mapping: Optional[_mmap.mmap] = None
+
+    @staticmethod
+    def parse(value: str) -> 'FileRef':
+        try:
+            return FileRef(value)
+        except OSError as e:  # Reported as an invalid value by the converter registry
+            raise ValueError(f"cannot reference '{value}': {e.strerror}") from e
+
+    @property
+    def size(self) -> int:
+        """
+        The size of the file when it was last checked, in bytes
+        """
+        return self.stat_key[2]
+
+    def _check(self):
+        # Must be called with the lock held: drops the cached content if the file changed since it was read
+        stat_key = _stat_key(self.path)
+        if stat_key != self._cache_key:
+            self._content = None
+            self._mapping = None  # Not closed, since it may still be in use
+            self._cache_key = stat_key
+        self.stat_key = stat_key
+
+    def read_bytes(self) -> bytes:
+        """
+        Retrieve the content of the file, read on first access and whenever the file changed
+        """
+        with self._lock:
+            self._check()
+            if self._content is None:
+                with open(self.path, 'rb') as f:
+                    self._content = f.read()
+            return self._content
+
+    def read_text(self, encoding: str = 'utf-8') -> str:
+        """
+        Retrieve the content of the file as text
+
+        :param encoding:                the encoding of the file
+        """
+        return self.read_bytes().decode(encoding)
+
+    def mmap(self) -> Union[_mmap.mmap, memoryview]:
+        """
+        Retrieve a read-only memory mapping of the file, created on first access and whenever the file changed (empty
+        files cannot be mapped, an empty memoryview is returned for them instead)
+        """
+        with self._lock:
+            self._check()
+            if self._mapping is None:
+                if self.size == 0:
+                    self._mapping = memoryview(b'')
+                else:
+                    with open(self.path, 'rb') as f:
+                        self._mapping = _mmap.mmap(f.fileno(), 0, access=_mmap.ACCESS_READ)
+            return self._mapping
+
+    def open(self, mode: str = 'rb', **kwargs) -> IO[Any]:
+        """
+        Open the file (see the open builtin function)
+
+        :param mode:                    the mode to open the file in
+        """
+        return open(self.path, mode, **kwargs)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Copies (e.g. by copy.deepcopy or dataclasses.asdict) and pickles only keep the reference, since neither the
+        # lock nor the memory mapping can be copied: the content is read again when the copy is used
+        return {"path": self.path, "stat_key": self.stat_key}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.path = state["path"]
+        self.stat_key = state["stat_key"]
+        self._lock = threading.Lock()
+        self._cache_key = None
+        self._content = None
+        self._mapping = None
+
+    def __fspath__(self) -> str:
+        return self.path
+
+    def __str__(self):
+        return self.path
+
+    def __repr__(self):
+        return f"FileRef({self.path!r})"
+
+    def __eq__(self, other):
+        if not isinstance(other, FileRef):
+            return NotImplemented
+        return self.path == other.path
+
+    def __hash__(self):
+        return hash(self.path)
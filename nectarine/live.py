@@ -0,0 +1,139 @@
+"""
+Module providing a handle on a configuration that is reloaded while the program runs
+"""
+
+from dataclasses import dataclass
+import threading
+from typing import Any, Callable, List, Optional, Tuple, Type
+
+from nectarine import load
+from nectarine.configuration_provider import ConfigurationProvider, Path
+from nectarine.merging import MergeStrategies
+from nectarine.reloading import ReloadResult, reload
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """
+    Class representing a version of a configuration
+
+    A snapshot is never modified: holding on to one gives a consistent view of the configuration, whatever reloads
+    happen in the meantime. Configurations themselves must be treated as read-only, since unchanged parts are shared
+    between successive snapshots.
+    """
+
+    version: int
+    config: Any
+
+
+Subscriber = Callable[[Snapshot, ReloadResult], None]
+
+
+class LiveConfig:
+    """
+    Handle on a configuration that can be reloaded, atomically replacing the whole configuration at once
+
+    Reading the current snapshot does not take any lock: reloads build a complete new configuration, then publish it
+    with a single assignment. A failed reload keeps the last good snapshot, and records the error in last_error.
+    """
+
+    def __init__(
+            self,
+            target: Type,
+            providers: List[ConfigurationProvider],
+            strict: bool = False,
+            merge: MergeStrategies = None,
+    ):
+        self.target = target
+        self.providers = providers
+        self.strict = strict
+        self.merge = merge
+        self.last_error: Optional[Exception] = None
+        self._snapshot = Snapshot(version=1, config=load(target, providers, strict=strict, merge=merge))
+        self._subscribers: List[Tuple[Path, Subscriber]] = []
+        self._reload_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def snapshot(self) -> Snapshot:
+        """
+        Retrieve the current snapshot, which stays consistent for as long as it is used
+        """
+        return self._snapshot
+
+    @property
+    def config(self):
+        """
+        The current configuration (use snapshot() to keep a consistent view across several reads)
+        """
+        return self._snapshot.config
+
+    @property
+    def version(self) -> int:
+        """
+        The version of the current configuration, incremented each time a reload changes it
+        """
+        return self._snapshot.version
+
+    def subscribe(self, callback: Subscriber, path: Path = ()):
+        """
+        Register a function to call after a reload changed the value at a given path
+
+        :param callback:                the function to call, with the new snapshot and the result of the reload
+        :param path:                    the path to watch (default is the whole configuration)
+        """
+        with self._reload_lock:
+            self._subscribers = [*self._subscribers, (tuple(path), callback)]
+
+    def reload(self) -> bool:
+        """
+        Load the configuration again, publishing a new snapshot if it changed
+
+        Returns whether a new snapshot was published. Errors raised while loading are recorded in last_error rather
+        than raised, and the current snapshot is kept.
+        """
+        with self._reload_lock:
+            current = self._snapshot
+            try:
+                result = reload(current.config, self.providers, strict=self.strict, merge=self.merge)
+            except Exception as e:
+                self.last_error = e
+                return False
+            self.last_error = None
+            if not result.changes:
+                return False
+            snapshot = Snapshot(version=current.version + 1, config=result.config)
+            self._snapshot = snapshot
+            subscribers = self._subscribers
+        for path, callback in subscribers:
+            if result.has_changed(path):
+                callback(snapshot, result)
+        return True
+
+    def start(self, interval: float):
+        """
+        Start reloading the configuration periodically, in a background thread
+
+        :param interval:                the time between two reloads, in seconds
+        """
+        if self._thread is not None:
+            raise RuntimeError("the configuration is already being reloaded in the background")
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(interval,), name="nectarine-reload", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop reloading the configuration in the background, waiting for the current reload to finish
+        """
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def _run(self, interval: float):
+        while not self._stop.wait(interval):
+            try:
+                self.reload()
+            except Exception as e:  # Raised by a subscriber, the thread must keep running
+                self.last_error = e
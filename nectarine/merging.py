@@ -0,0 +1,173 @@
+"""
+Module providing the strategies used to merge the values obtained from several providers
+
+Values are merged all at once rather than pairwise: a strategy receives every value found for a path, from the lowest
+to the highest priority provider, which keeps merges linear in the total size of the values. The values themselves are
+never modified, so that providers can safely cache and reuse what they return.
+"""
+
+from itertools import chain
+from typing import Any, Callable, Dict, List, Type, Union
+
+from nectarine.configuration_provider import Path
+
+Merger = Callable[[Path, List[Any]], Any]
+MergeStrategy = Callable[[Path, List[Any], Merger], Any]
+MergeStrategies = Union[MergeStrategy, Dict[Union[Path, Type], MergeStrategy]]
+
+
+def _trailing_run(values: List[Any], types) -> List[Any]:
+    """
+    Retrieve the values following the last value that is not of the given types: a value of another kind (e.g. None)
+    replaces the values of lower priority, which must then not be merged
+    """
+    start = len(values)
+    while start > 0 and isinstance(values[start - 1], types):
+        start -= 1
+    return values[start:]
+
+
+def replace(path: Path, values: List[Any], merge: Merger):
+    """
+    Strategy keeping the value of the highest priority provider
+    """
+    return values[-1]
+
+
+def append(path: Path, values: List[Any], merge: Merger):
+    """
+    Strategy concatenating lists, from the lowest to the highest priority provider (other values are replaced)
+    """
+    lists = _trailing_run(values, list)
+    if lists:
+        return list(chain.from_iterable(lists))
+    return values[-1]
+
+
+def union(path: Path, values: List[Any], merge: Merger):
+    """
+    Strategy concatenating lists while dropping duplicated items, and joining sets (other values are replaced)
+    """
+    lists = _trailing_run(values, list)
+    if lists:
+        items = chain.from_iterable(lists)
+        try:
+            return list(dict.fromkeys(items))
+        except TypeError:  # Some items are not hashable, fall back to comparing them one by one
+            result = []
+            for item in chain.from_iterable(lists):
+                if item not in result:
+                    result.append(item)
+            return result
+    sets = _trailing_run(values, (set, frozenset))
+    if sets:
+        return type(sets[-1]).union(*sets)
+    return values[-1]
+
+
+def deep(strategy: MergeStrategy) -> MergeStrategy:
+    """
+    Create a strategy merging dictionaries key by key, and using another strategy for other values
+
+    :param strategy:                    the strategy to use for values that are not all dictionaries
+    """
+
+    def merge_deep(path: Path, values: List[Any], merge: Merger):
+        if len(values) == 1:
+            return values[0]
+        dicts = _trailing_run(values, dict)
+        if len(dicts) == 1:
+            return dicts[0]
+        if dicts:
+            values_by_key: Dict[Any, List[Any]] = {}
+            for value in dicts:
+                for key, item in value.items():
+                    values_by_key.setdefault(key, []).append(item)
+            return {key: merge((*path, key), items) for key, items in values_by_key.items()}
+        return strategy(path, values, merge)
+
+    return merge_deep
+
+
+# Default strategy, merging dictionaries key by key, concatenating lists and replacing other values
+merge_deep = deep(append)
+
+
+def keyed(key: str) -> MergeStrategy:
+    """
+    Create a strategy merging lists of dictionaries by identifier: items sharing the same value for the given key are
+    merged together (see merge_deep), other items are concatenated
+
+    :param key:                         the key holding the identifier of each item
+    """
+
+    def merge_keyed(path: Path, values: List[Any], merge: Merger):
+        lists = _trailing_run(values, list)
+        if not lists:
+            return values[-1]
+        result = []
+        groups: Dict[Any, List[Any]] = {}
+        for item in chain.from_iterable(lists):
+            if isinstance(item, dict) and key in item:
+                group = groups.get(item[key])
+                if group is None:
+                    group = groups[item[key]] = []
+                    result.append(group)
+                group.append(item)
+            else:
+                result.append([item])
+        return [merge_deep(path, group, merge) for group in result]
+
+    return merge_keyed
+
+
+class PathMerger:
+    """
+    Class merging values using the strategies configured for each path or each type
+    """
+
+    def __init__(
+            self,
+            default: MergeStrategy = merge_deep,
+            by_path: Dict[Path, MergeStrategy] = None,
+            by_type: Dict[Type, MergeStrategy] = None,
+            types: Dict[Path, Type] = None,
+    ):
+        self.default = default
+        self.by_path = by_path or {}
+        self.by_type = by_type or {}
+        self.types = types or {}
+
+    def strategy_for(self, path: Path) -> MergeStrategy:
+        strategy = self.by_path.get(path)
+        if strategy is None and self.by_type and path in self.types:
+            strategy = self.by_type.get(self.types[path])
+        return strategy or self.default
+
+    def merge(self, path: Path, values: List[Any]):
+        """
+        Merge the values found for a given path, from the lowest to the highest priority provider
+
+        :param path:                    the path of the values
+        :param values:                  the values to merge
+        """
+        return self.strategy_for(path)(path, values, self.merge)
+
+
+def make_merger(strategies: MergeStrategies = None, types: Dict[Path, Type] = None) -> PathMerger:
+    """
+    Create a merger from a strategy, or a dictionary mapping paths (tuples) or types to strategies
+
+    A single strategy is used for every value that is not a dictionary, dictionaries still being merged key by key.
+    Strategies given by path or by type are used as-is, which allows replacing a whole dictionary.
+
+    :param strategies:                  the strategies to use (or None to use merge_deep everywhere)
+    :param types:                       the types of the values, by path (only needed for strategies given by type)
+    """
+    if strategies is None:
+        return PathMerger()
+    if callable(strategies):
+        return PathMerger(default=deep(strategies))
+    by_path = {k: v for k, v in strategies.items() if isinstance(k, tuple)}
+    by_type = {k: v for k, v in strategies.items() if not isinstance(k, tuple)}
+    return PathMerger(by_path=by_path, by_type=by_type, types=types)
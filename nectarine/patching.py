@@ -0,0 +1,244 @@
+"""
+Module providing a way to apply JSON Merge Patches (RFC 7396) and JSON Patches (RFC 6902) to a configuration
+
+Like with derive, only the patched values are validated and converted, against the types of their fields, and the
+patched configuration shares every sub-object that is not on the path to a patched value with the original one: the
+cost of a patch depends on its size rather than on the size of the configuration. Configurations must then be treated as
+read-only.
+"""
+
+from dataclasses import MISSING
+import json as _json
+from typing import Any, Dict, List, Mapping, Type, Union
+
+from nectarine.configuration_provider import Path
+from nectarine.dataclasses import get_default_value, get_fields
+from nectarine.errors import NectarineMissingValueError, NectarinePatchError
+from nectarine.typing import get_generic_args, is_dataclass, is_linear_collection, is_mapping, is_optional, is_tuple
+from nectarine._modifying import check_value, child_type, copy_instance
+from nectarine._utils import try_convert
+
+Patch = Union[Mapping[str, Any], List[Mapping[str, Any]], str, bytes]
+
+
+def _unwrap(hint: Type) -> Type:
+    return get_generic_args(hint)[0] if is_optional(hint) else hint
+
+
+def _parse_pointer(hint: Type, pointer: str) -> Path:
+    """
+    Convert a JSON pointer (e.g. "/limits/a/0") to a path, using the schema to tell list indexes from keys
+    """
+    if pointer == "":
+        return ()
+    if not pointer.startswith('/'):
+        raise NectarinePatchError((pointer,), "JSON pointers must start with '/'")
+    path = ()
+    for token in pointer[1:].split('/'):
+        token = token.replace('~1', '/').replace('~0', '~')
+        hint = _unwrap(hint)
+        key: Any = token
+        if is_linear_collection(hint) and token == '-':  # End of a list, only valid as the last token
+            path = (*path, key)
+            continue
+        if is_linear_collection(hint) or is_tuple(hint):
+            if not token.isdigit():
+                raise NectarinePatchError((*path, token), "expected a list index")
+            key = int(token)
+        elif is_mapping(hint) and get_generic_args(hint)[0] is not str:
+            key = try_convert(token, get_generic_args(hint)[0])
+        path = (*path, key)
+        hint = child_type(hint, key, path)
+    return path
+
+
+def _strip_nulls(value):
+    # Objects of a merge patch that replace a value are merged into an empty object, which removes their null members
+    if isinstance(value, dict):
+        return {k: _strip_nulls(v) for k, v in value.items() if v is not None}
+    return value
+
+
+class _Patcher:
+    """
+    Copy of a configuration being patched: containers on the paths to patched values are copied once, and the copies
+    are then modified in place by later operations
+    """
+
+    def __init__(self, config):
+        self.root = config
+        self._owned: Dict[int, Any] = {}
+
+    def _own(self, value):
+        if id(value) in self._owned or isinstance(value, tuple):  # Tuples are rebuilt on each change
+            return value
+        if isinstance(value, dict):
+            value = dict(value)
+        elif isinstance(value, list):
+            value = list(value)
+        else:
+            value = copy_instance(value)
+        self._owned[id(value)] = value  # Also keeps the copy alive, so that its id is not reused
+        return value
+
+    @staticmethod
+    def _get(value, key, path: Path):
+        try:
+            if isinstance(value, (dict, list, tuple)):
+                if isinstance(value, (list, tuple)) and not isinstance(key, int):
+                    raise KeyError(key)
+                return value[key]
+            if value is None:
+                raise KeyError(key)
+            return getattr(value, key)
+        except (KeyError, IndexError):
+            raise NectarineMissingValueError(".".join(str(k) for k in path)) from None
+
+    @staticmethod
+    def _put(container, key, value):
+        if isinstance(container, tuple):
+            return (*container[:key], value, *container[key + 1:])
+        if isinstance(container, (dict, list)):
+            container[key] = value
+        else:
+            object.__setattr__(container, key, value)  # Also works for frozen dataclasses
+        return container
+
+    def update(self, path: Path, change):
+        """
+        Replace the container of the value at a given path by the result of change(container, hint, key), copying its
+        ancestors
+        """
+        def update(value, hint: Type, depth: int):
+            key = path[depth]
+            if depth == len(path) - 1:
+                if key != '-':
+                    child_type(hint, key, path)  # Rejects keys that are not in the schema
+                if value is None:
+                    raise NectarineMissingValueError(".".join(str(k) for k in path[:depth]) or key)
+                return change(self._own(value), _unwrap(hint), key)
+            child_hint = child_type(hint, key, path[:depth + 1])
+            child = update(self._get(value, key, path[:depth + 1]), child_hint, depth + 1)
+            return self._put(self._own(value), key, child)
+
+        if not path:
+            raise NectarinePatchError(path, "the configuration itself cannot be replaced")
+        self.root = update(self.root, type(self.root), 0)
+
+    def get(self, path: Path):
+        value = self.root
+        for depth, key in enumerate(path):
+            value = self._get(value, key, path[:depth + 1])
+        return value
+
+    def set(self, path: Path, value, add: bool = False):
+        def change(container, hint: Type, key):
+            if isinstance(container, (list, tuple)):
+                if add and isinstance(container, list):  # Insert, rather than replace
+                    index = len(container) if key == '-' else key
+                    if index > len(container):
+                        raise NectarineMissingValueError(".".join(str(k) for k in path))
+                    container.insert(index, check_value(get_generic_args(hint)[0], value))
+                    return container
+                self._get(container, key, path)
+            elif isinstance(container, dict):
+                if not add:
+                    self._get(container, key, path)
+            return self._put(container, key, check_value(child_type(hint, key, path), value))
+
+        self.update(path, change)
+
+    def remove(self, path: Path):
+        def change(container, hint: Type, key):
+            self._get(container, key, path)
+            if isinstance(container, (dict, list)):
+                del container[key]
+                return container
+            if isinstance(container, tuple):
+                raise NectarinePatchError(path, "values cannot be removed from fixed-length tuples")
+            field = next(f for f in get_fields(hint) if f.name == key)
+            default = get_default_value(field)
+            if default is MISSING:
+                raise NectarinePatchError(path, "the field has no default value")
+            return self._put(container, key, default)
+
+        self.update(path, change)
+
+    def merge(self, patch: Mapping[str, Any]):
+        def merge(value, hint: Type, patch: Mapping[str, Any], path: Path):
+            container = self._own(value)
+            hint = _unwrap(hint)
+            for key, v in patch.items():
+                child_path = (*path, key)
+                child_hint = child_type(hint, key, child_path)
+                if v is None:
+                    if isinstance(container, dict):
+                        container.pop(key, None)
+                    else:
+                        field = next(f for f in get_fields(hint) if f.name == key)
+                        default = get_default_value(field)
+                        if default is MISSING:
+                            raise NectarinePatchError(child_path, "the field has no default value")
+                        container = self._put(container, key, default)
+                    continue
+                current = container.get(key) if isinstance(container, dict) else getattr(container, key)
+                target = _unwrap(child_hint)
+                if isinstance(v, dict) and current is not None and (is_dataclass(target) or is_mapping(target)):
+                    container = self._put(container, key, merge(current, child_hint, v, child_path))
+                else:
+                    container = self._put(container, key, check_value(child_hint, _strip_nulls(v)))
+            return container
+
+        self.root = merge(self.root, type(self.root), patch, ())
+
+
+def apply_patch(config, patch: Patch):
+    """
+    Create a copy of a configuration with a patch applied, sharing every other value with the original
+
+    A dictionary is applied as a JSON Merge Patch, and a list of operations as a JSON Patch ("add", "remove",
+    "replace", "test", "move" and "copy" operations, whose paths are JSON pointers or tuples of keys). Patched values
+    are validated and converted like values obtained from the dictionary provider. Removing a field of a dataclass
+    resets it to its default value. The original configuration is left untouched if the patch fails.
+
+    :param config:                      the configuration to patch
+    :param patch:                       the patch, or its JSON text
+    """
+    if isinstance(patch, (str, bytes)):
+        patch = _json.loads(patch)
+    if not patch:
+        return config
+    patcher = _Patcher(config)
+    if isinstance(patch, Mapping):
+        patcher.merge(patch)
+        return patcher.root
+
+    target_type = type(config)
+    for operation in patch:
+        op = operation.get("op")
+        path = operation.get("path")
+        path = _parse_pointer(target_type, path) if isinstance(path, str) else tuple(path)
+        if op in ("add", "replace", "test") and "value" not in operation:
+            raise NectarinePatchError(path, f"missing value for the '{op}' operation")
+        if op == "add":
+            patcher.set(path, operation["value"], add=True)
+        elif op == "replace":
+            patcher.set(path, operation["value"])
+        elif op == "remove":
+            patcher.remove(path)
+        elif op == "test":
+            hint = target_type
+            for depth, key in enumerate(path):
+                hint = child_type(hint, key, path[:depth + 1])
+            if patcher.get(path) != check_value(hint, operation["value"]):
+                raise NectarinePatchError(path, "the value differs from the tested one")
+        elif op in ("move", "copy"):
+            source = operation.get("from")
+            source = _parse_pointer(target_type, source) if isinstance(source, str) else tuple(source)
+            value = patcher.get(source)
+            if op == "move":
+                patcher.remove(source)
+            patcher.set(path, value, add=True)
+        else:
+            raise NectarinePatchError(path, f"unsupported operation '{op}'")
+    return patcher.root
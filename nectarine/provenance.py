@@ -0,0 +1,211 @@
+"""
+Module recording which provider supplied each value of a configuration
+
+Provenance mirrors the merged values as nested dictionaries whose leaves are provider indexes (small integers, which
+Python shares rather than allocating them). Flat dictionaries supplied by a single provider are recorded as the index
+of the provider and the set of their keys, shared by all the dictionaries having the same keys: recording a list of
+records with the same fields costs almost nothing. Values defined by several providers, and merged or replaced
+according to the merge strategies, record all of them.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import partial
+import threading
+from typing import Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Tuple, Union
+import weakref
+
+from nectarine.configuration_provider import ConfigurationProvider, Path
+from nectarine.errors import NectarineMissingProvenanceError
+
+
+class _Uniform(NamedTuple):
+    """
+    Node of a flat dictionary whose values were all supplied by the same provider
+    """
+
+    index: int
+    keys: FrozenSet
+
+
+# A node is either the index of the provider that supplied a whole value, the indexes of the providers that supplied
+# a merged value (highest priority first), a uniform dictionary, or a dictionary of nodes by key
+_Node = Union[int, _Uniform, Tuple[int, ...], Dict[Any, '_Node']]
+
+
+@dataclass(frozen=True)
+class Explanation:
+    """
+    Class representing where a value of a configuration comes from
+    """
+
+    path: Path
+    providers: Tuple[ConfigurationProvider, ...]
+    indexes: Tuple[int, ...]
+
+    @property
+    def provider(self) -> Optional[ConfigurationProvider]:
+        """
+        The provider with the highest priority among those defining the value, or None if it is a default value
+        """
+        return self.providers[0] if self.providers else None
+
+    @property
+    def is_default(self) -> bool:
+        """
+        Whether the value is the default value of its field, i.e. no provider defined it
+        """
+        return not self.providers
+
+    def __str__(self):
+        path = '.'.join(str(key) for key in self.path)
+        if self.is_default:
+            return f"{path}: default value"
+        providers = (f"{type(p).__name__} (provider {i})" for p, i in zip(self.providers, self.indexes))
+        return f"{path}: {', '.join(providers)}"
+
+
+@dataclass(frozen=True)
+class Provenance:
+    """
+    Class holding the provenance of the values of a configuration
+    """
+
+    providers: Tuple[ConfigurationProvider, ...]
+    root: _Node
+
+    def explain(self, path: Path) -> Explanation:
+        """
+        Retrieve where the value at a given path comes from
+
+        :param path:                    the path of the value
+        """
+        path = tuple(path)
+        node = self.root
+        for key in path:
+            if isinstance(node, _Uniform):
+                node = node.index if key in node.keys else None
+            elif isinstance(node, dict):
+                node = node.get(key)
+            else:  # Items of a value supplied as a whole come from the same providers
+                break
+            if node is None:
+                return Explanation(path, (), ())
+        if isinstance(node, _Uniform):
+            indexes = (node.index,)
+        elif isinstance(node, dict):  # A dictionary merged from several providers
+            indexes = sorted(set(_indexes(node)))
+        else:
+            indexes = node if isinstance(node, tuple) else (node,)
+        return Explanation(path, tuple(self.providers[i] for i in indexes), tuple(indexes))
+
+
+def _indexes(node: _Node):
+    if isinstance(node, _Uniform):
+        yield node.index
+    elif isinstance(node, dict):
+        for child in node.values():
+            yield from _indexes(child)
+    elif isinstance(node, tuple):
+        yield from node
+    else:
+        yield node
+
+
+def _mark(value, index: int, uniforms: Dict[Tuple[int, FrozenSet], _Uniform]) -> _Node:
+    if not isinstance(value, dict):
+        return index
+    for item in value.values():
+        if isinstance(item, dict):
+            return {key: _mark(item, index, uniforms) for key, item in value.items()}
+    key = (index, frozenset(value))
+    node = uniforms.get(key)
+    if node is None:
+        node = uniforms[key] = _Uniform(*key)
+    return node
+
+
+def _build(values: List[Tuple[int, Any]], uniforms: Dict[Tuple[int, FrozenSet], _Uniform]) -> _Node:
+    if len(values) == 1:
+        index, value = values[0]
+        return _mark(value, index, uniforms)
+    if all(isinstance(value, dict) for _, value in values):
+        seen = set()
+        shared_keys = set()
+        for _, value in values:
+            shared_keys |= seen.intersection(value)
+            seen.update(value)
+        result = {}
+        shared: Dict[Any, List[Tuple[int, Any]]] = {}
+        for index, value in values:
+            for key, item in value.items():
+                if key not in shared_keys:  # Most keys are only defined by one provider, do not group them
+                    result[key] = _mark(item, index, uniforms)
+                else:
+                    shared.setdefault(key, []).append((index, item))
+        for key, items in shared.items():
+            result[key] = _build(items, uniforms)
+        return result
+    return tuple(index for index, _ in reversed(values))
+
+
+def build_provenance(providers: List[ConfigurationProvider], results: List[Dict[str, Any]]) -> Provenance:
+    """
+    Build the provenance of merged values
+
+    :param providers:                   the providers, in order of priority
+    :param results:                     the values obtained from each provider, in the same order
+    """
+    values = [(i, result) for i, result in reversed(list(enumerate(results))) if result]
+    return Provenance(tuple(providers), _build(values, {}) if values else {})
+
+
+# Recorded provenances by id of their configuration, along with a function returning the configuration (a weak
+# reference, or a closure holding configurations that cannot be weakly referenced), from the oldest to the newest
+_MAX_PROVENANCES = 1024
+_provenances: 'OrderedDict[int, Tuple[Callable[[], Any], Provenance]]' = OrderedDict()
+_provenances_lock = threading.RLock()  # Reentrant, since weak reference callbacks may run while it is held
+
+
+def _release(key: int, reference: weakref.ref):
+    with _provenances_lock:
+        entry = _provenances.get(key)
+        if entry is not None and entry[0] is reference:  # The id may have been reused since the entry was evicted
+            del _provenances[key]
+
+
+def record_provenance(config, provenance: Provenance):
+    """
+    Attach provenance to a configuration, for as long as the configuration exists
+
+    Only the provenance of the most recently loaded configurations is kept (see _MAX_PROVENANCES), so that the overhead
+    stays bounded when provenance is always on. Configurations that cannot be weakly referenced (slotted dataclasses
+    without __weakref__) are kept alive until their provenance is evicted.
+
+    :param config:                      the configuration
+    :param provenance:                  its provenance
+    """
+    key = id(config)
+    try:
+        reference = weakref.ref(config, partial(_release, key))
+    except TypeError:  # The configuration cannot be weakly referenced, it is held by the entry instead
+        def reference():
+            return config
+    with _provenances_lock:
+        _provenances.pop(key, None)
+        _provenances[key] = reference, provenance
+        while len(_provenances) > _MAX_PROVENANCES:
+            _provenances.popitem(last=False)
+
+
+def explain(config, path: Path) -> Explanation:
+    """
+    Retrieve where a value of a configuration comes from (the configuration must be loaded with provenance=True)
+
+    :param config:                      the configuration, as returned by load
+    :param path:                        the path of the value
+    """
+    entry = _provenances.get(id(config))
+    if entry is None or entry[0]() is not config:
+        raise NectarineMissingProvenanceError()
+    return entry[1].explain(path)
@@ -4,13 +4,14 @@ Module providing a ConfigurationProvider backed by the program arguments
 
 import argparse
 import sys
-from typing import Any, Callable, Dict, List, Tuple, Type
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Type
 
 from nectarine.configuration_provider import ConfigurationProvider, Path
-from nectarine.dataclasses import get_paths
+from nectarine.dataclasses import get_paths, get_section_type
 from nectarine.errors import NectarineStrictLoadingError
-from nectarine.typing import is_primitive, is_tuple, is_linear_collection, is_parsable, is_literal, \
-    get_generic_args
+from nectarine.providers.env import _convert_item
+from nectarine.typing import is_dataclass, is_primitive, is_tuple, is_linear_collection, is_parsable, is_literal, \
+    get_generic_args, get_origin
 from nectarine._utils import insert_at_path, try_convert
 
 
@@ -27,7 +28,7 @@ def _make_tuple_action(types: Tuple[Type]):
 
         def __call__(self, parser, namespace, values, option_string=None):
             assert len(values) == len(self.tuple_types)
-            values = tuple(try_convert(v, t) for v, t in zip(values, self.tuple_types))
+            values = tuple(_convert_item(v, t) for v, t in zip(values, self.tuple_types))
             setattr(namespace, self.dest, values)
 
     return TupleAction
@@ -43,7 +44,12 @@ def flag_name_to_path(flag_name: str) -> Path:
     return tuple(flag_name.split('-'))
 
 
-def _is_supported_type(type_: Type) -> bool:
+def is_supported_type(type_: Type) -> bool:
+    """
+    Check whether values of a given type can be read from program arguments
+
+    :param type_:                       the type to check
+    """
     if is_primitive(type_):
         return True
     if is_linear_collection(type_):
@@ -54,7 +60,7 @@ def _is_supported_type(type_: Type) -> bool:
         return all(is_primitive(t) for t in values_types)
     if is_literal(type_):
         return is_primitive(type_)
-    return False
+    return is_parsable(type_) and not is_dataclass(type_)  # Nested dataclasses are filled flag by flag
 
 
 def _add_argument_for(parser: argparse.ArgumentParser, name, field):
@@ -65,31 +71,35 @@ def _add_argument_for(parser: argparse.ArgumentParser, name, field):
         parser.add_argument(f"--{name}", type=lambda x: try_convert(x, field.type), **kwargs)
     elif is_linear_collection(field.type):
         value_type = get_generic_args(field.type)[0]
-        if is_primitive(value_type):
-            parser.add_argument(f"--{name}", action='append', type=lambda x: try_convert(x, value_type), **kwargs)
-        else:
-            assert is_parsable(value_type)
-            parser.add_argument(f"--{name}", action='append', type=str, **kwargs)
+        assert is_primitive(value_type) or is_parsable(value_type)
+        parser.add_argument(f"--{name}", action='append', type=lambda x: _convert_item(x, value_type), **kwargs)
     elif is_tuple(field.type):  # This is matched only for fixed-length tuples
         values_types = get_generic_args(field.type)
         parser.add_argument(f"--{name}", nargs=len(values_types), action=_make_tuple_action(values_types), **kwargs)
     elif is_literal(field.type):
         allowed_values = get_generic_args(field.type)
         parser.add_argument(f"--{name}", choices=allowed_values, nargs='?')
+    elif is_parsable(field.type):
+        parser.add_argument(f"--{name}", type=lambda x: try_convert(x, field.type), **kwargs)
 
 
 def _argument_parser_for(
-        target_type: Type,
-        flag_name_converter: Callable[[Path], str] = None
+        target_types: List[Type],
+        flag_name_converter: Callable[[Path], str] = None,
+        section: Path = (),
 ):
     arg_to_path = {}
     flag_name_converter = flag_name_converter or path_to_flag_name
     parser = argparse.ArgumentParser(allow_abbrev=False, add_help=True)
-    paths = ((path, field) for path, field in get_paths(target_type) if _is_supported_type(field.type))
-    for path, field in paths:
-        arg_name = flag_name_converter(path)
-        arg_to_path[arg_name] = path
-        _add_argument_for(parser, arg_name, field)
+    for target_type in target_types:
+        paths = ((path, field) for path, field in get_paths(get_section_type(target_type, section), section)
+                 if is_supported_type(field.type))
+        for path, field in paths:
+            arg_name = flag_name_converter(path)
+            if arg_name in arg_to_path:  # Flag shared by several target types
+                continue
+            arg_to_path[arg_name] = path
+            _add_argument_for(parser, arg_name, field)
     return parser, arg_to_path
 
 
@@ -103,7 +113,7 @@ def argument_parser_for(
     :param target_type:                 the target type
     :param flag_name_converter:         the function used to generate flag names from paths
     """
-    return _argument_parser_for(target_type, flag_name_converter)[0]
+    return _argument_parser_for([target_type], flag_name_converter)[0]
 
 
 class Arguments(ConfigurationProvider):
@@ -117,16 +127,62 @@ class Arguments(ConfigurationProvider):
         self.flag_name_converter = flag_name_converter or path_to_flag_name
 
     def load_configuration(self, target_type: Type, strict=False) -> Dict[str, Any]:
-        parser, arg_to_path = _argument_parser_for(target_type, self.flag_name_converter)
+        return self.snapshot([target_type]).load_configuration(target_type, strict=strict)
+
+    def load_section(self, target_type: Type, path: Path, strict=False) -> Dict[str, Any]:
+        if not path:
+            return self.load_configuration(target_type, strict=strict)
+        parser, arg_to_path = _argument_parser_for([target_type], self.flag_name_converter, path)
+        args, unknown = parser.parse_known_args(self.argv)
+        if unknown:
+            # Flags of the other sections are unknown to the parser, only flags unknown to the whole type are rejected
+            flags = {self.flag_name_converter(field_path) for field_path, field in get_paths(target_type)
+                     if is_supported_type(field.type)}
+            offending = [f for f in unknown if f.startswith('--') and f[2:].split('=', 1)[0] not in flags]
+            if offending:
+                raise NectarineStrictLoadingError(offending_keys=[flag_name_to_path(f) for f in offending])
+        values = {arg_name.replace('_', '-'): value for arg_name, value in vars(args).items() if value is not None}
+        return ParsedArguments(values, self.flag_name_converter).load_section(target_type, path, strict=strict)
+
+    def snapshot(self, target_types: List[Type]) -> ConfigurationProvider:
+        parser, arg_to_path = _argument_parser_for(target_types, self.flag_name_converter)
         args, unknown = parser.parse_known_args(self.argv)
         if unknown:
             raise NectarineStrictLoadingError(offending_keys=[flag_name_to_path(f) for f in unknown])
+        values = {arg_name.replace('_', '-'): value for arg_name, value in vars(args).items() if value is not None}
+        return ParsedArguments(values, self.flag_name_converter)
+
+    def fingerprint(self, target_type: Type) -> Optional[Hashable]:
+        return type(self), tuple(self.argv), self.flag_name_converter
+
+
+class ParsedArguments(ConfigurationProvider):
+    """
+    Provider holding program arguments that were already parsed, by flag name
+    """
+
+    def __init__(self, values: Dict[str, Any], flag_name_converter: Callable[[Path], str]):
+        self.values = values
+        self.flag_name_converter = flag_name_converter
+
+    def load_configuration(self, target_type: Type, strict=False) -> Dict[str, Any]:
+        return self.load_section(target_type, (), strict=strict)
+
+    def load_section(self, target_type: Type, path: Path, strict=False) -> Dict[str, Any]:
         result = {}
-        for arg_name, value in vars(args).items():
-            if value is not None:
-                insert_at_path(result, arg_to_path[arg_name.replace('_', '-')], value)
+        for field_path, field in get_paths(get_section_type(target_type, path), path):
+            if is_supported_type(field.type):
+                value = self.values.get(self.flag_name_converter(field_path))
+                if value is not None:
+                    if isinstance(value, list) and is_linear_collection(field.type) and \
+                            get_origin(field.type) in (tuple, set, frozenset):  # Repeated flags are appended to lists
+                        value = get_origin(field.type)(value)
+                    insert_at_path(result, field_path[len(path):], value)
         return result
 
+    def fingerprint(self, target_type: Type) -> Optional[Hashable]:
+        return self  # Parsed values never change
+
 
 def arguments(
         argv: List[str] = None,
@@ -0,0 +1,191 @@
+"""
+Module providing a ConfigurationProvider backed by a bundle: a zip or tar archive containing one file per section
+
+Each top-level field of the target type (a section) is read from the member of the same name with a ".json", ".yaml"
+or ".yml" extension, e.g. the "database" field from "database.json". Only the members needed by the target type are
+read, straight from the archive, and they are parsed in parallel. Parsed members are cached by the content hash of the
+archive, so that an unchanged bundle (even if deployed again) is never parsed twice.
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json as _json
+import os
+import tarfile
+import threading
+import zipfile
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Type
+
+from nectarine.configuration_provider import ConfigurationProvider, Path
+from nectarine.dataclasses import get_fields, get_paths
+from nectarine.errors import NectarineStrictLoadingError
+from nectarine.providers.dictionary import Dictionary, extract_configuration
+
+
+def _parse_yaml(data: bytes):
+    import yaml  # Only needed for YAML members, and an optional dependency
+
+    return yaml.safe_load(data)
+
+
+PARSERS: Dict[str, Callable[[bytes], Any]] = {
+    ".json": _json.loads,
+    ".yaml": _parse_yaml,
+    ".yml": _parse_yaml,
+}
+
+# Parsed members by content hash of their archive, for the most recently used archives
+_MAX_CACHED_BUNDLES = 16
+_parsed: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+_parsed_lock = threading.Lock()
+
+
+def _hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _cached_members(digest: str) -> Dict[str, Any]:
+    with _parsed_lock:
+        members = _parsed.get(digest)
+        if members is None:
+            members = _parsed[digest] = {}
+            while len(_parsed) > _MAX_CACHED_BUNDLES:
+                _parsed.popitem(last=False)
+        else:
+            _parsed.move_to_end(digest)
+        return members
+
+
+class _Archive:
+    """
+    Class representing an opened archive, along with its members by section name
+    """
+
+    def __init__(self, path: str, root: str):
+        self.stat_key = _stat_key(path)
+        self.digest = _hash_file(path)
+        self.lock = threading.Lock()
+        if zipfile.is_zipfile(path):
+            self.zip: Optional[zipfile.ZipFile] = zipfile.ZipFile(path)  # Only reads the central directory
+            self.tar: Optional[tarfile.TarFile] = None
+            names = [info.filename for info in self.zip.infolist() if not info.is_dir()]
+        else:
+            self.zip = None
+            self.tar = tarfile.open(path, 'r:*')
+            self.tar_members = {member.name: member for member in self.tar.getmembers() if member.isfile()}
+            names = list(self.tar_members)
+        self.sections: Dict[str, str] = {}
+        for name in names:
+            if not name.startswith(root):
+                continue
+            section, extension = os.path.splitext(name[len(root):])
+            if extension in PARSERS and '/' not in section:
+                self.sections.setdefault(section, name)
+
+    def read(self, name: str) -> bytes:
+        if self.zip is not None:
+            return self.zip.read(name)  # Zip files are safe to read from several threads
+        with self.lock:
+            return self.tar.extractfile(self.tar_members[name]).read()
+
+    def close(self):
+        if self.zip is not None:
+            self.zip.close()
+        else:
+            self.tar.close()
+
+
+def _stat_key(path: str) -> Tuple[int, int, int]:
+    stat = os.stat(path)
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+class Bundle(ConfigurationProvider):
+    def __init__(self, file: str, root: str = "", max_workers: int = None, must_exist: bool = True):
+        self.file = file
+        self.root = root.rstrip('/') + '/' if root else ""
+        self.max_workers = max_workers
+        self.must_exist = must_exist
+        self._archive: Optional[_Archive] = None
+        self._lock = threading.Lock()
+        if must_exist:
+            _stat_key(file)  # A missing bundle is reported right away, it is only opened when needed
+
+    def _open(self) -> Optional[_Archive]:
+        try:
+            stat_key = _stat_key(self.file)
+        except FileNotFoundError:
+            if self.must_exist:
+                raise
+            return None
+        with self._lock:
+            if self._archive is None or self._archive.stat_key != stat_key:
+                if self._archive is not None:
+                    self._archive.close()
+                self._archive = _Archive(self.file, self.root)
+            return self._archive
+
+    def _parse(self, archive: _Archive, name: str):
+        return PARSERS[os.path.splitext(name)[1]](archive.read(name))
+
+    def _load_members(self, archive: _Archive, names: List[str]) -> Dict[str, Any]:
+        cached = _cached_members(archive.digest)
+        missing = [name for name in names if name not in cached]
+        if len(missing) > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for name, value in zip(missing, executor.map(lambda n: self._parse(archive, n), missing)):
+                    cached[name] = value
+        elif missing:
+            cached[missing[0]] = self._parse(archive, missing[0])
+        return {name: cached[name] for name in names}
+
+    def load_configuration(self, target_type: Type, strict=False) -> Dict[str, Any]:
+        archive = self._open()
+        if archive is None:
+            return {}
+        field_names = {field.name for field in get_fields(target_type)}
+        if strict is True:
+            extraneous = [(section,) for section in archive.sections if section not in field_names]
+            if extraneous:
+                raise NectarineStrictLoadingError(offending_keys=extraneous)
+        sections = {name: archive.sections[name] for name in field_names if name in archive.sections}
+        members = self._load_members(archive, list(sections.values()))
+        value = {section: members[name] for section, name in sections.items()}
+        return extract_configuration(dict(get_paths(target_type)), value, strict)
+
+    def load_section(self, target_type: Type, path: Path, strict=False) -> Dict[str, Any]:
+        if not path:
+            return self.load_configuration(target_type, strict)
+        archive = self._open()
+        if archive is None or path[0] not in archive.sections:
+            return {}
+        name = archive.sections[path[0]]  # Only the member of the section is read
+        value = {path[0]: self._load_members(archive, [name])[name]}
+        return Dictionary(value).load_section(target_type, path, strict)
+
+    def fingerprint(self, target_type: Type) -> Optional[Hashable]:
+        try:
+            return type(self), os.path.abspath(self.file), self.root, _stat_key(self.file)
+        except FileNotFoundError:
+            if self.must_exist:
+                raise
+            return type(self), os.path.abspath(self.file), self.root, None
+
+
+def bundle(file: str, root: str = "", max_workers: int = None, must_exist: bool = True):
+    """
+    Configure a provider that reads from a zip or tar archive containing one JSON or YAML file per section
+
+    :param file:                        the path to the archive
+    :param root:                        the directory containing the sections in the archive (default is the root of
+                                        the archive)
+    :param max_workers:                 the maximum number of threads parsing members (default is chosen by
+                                        concurrent.futures.ThreadPoolExecutor)
+    :param must_exist:                  whether or not the archive must exist
+    """
+    return Bundle(file, root, max_workers, must_exist)
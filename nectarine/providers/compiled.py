@@ -0,0 +1,48 @@
+"""
+Module providing a ConfigurationProvider backed by a compiled configuration file (see nectarine.compilation)
+"""
+
+from typing import Any, Dict, Hashable, Optional, Type
+
+from nectarine.compilation import CompiledFile
+from nectarine.configuration_provider import ConfigurationProvider, Path
+from nectarine.providers.dictionary import Dictionary
+
+
+class Compiled(ConfigurationProvider):
+    def __init__(self, file: str, must_exist: bool = True):
+        try:
+            self.file = CompiledFile(file)
+        except FileNotFoundError:
+            if must_exist:
+                raise
+            self.file = None
+
+    def load_configuration(self, target_type: Type, strict=False) -> Dict[str, Any]:
+        if self.file is None:
+            return {}
+        value = self.file.decode(self.file.root)
+        if self.file.matches(target_type):
+            return value  # The file was validated against this very schema when it was compiled
+        return Dictionary(value).load_configuration(target_type, strict=strict)
+
+    def load_section(self, target_type: Type, path: Path, strict=False) -> Dict[str, Any]:
+        if self.file is None:
+            return {}
+        if not self.file.matches(target_type):
+            return Dictionary(self.file.decode(self.file.root)).load_section(target_type, path, strict=strict)
+        offset = self.file.section_offset(target_type, path)  # Only the section is decoded
+        return self.file.decode(offset) if offset is not None else {}
+
+    def fingerprint(self, target_type: Type) -> Optional[Hashable]:
+        return type(self), self.file  # The file is mapped once, later changes are not seen by the provider
+
+
+def compiled(file: str, must_exist: bool = True):
+    """
+    Configure a provider that reads from a compiled configuration file
+
+    :param file:                        the path to the compiled file
+    :param must_exist:                  whether or not the file must exist
+    """
+    return Compiled(file, must_exist)
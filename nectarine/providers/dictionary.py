@@ -2,13 +2,15 @@
 Module providing a ConfigurationProvider backed by a Python dictionary
 """
 
-from typing import Any, Dict, List, Tuple, Type
+from copy import copy
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Type
 
 from nectarine.configuration_provider import ConfigurationProvider, Path
-from nectarine.dataclasses import get_paths
+from nectarine.dataclasses import Field, get_paths, get_section_type
 from nectarine.errors import NectarineStrictLoadingError, NectarineInvalidValueError
-from nectarine.typing import is_conform_to_hint, is_dataclass, is_tuple
-from nectarine._utils import insert_at_path
+from nectarine.typing import get_generic_args, get_origin, is_conform_to_hint, is_dataclass, is_generic_collection, \
+    is_mapping, is_number, is_tuple
+from nectarine._utils import Identity, insert_at_path
 
 
 def _get_dict_paths(d: Dict[str, Any], path=()):
@@ -31,26 +33,84 @@ def _unify_paths(paths: Dict, dict_paths: Dict) -> Tuple[Dict, List[Path]]:
     return result, extraneous
 
 
+def validate_value(field: Field, value):
+    """
+    Check that a value read for a field conforms to the field's type, converting it if needed (lists are accepted for
+    tuples and sets, and strings for number keys of dictionaries, since formats such as JSON have no other sequences
+    and no other keys)
+
+    :param field:                       the field the value was read for
+    :param value:                       the value to check
+    """
+    if isinstance(value, list) and is_tuple(field.type):
+        value = tuple(value)
+    elif isinstance(value, list) and is_generic_collection(field.type) and get_origin(field.type) in (set, frozenset):
+        value = get_origin(field.type)(value)
+    elif isinstance(value, dict) and is_mapping(field.type) and is_number(get_generic_args(field.type)[0]):
+        key_type = get_generic_args(field.type)[0]
+        try:
+            value = {key_type(k) if isinstance(k, str) else k: v for k, v in value.items()}
+        except ValueError:  # Reported below, along with the original value
+            pass
+    if not is_conform_to_hint(value, field.type):
+        raise NectarineInvalidValueError(expected_type=field.type, value=value)
+    return value
+
+
+def extract_configuration(
+        paths: Dict[Path, Field],
+        value: Dict[str, Any],
+        strict: bool = False,
+        dict_paths: Dict[Path, Any] = None,
+) -> Dict[str, Any]:
+    """
+    Extract the values of the fields of a target type from a dictionary, checking them
+
+    :param paths:                       the fields of the target type, by path (see get_paths)
+    :param value:                       the dictionary to extract values from
+    :param strict:                      activate strict mode (reject extra values, ...)
+    :param dict_paths:                  the values of the dictionary by path, if already computed
+    """
+    if dict_paths is None:
+        dict_paths = dict(_get_dict_paths(value))
+    unified, extraneous = _unify_paths(paths, dict_paths)
+    if strict is True and extraneous:
+        raise NectarineStrictLoadingError(offending_keys=extraneous)
+    result = {}
+    for path, (field, v) in unified.items():
+        if not is_dataclass(field.type):
+            insert_at_path(result, path, validate_value(field, v))
+    return result
+
+
 class Dictionary(ConfigurationProvider):
     def __init__(self, value: Dict[str, Any]):
         self.value = value
+        self._dict_paths = None
 
     def load_configuration(self, target_type: Type, strict=False) -> Dict[str, Any]:
-        paths = dict(get_paths(target_type))
-        dict_paths = dict(_get_dict_paths(self.value))
-        unified, extraneous = _unify_paths(paths, dict_paths)
-        if strict is True and extraneous:
-            raise NectarineStrictLoadingError(offending_keys=extraneous)
-        result = {}
-        for path, (field, value) in unified.items():
-            if not is_dataclass(field.type):
-                if isinstance(value, list) and is_tuple(field.type):
-                    value = tuple(value)
-                if is_conform_to_hint(value, field.type):
-                    insert_at_path(result, path, value)
-                else:
-                    raise NectarineInvalidValueError(expected_type=field.type, value=value)
-        return result
+        return extract_configuration(dict(get_paths(target_type)), self.value, strict, self._dict_paths)
+
+    def load_section(self, target_type: Type, path: Path, strict=False) -> Dict[str, Any]:
+        if not path:
+            return self.load_configuration(target_type, strict)
+        value = self.value
+        for key in path:
+            value = value.get(key) if isinstance(value, dict) else None
+        if not isinstance(value, dict):
+            return {}
+        try:
+            return extract_configuration(dict(get_paths(get_section_type(target_type, path))), value, strict)
+        except NectarineStrictLoadingError as e:  # Report keys as when loading the whole type
+            raise NectarineStrictLoadingError(offending_keys=[(*path, *key) for key in e.offending_keys]) from None
+
+    def snapshot(self, target_types: List[Type]) -> ConfigurationProvider:
+        snapshot = copy(self)
+        snapshot._dict_paths = dict(_get_dict_paths(self.value))  # Walk the dictionary once for all the target types
+        return snapshot
+
+    def fingerprint(self, target_type: Type) -> Optional[Hashable]:
+        return Identity(self.value)  # Dictionaries are expected not to be modified once given to a provider
 
 
 def dictionary(value: Dict[str, Any]):
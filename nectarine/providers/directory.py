@@ -0,0 +1,161 @@
+"""
+Module providing a ConfigurationProvider backed by a directory containing one file per value
+
+This is the layout used by Kubernetes when mounting ConfigMaps and Secrets as volumes: each key is a file, which is a
+symbolic link to a file in a "..data" directory, itself a symbolic link that is atomically swapped on updates.
+"""
+
+import os
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Type
+
+from nectarine.configuration_provider import ConfigurationProvider, Path
+from nectarine.providers.env import Env
+from nectarine._utils import insert_at_path
+
+DATA_LINK_NAME = "..data"
+
+
+def path_to_file_name(path: Path) -> str:
+    name = '.'.join(path)
+    return name
+
+
+class _CachedFile:
+    """
+    Class representing the content of a file as last read, along with the values converted from it
+    """
+
+    def __init__(self, stat_key: Tuple[int, int, int], content: str):
+        self.stat_key = stat_key
+        self.content = content
+        self.converted: Dict[Type, Any] = {}
+
+
+class Directory(Env):
+    def __init__(
+            self,
+            path: str,
+            prefix: str = None,
+            allow_lists: bool = False,
+            list_separator: str = ',',
+            file_name_converter: Callable[[Path], str] = None,
+            strip: bool = True,
+            must_exist: bool = True,
+    ):
+        super().__init__(
+            prefix=prefix,
+            allow_lists=allow_lists,
+            list_separator=list_separator,
+            variable_name_converter=file_name_converter or path_to_file_name,
+        )
+        self.path = path
+        self.strip = strip
+        self.must_exist = must_exist
+        self._files: Dict[str, _CachedFile] = {}
+        # Values loaded per target type and section, along with the "..data" link target they were loaded from
+        self._loaded: Dict[Tuple[Type, Path], Tuple[str, List[Tuple[Path, Any]]]] = {}
+
+    def _data_version(self) -> Optional[str]:
+        try:
+            return os.readlink(os.path.join(self.path, DATA_LINK_NAME))
+        except OSError:  # Not a Kubernetes-style volume, each file has to be checked
+            return None
+
+    def _read(self, entry: os.DirEntry) -> _CachedFile:
+        stat = entry.stat()
+        stat_key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        cached = self._files.get(entry.name)
+        if cached is not None and cached.stat_key == stat_key:
+            return cached
+        with open(entry.path, 'r') as f:
+            content = f.read()
+        if self.strip:
+            content = content.strip()
+        if cached is not None and cached.content == content:
+            # After a swap of the "..data" link every file is a new one, but most of them have the same content
+            cached.stat_key = stat_key
+            return cached
+        cached = _CachedFile(stat_key, content)
+        self._files[entry.name] = cached
+        return cached
+
+    def _load_values(self, target_type: Type, section: Path) -> List[Tuple[Path, Any]]:
+        try:
+            with os.scandir(self.path) as it:
+                entries = {entry.name: entry for entry in it}
+        except FileNotFoundError:
+            if self.must_exist:
+                raise
+            return []
+        values = []
+        for path, field, file_name in self._variable_names(target_type, section):
+            entry = entries.get(file_name)
+            if entry is None or entry.is_dir():
+                continue
+            cached = self._read(entry)
+            if field.type not in cached.converted:
+                cached.converted[field.type] = self.convert_to(field.type, cached.content)
+            values.append((path[len(section):], cached.converted[field.type]))
+        return values
+
+    def load_section(self, target_type: Type, path: Path, strict=False) -> Dict[str, Any]:
+        version = self._data_version()
+        loaded = self._loaded.get((target_type, path))
+        if version is not None and loaded is not None and loaded[0] == version:
+            values = loaded[1]
+        else:
+            values = self._load_values(target_type, path)
+            self._loaded[(target_type, path)] = version, values
+        result = {}
+        for field_path, value in values:
+            insert_at_path(result, field_path, value)
+        return result
+
+    def snapshot(self, target_types: List[Type]) -> ConfigurationProvider:
+        return self  # Files are already cached, and only read again when they change
+
+    def fingerprint(self, target_type: Type) -> Optional[Hashable]:
+        settings = type(self), os.path.abspath(self.path), self.prefix, self.allow_lists, self.list_separator, \
+            self.variable_name_converter, self.strip
+        version = self._data_version()
+        if version is not None:
+            return settings, version
+        stat_keys = []
+        for _, _, file_name in self._variable_names(target_type):
+            try:
+                stat = os.stat(os.path.join(self.path, file_name))
+                stat_keys.append((stat.st_ino, stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                stat_keys.append(None)
+        return settings, tuple(stat_keys)
+
+
+def directory(
+        path: str,
+        prefix: str = None,
+        allow_lists: bool = False,
+        list_separator: str = ',',
+        file_name_converter: Callable[[Path], str] = None,
+        strip: bool = True,
+        must_exist: bool = True,
+):
+    """
+    Configure a provider that reads from a directory containing one file per value
+
+    :param path:                        the path to the directory
+    :param prefix:                      the prefix to use for each file name (or None for no prefix)
+    :param allow_lists:                 whether or not lists should be parsed from files
+    :param list_separator:              the separator to use to split values when parsing lists
+    :param file_name_converter:         the function used to generate file names from paths
+    :param strip:                       whether or not leading and trailing whitespace should be removed from values
+    :param must_exist:                  whether or not the directory must exist
+    """
+    return Directory(
+        path=path,
+        prefix=prefix,
+        allow_lists=allow_lists,
+        list_separator=list_separator,
+        file_name_converter=file_name_converter,
+        strip=strip,
+        must_exist=must_exist,
+    )
@@ -2,11 +2,14 @@
 Module providing a ConfigurationProvider backed by the program environment
 """
 
+from copy import copy
+from dataclasses import MISSING
+from functools import lru_cache, partial
 import os
-from typing import Any, Callable, Dict, Type
+from typing import Any, Callable, Dict, Hashable, List, Mapping, Optional, Tuple, Type
 
 from nectarine.configuration_provider import ConfigurationProvider, Path
-from nectarine.dataclasses import get_paths
+from nectarine.dataclasses import Field, get_paths, get_section_type
 from nectarine.errors import NectarineInvalidValueError
 from nectarine.typing import get_generic_args, get_generic_collection_origin, \
     is_number, is_linear_collection, is_tuple, is_parsable, is_literal
@@ -18,6 +21,46 @@ def path_to_variable_name(path: Path) -> str:
     return name
 
 
+def _convert_literal(target_type: Type, allowed_values: Dict[str, Any], value: str):
+    converted_value = allowed_values.get(value, MISSING)
+    if converted_value is not MISSING:
+        return converted_value
+    # Slow path for values spelled differently from the allowed ones (e.g. "01" for 1)
+    for v in allowed_values.values():
+        try:
+            converted_value = type(v)(value)
+            if converted_value == v:
+                return converted_value
+        except ValueError:
+            pass
+    raise NectarineInvalidValueError(target_type, value)
+
+
+_BOOLEANS = {
+    "true": True, "yes": True, "on": True, "1": True,
+    "false": False, "no": False, "off": False, "0": False,
+}
+
+
+def _convert_bool(value: str) -> bool:
+    try:
+        return _BOOLEANS[value.strip().lower()]
+    except KeyError:
+        raise NectarineInvalidValueError(bool, value) from None
+
+
+def _convert_item(value: str, target_type: Type):
+    return _convert_bool(value) if target_type is bool else try_convert(value, target_type)
+
+
+@lru_cache(maxsize=None)
+def _literal_converter(target_type: Type) -> Callable[[str], Any]:
+    allowed_values = {}
+    for v in get_generic_args(target_type):
+        allowed_values.setdefault(str(v), v)
+    return partial(_convert_literal, target_type, allowed_values)
+
+
 class Env(ConfigurationProvider):
     DEFAULT_SUPPORTED_TYPES = {int, float, bool, str}
 
@@ -27,11 +70,14 @@ class Env(ConfigurationProvider):
             allow_lists: bool = False,
             list_separator: str = ',',
             variable_name_converter: Callable[[Path], str] = None,
+            environ: Mapping[str, str] = None,
     ):
         self.prefix = prefix
         self.allow_lists = allow_lists
         self.list_separator = list_separator
         self.variable_name_converter = variable_name_converter or path_to_variable_name
+        self.environ = environ
+        self._names: Dict[Tuple[Type, Path], List[Tuple[Path, Field, str]]] = {}
 
     def is_supported_type(self, type_: Type):
         if type_ in self.DEFAULT_SUPPORTED_TYPES:
@@ -45,49 +91,67 @@ class Env(ConfigurationProvider):
     def convert_to(self, target_type: Type, value: str):
         if target_type is Any:
             return value
+        if target_type is bool:
+            return _convert_bool(value)
         if is_number(target_type):
             return try_convert(value, target_type)
         if is_linear_collection(target_type):
             origin = get_generic_collection_origin(target_type)
             value_type = get_generic_args(target_type)[0]
-            return origin(try_convert(v, value_type) for v in value.split(self.list_separator))
+            return origin(_convert_item(v, value_type) for v in value.split(self.list_separator))
         if is_tuple(target_type):
             args = get_generic_args(target_type)
             values = value.split(self.list_separator)
             if len(args) != len(values):
                 raise NectarineInvalidValueError(target_type, value)
-            return tuple(try_convert(v, t) for v, t in zip(values, args))
+            return tuple(_convert_item(v, t) for v, t in zip(values, args))
         if is_literal(target_type):
-            allowed_values = get_generic_args(target_type)
-            for v in allowed_values:
-                try:
-                    converted_value = type(v)(value)
-                    if converted_value == v:
-                        return converted_value
-                except ValueError:
-                    pass
-            raise NectarineInvalidValueError(target_type, value)
+            return _literal_converter(target_type)(value)
+        if is_parsable(target_type):
+            return try_convert(value, target_type)
         return value
 
+    def _variable_names(self, target_type: Type, section: Path = ()) -> List[Tuple[Path, Field, str]]:
+        names = self._names.get((target_type, section))
+        if names is None:
+            names = []
+            for path, field in get_paths(get_section_type(target_type, section), section):
+                if self.is_supported_type(field.type):
+                    name = self.variable_name_converter(path)
+                    names.append((path, field, self.prefix + name if self.prefix is not None else name))
+            self._names[(target_type, section)] = names
+        return names
+
     def load_configuration(self, target_type: Type, strict=False) -> Dict[str, Any]:
-        paths = ((path, field) for path, field in get_paths(target_type) if self.is_supported_type(field.type))
+        return self.load_section(target_type, (), strict)
+
+    def load_section(self, target_type: Type, path: Path, strict=False) -> Dict[str, Any]:
+        environ = self.environ if self.environ is not None else os.environ
         result = {}
-        for path, field in paths:
-            var_name = self.variable_name_converter(path)
-            if self.prefix is not None:
-                var_name = self.prefix + var_name
-            value = os.environ.get(var_name)
+        for field_path, field, var_name in self._variable_names(target_type, path):
+            value = environ.get(var_name)
             if value is not None:
                 value = self.convert_to(field.type, value)
-                insert_at_path(result, path, value)
+                insert_at_path(result, field_path[len(path):], value)
         return result
 
+    def fingerprint(self, target_type: Type) -> Optional[Hashable]:
+        environ = self.environ if self.environ is not None else os.environ
+        values = tuple(environ.get(name) for _, _, name in self._variable_names(target_type))
+        return type(self), self.prefix, self.allow_lists, self.list_separator, self.variable_name_converter, values
+
+    def snapshot(self, target_types: List[Type]) -> ConfigurationProvider:
+        snapshot = copy(self)
+        snapshot.environ = dict(self.environ if self.environ is not None else os.environ)
+        return snapshot
+
 
 def env(
         prefix: str = None,
         allow_lists: bool = False,
         list_separator: str = ',',
         variable_name_converter: Callable[[Path], str] = None,
+        environ: Mapping[str, str] = None,
 ):
     """
     Configure a provider that reads from the program environment
@@ -96,10 +160,12 @@ def env(
     :param allow_lists:                 whether or not lists should be parsed from environment variables
     :param list_separator:              the separator to use to split values when parsing lists
     :param variable_name_converter:     the function used to generate variable names from paths
+    :param environ:                     the environment to read from (default is the program environment)
     """
     return Env(
         prefix=prefix,
         allow_lists=allow_lists,
         list_separator=list_separator,
         variable_name_converter=variable_name_converter,
+        environ=environ,
     )
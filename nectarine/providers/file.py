@@ -0,0 +1,60 @@
+"""
+Module providing a base class for ConfigurationProviders backed by a file containing a dictionary (JSON, YAML, ...)
+"""
+
+from abc import abstractmethod
+import os
+from typing import IO, Any, Dict, Hashable, Optional, Tuple, Type
+
+from nectarine.providers.dictionary import Dictionary
+
+
+class File(Dictionary):
+    """
+    Provider reading a dictionary from a file when it is first needed, and again whenever the file changes
+    """
+
+    def __init__(self, file: str, must_exist: bool = True):
+        super().__init__({})
+        self.file = file
+        self.must_exist = must_exist
+        self._stat_key: Optional[Tuple[int, int, int]] = None
+        self._read = False
+        self._current_stat_key()  # A missing file is reported right away, the file itself is only read when needed
+
+    @abstractmethod
+    def parse(self, f: IO) -> Dict[str, Any]:
+        """
+        Parse the content of the file
+
+        :param f:                       the file, opened in text mode
+        """
+        pass
+
+    def _current_stat_key(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = os.stat(self.file)
+        except FileNotFoundError:
+            if self.must_exist:
+                raise
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    @property
+    def value(self) -> Dict[str, Any]:
+        stat_key = self._current_stat_key()
+        if not self._read or stat_key != self._stat_key:
+            self._value = {}
+            if stat_key is not None:
+                with open(self.file, 'r') as f:
+                    self._value = self.parse(f)
+            self._stat_key = stat_key
+            self._read = True
+        return self._value
+
+    @value.setter
+    def value(self, value: Dict[str, Any]):
+        self._value = value
+
+    def fingerprint(self, target_type: Type) -> Optional[Hashable]:
+        return type(self), os.path.abspath(self.file), self._current_stat_key()
@@ -0,0 +1,219 @@
+"""
+Module providing a ConfigurationProvider backed by an HTTP key-value store
+
+The store is expected to answer "GET <url>?key=<key>&key=<key>..." requests with a JSON object mapping each requested
+key that exists to its value, along with an ETag header. Requests carry an If-None-Match header once an ETag is known,
+so that an unchanged store can answer with a "304 Not Modified" response.
+"""
+
+import http.client as _http_client
+import json as _json
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+from urllib.parse import urlencode, urlsplit
+
+from nectarine.configuration_provider import ConfigurationProvider, Path
+from nectarine.dataclasses import Field, get_paths, get_section_type
+from nectarine.providers.dictionary import validate_value
+from nectarine.typing import is_dataclass
+from nectarine._utils import insert_at_path
+
+
+def path_to_key_name(path: Path) -> str:
+    name = '/'.join(path)
+    return name
+
+
+class _ConnectionPool:
+    """
+    Pool of keep-alive connections to a single host
+    """
+
+    def __init__(self, scheme: str, netloc: str, size: int, timeout: float):
+        self.connection_type = _http_client.HTTPSConnection if scheme == "https" else _http_client.HTTPConnection
+        self.netloc = netloc
+        self.size = size
+        self.timeout = timeout
+        self.idle: List[_http_client.HTTPConnection] = []
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def connection(self):
+        with self.lock:
+            connection = self.idle.pop() if self.idle else None
+        if connection is None:
+            connection = self.connection_type(self.netloc, timeout=self.timeout)
+        try:
+            yield connection
+        except BaseException:
+            connection.close()
+            raise
+        with self.lock:
+            if len(self.idle) < self.size:
+                self.idle.append(connection)
+                return
+        connection.close()
+
+    def close(self):
+        with self.lock:
+            idle, self.idle = self.idle, []
+        for connection in idle:
+            connection.close()
+
+
+class _Batch:
+    """
+    Class representing a group of keys fetched with a single request, along with the last response obtained for them
+    """
+
+    def __init__(self, query: str):
+        self.query = query
+        self.etag: Optional[str] = None
+        self.values: Dict[str, Any] = {}
+
+
+class Http(ConfigurationProvider):
+    def __init__(
+            self,
+            url: str,
+            prefix: str = None,
+            key_name_converter: Callable[[Path], str] = None,
+            max_url_length: int = 2048,
+            pool_size: int = 4,
+            timeout: float = 10.,
+            headers: Dict[str, str] = None,
+    ):
+        parts = urlsplit(url)
+        self.url = url
+        self.base_path = parts.path or '/'
+        self.base_query = f"{parts.query}&" if parts.query else ""  # Parameters of the URL are kept in each request
+        self.prefix = prefix
+        self.key_name_converter = key_name_converter or path_to_key_name
+        self.max_url_length = max_url_length
+        self.headers = headers or {}
+        self.pool = _ConnectionPool(parts.scheme, parts.netloc, pool_size, timeout)
+        self._batches: Dict[str, _Batch] = {}
+        # Validated values per target type and section, along with the ETags of the responses they were built from
+        self._validated: Dict[Tuple[Type, Path], Tuple[Tuple, List[Tuple[Path, Any]]]] = {}
+        self._lock = threading.Lock()
+
+    def _key_name(self, path: Path) -> str:
+        name = self.key_name_converter(path)
+        if self.prefix is not None:
+            name = self.prefix + name
+        return name
+
+    def _make_batches(self, keys: List[str]) -> List[_Batch]:
+        batches = []
+        current = []
+        length = len(self.base_path) + 1 + len(self.base_query)
+        for key in keys:
+            key_length = len(urlencode({"key": key})) + 1
+            if current and length + key_length > self.max_url_length:
+                batches.append(urlencode({"key": current}, doseq=True))
+                current = []
+                length = len(self.base_path) + 1 + len(self.base_query)
+            current.append(key)
+            length += key_length
+        if current:
+            batches.append(urlencode({"key": current}, doseq=True))
+        with self._lock:
+            return [self._batches.setdefault(query, _Batch(query)) for query in batches]
+
+    def _request(self, batch: _Batch) -> Tuple[bool, Optional[str], Dict[str, Any]]:
+        """
+        Fetch a batch of keys, returning whether its values changed since the last request, along with its ETag and
+        values (read together, since other threads may update the batch meanwhile)
+        """
+        with self._lock:
+            etag, values = batch.etag, batch.values
+        headers = {"Accept": "application/json", **self.headers}
+        if etag is not None:
+            headers["If-None-Match"] = etag
+        for attempt in range(2):
+            try:
+                with self.pool.connection() as connection:
+                    connection.request("GET", f"{self.base_path}?{self.base_query}{batch.query}", headers=headers)
+                    response = connection.getresponse()
+                    body = response.read()
+                break
+            except (_http_client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                if attempt == 1:  # A pooled connection may have been closed by the server, retry once with a new one
+                    raise
+        if response.status == 304:
+            return False, etag, values
+        if response.status != 200:
+            raise ConnectionError(f"unexpected status {response.status} when fetching configuration from {self.url}")
+        etag, values = response.getheader("ETag"), _json.loads(body)
+        with self._lock:
+            batch.etag, batch.values = etag, values
+        return True, etag, values
+
+    def load_configuration(self, target_type: Type, strict=False) -> Dict[str, Any]:
+        return self.load_section(target_type, (), strict)
+
+    def load_section(self, target_type: Type, path: Path, strict=False) -> Dict[str, Any]:
+        fields: Dict[str, Tuple[Path, Field]] = {}
+        for field_path, field in get_paths(get_section_type(target_type, path), path):
+            if not is_dataclass(field.type):
+                fields[self._key_name(field_path)] = field_path[len(path):], field
+        batches = self._make_batches(list(fields))
+        responses = [self._request(batch) for batch in batches]
+        etags = tuple(etag for _, etag, _ in responses)
+
+        with self._lock:
+            cached = self._validated.get((target_type, path))
+        if cached is not None and cached[0] == etags and not any(changed for changed, _, _ in responses):
+            values = cached[1]
+        else:
+            values = []
+            for _, _, batch_values in responses:
+                for key, value in batch_values.items():
+                    if key in fields:
+                        field_path, field = fields[key]
+                        values.append((field_path, validate_value(field, value)))
+            with self._lock:
+                self._validated[(target_type, path)] = etags, values
+
+        result = {}
+        for field_path, value in values:
+            insert_at_path(result, field_path, value)
+        return result
+
+    def close(self):
+        """
+        Close the connections kept alive by the provider
+        """
+        self.pool.close()
+
+
+def http(
+        url: str,
+        prefix: str = None,
+        key_name_converter: Callable[[Path], str] = None,
+        max_url_length: int = 2048,
+        pool_size: int = 4,
+        timeout: float = 10.,
+        headers: Dict[str, str] = None,
+):
+    """
+    Configure a provider that reads from an HTTP key-value store
+
+    :param url:                         the URL of the key-value store
+    :param prefix:                      the prefix to use for each key name (or None for no prefix)
+    :param key_name_converter:          the function used to generate key names from paths
+    :param max_url_length:              the maximum length of a request URL, used to split keys into batches
+    :param pool_size:                   the maximum number of idle keep-alive connections to keep
+    :param timeout:                     the timeout of each request, in seconds
+    :param headers:                     extra headers to send with each request (for example, for authentication)
+    """
+    return Http(
+        url=url,
+        prefix=prefix,
+        key_name_converter=key_name_converter,
+        max_url_length=max_url_length,
+        pool_size=pool_size,
+        timeout=timeout,
+        headers=headers,
+    )
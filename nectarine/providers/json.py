@@ -3,20 +3,14 @@ Module providing a ConfigurationProvider backed by a JSON file
 """
 
 import json as _json
+from typing import IO, Any, Dict
 
-from nectarine.providers.dictionary import Dictionary
+from nectarine.providers.file import File
 
 
-class Json(Dictionary):
-    def __init__(self, file: str, must_exist: bool = True):
-        try:
-            with open(file, 'r') as f:
-                value = _json.load(f)
-        except FileNotFoundError:
-            if must_exist:
-                raise
-            value = {}
-        super().__init__(value)
+class Json(File):
+    def parse(self, f: IO) -> Dict[str, Any]:
+        return _json.load(f)
 
 
 def json(file: str, must_exist: bool = True):
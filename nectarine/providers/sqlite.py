@@ -0,0 +1,337 @@
+"""
+Module providing a ConfigurationProvider backed by a SQLite database, for configurations too large to be parsed at once
+
+The database holds one row per value, identified by the path to the value (see path_to_key_name) and storing it as JSON,
+so that only the values needed by the target type are read, in batched queries. Each entry of a Dict field is stored in
+its own row under the path of the field (e.g. "routes/<key>"), and read with a range scan of the primary key.
+
+Every change increments a counter stored in the database and is recorded in the changed rows, removed values being kept
+as tombstones. Providers remember the counter they last read, and only read the rows changed since then. Databases are
+written with SqliteWriter.
+"""
+
+import json as _json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path as _FilePath
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Set, Tuple, Type, Union
+
+from nectarine.configuration_provider import ConfigurationProvider, Path
+from nectarine.dataclasses import Field, get_fields, get_paths, get_section_type
+from nectarine.providers.dictionary import validate_value
+from nectarine.typing import is_dataclass, is_mapping
+from nectarine._utils import insert_at_path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    path TEXT PRIMARY KEY,
+    value TEXT,
+    version INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entries_by_version ON entries (version);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO counters VALUES ('version', 0), ('compacted', 0);
+"""
+
+# Maximum number of parameters of a query, below the limit of every SQLite version
+_BATCH_SIZE = 500
+
+
+def path_to_key_name(path: Path) -> str:
+    name = '/'.join(path)
+    return name
+
+
+def _prefix_range(prefix: str) -> Tuple[str, str]:
+    # Bounds of the keys starting with a prefix ending with "/", in the order of the primary key
+    return prefix, prefix[:-1] + chr(ord('/') + 1)
+
+
+def _counters(connection: sqlite3.Connection) -> Dict[str, int]:
+    return dict(connection.execute("SELECT name, value FROM counters"))
+
+
+@contextmanager
+def _transaction(connection: sqlite3.Connection, mode: str = ""):
+    connection.execute(f"BEGIN {mode}")
+    try:
+        yield
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    connection.execute("COMMIT")
+
+
+class Sqlite(ConfigurationProvider):
+    def __init__(self, file: str, must_exist: bool = True):
+        self.file = file
+        self.must_exist = must_exist
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._version: Optional[int] = None
+        # Values read so far: exact keys (along with the keys known to be missing) and entries of Dict fields by prefix
+        self._known: Set[str] = set()
+        self._values: Dict[str, Any] = {}
+        self._prefixes: Dict[str, Dict[str, Any]] = {}
+        self._changed_at: Dict[str, int] = {}  # Version of the last change of each value read so far, by key
+        # Validated values per target type and section by key, along with the version they were read at
+        self._validated: Dict[Tuple[Type, Path], Tuple[int, Dict[str, Tuple[Path, Any]]]] = {}
+        if must_exist and not os.path.exists(file):
+            raise FileNotFoundError(f"No such database: '{file}'")
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._connection is None:
+            if not os.path.exists(self.file):
+                if self.must_exist:
+                    raise FileNotFoundError(f"No such database: '{self.file}'")
+                return None
+            uri = _FilePath(os.path.abspath(self.file)).as_uri() + "?mode=ro"
+            self._connection = sqlite3.connect(uri, uri=True, isolation_level=None, check_same_thread=False)
+        return self._connection
+
+    def _forget(self):
+        self._known.clear()
+        self._values.clear()
+        self._prefixes.clear()
+        self._changed_at.clear()
+        self._validated.clear()
+
+    def _sync(self, connection: sqlite3.Connection):
+        """
+        Update the values read so far with the rows changed since they were read
+        """
+        counters = _counters(connection)
+        version = counters['version']
+        if self._version is not None and version != self._version:
+            if counters['compacted'] > self._version:  # Tombstones of removed values may be gone
+                self._forget()
+            else:
+                rows = connection.execute("SELECT path, value FROM entries WHERE version > ?", (self._version,))
+                for key, raw in rows:
+                    value = _json.loads(raw) if raw is not None else None
+                    if key in self._known:
+                        if raw is None:
+                            self._values.pop(key, None)
+                        else:
+                            self._values[key] = value
+                        self._changed_at[key] = version
+                    for prefix, entries in self._prefixes.items():
+                        if key.startswith(prefix):
+                            if raw is None:
+                                entries.pop(key[len(prefix):], None)
+                            else:
+                                entries[key[len(prefix):]] = value
+                            self._changed_at[prefix[:-1]] = version
+        self._version = version
+
+    def _fetch(self, connection: sqlite3.Connection, keys: List[str], prefixes: List[str]):
+        keys = [key for key in keys if key not in self._known]
+        for start in range(0, len(keys), _BATCH_SIZE):
+            batch = keys[start:start + _BATCH_SIZE]
+            rows = connection.execute(
+                f"SELECT path, value FROM entries WHERE value IS NOT NULL AND path IN ({','.join('?' * len(batch))})",
+                batch,
+            )
+            for key, raw in rows:
+                self._values[key] = _json.loads(raw)
+            self._known.update(batch)
+        for prefix in prefixes:
+            if prefix not in self._prefixes:
+                rows = connection.execute(
+                    "SELECT path, value FROM entries WHERE value IS NOT NULL AND path >= ? AND path < ?",
+                    _prefix_range(prefix),
+                )
+                self._prefixes[prefix] = {key[len(prefix):]: _json.loads(raw) for key, raw in rows}
+
+    def load_configuration(self, target_type: Type, strict=False) -> Dict[str, Any]:
+        return self.load_section(target_type, (), strict)
+
+    def load_section(self, target_type: Type, path: Path, strict=False) -> Dict[str, Any]:
+        fields: Dict[str, Tuple[Path, Field]] = {}
+        for field_path, field in get_paths(get_section_type(target_type, path), path):
+            if not is_dataclass(field.type):
+                fields[path_to_key_name(field_path)] = field_path[len(path):], field
+        prefixes = [key + '/' for key, (_, field) in fields.items() if is_mapping(field.type)]
+
+        with self._lock:
+            connection = self._connect()
+            if connection is None:
+                return {}
+            with _transaction(connection):  # Read every value at the same version
+                self._sync(connection)
+                cached_version, values = self._validated.get((target_type, path), (None, {}))
+                if cached_version != self._version:
+                    self._fetch(connection, list(fields), prefixes)
+                    values = {key: v for key, v in values.items() if self._changed_at.get(key, 0) <= cached_version}
+                    for key, (field_path, field) in fields.items():
+                        if key in values:  # Unchanged since it was validated
+                            continue
+                        value = self._values.get(key)
+                        entries = self._prefixes.get(key + '/')
+                        if entries:
+                            value = {**(value if isinstance(value, dict) else {}), **entries}
+                        elif key not in self._values:
+                            continue
+                        values[key] = field_path, validate_value(field, value)
+                    self._validated[(target_type, path)] = self._version, values
+
+        result = {}
+        for field_path, value in values.values():
+            insert_at_path(result, field_path, value)
+        return result
+
+    def fingerprint(self, target_type: Type) -> Optional[Hashable]:
+        with self._lock:
+            connection = self._connect()
+            version = _counters(connection)['version'] if connection is not None else None
+        return type(self), os.path.abspath(self.file), version
+
+    def close(self):
+        """
+        Close the connection to the database
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+def _rows(target_type: Type, value: Dict[str, Any], path: Path = ()) -> Iterator[Tuple[Path, Any]]:
+    fields = {field.name: field for field in get_fields(target_type)}
+    for name, v in value.items():
+        field = fields.get(name)
+        field_path = (*path, name)
+        if field is not None and is_dataclass(field.type) and isinstance(v, dict):
+            yield from _rows(field.type, v, field_path)
+        elif field is not None and is_mapping(field.type) and isinstance(v, dict) and v:
+            for key, item in v.items():
+                yield (*field_path, key), item
+        else:
+            yield field_path, v
+
+
+class SqliteWriter:
+    """
+    Writer of the databases read by the sqlite provider
+
+    Each method applies its changes in a single transaction, incrementing the change counter once. Only the rows whose
+    value actually changed are written, so that readers only read those again.
+    """
+
+    def __init__(self, file: str):
+        """
+        :param file:                    the path to the database, created if it does not exist
+        """
+        self.file = file
+        self.connection = sqlite3.connect(file, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")  # Readers are not blocked while writing
+        self.connection.executescript(_SCHEMA)
+
+    @contextmanager
+    def _change(self) -> Iterator[int]:
+        with _transaction(self.connection, "IMMEDIATE"):
+            version = _counters(self.connection)['version'] + 1
+            yield version
+            self.connection.execute("UPDATE counters SET value = ? WHERE name = 'version'", (version,))
+
+    def _upsert(self, version: int, rows: Iterator[Tuple[str, Optional[str]]]):
+        self.connection.executemany(
+            "INSERT INTO entries (path, value, version) VALUES (?, ?, ?) "
+            "ON CONFLICT (path) DO UPDATE SET value = excluded.value, version = excluded.version "
+            "WHERE entries.value IS NOT excluded.value",
+            ((key, raw, version) for key, raw in rows),
+        )
+
+    def import_dict(self, target_type: Type, value: Dict[str, Any], replace: bool = False):
+        """
+        Import the values of a dictionary, e.g. as loaded from a JSON file
+
+        :param target_type:             the type the values will be loaded into, telling which fields are dictionaries
+                                        to be stored one entry per row
+        :param value:                   the dictionary to import
+        :param replace:                 whether or not the values missing from the dictionary should be removed
+        """
+        rows = [(path_to_key_name(path), _json.dumps(v, sort_keys=True, separators=(',', ':')))
+                for path, v in _rows(target_type, value)]
+        with self._change() as version:
+            self._upsert(version, iter(rows))
+            if replace:
+                self.connection.execute("CREATE TEMP TABLE IF NOT EXISTS imported (path TEXT PRIMARY KEY)")
+                self.connection.execute("DELETE FROM imported")
+                self.connection.executemany("INSERT INTO imported VALUES (?)", ((key,) for key, _ in rows))
+                self.connection.execute(
+                    "UPDATE entries SET value = NULL, version = ? "
+                    "WHERE value IS NOT NULL AND path NOT IN (SELECT path FROM imported)",
+                    (version,),
+                )
+
+    def import_json(self, target_type: Type, file: str, replace: bool = False):
+        """
+        Import the values of a JSON file (see import_dict)
+
+        :param target_type:             the type the values will be loaded into
+        :param file:                    the path to the JSON file
+        :param replace:                 whether or not the values missing from the file should be removed
+        """
+        with open(file, 'rb') as f:
+            self.import_dict(target_type, _json.load(f), replace)
+
+    def set(self, path: Union[Path, str], value: Any):
+        """
+        Set a single value, e.g. ("routes", "/api") for an entry of the "routes" Dict field
+
+        :param path:                    the path to the value, or its key name
+        :param value:                   the value, which must be serializable to JSON
+        """
+        key = path if isinstance(path, str) else path_to_key_name(path)
+        with self._change() as version:
+            self._upsert(version, iter([(key, _json.dumps(value, sort_keys=True, separators=(',', ':')))]))
+
+    def delete(self, path: Union[Path, str]):
+        """
+        Remove a single value, or every entry of a Dict field
+
+        :param path:                    the path to the value, or its key name
+        """
+        key = path if isinstance(path, str) else path_to_key_name(path)
+        with self._change() as version:
+            self.connection.execute(
+                "UPDATE entries SET value = NULL, version = ? "
+                "WHERE value IS NOT NULL AND (path = ? OR (path >= ? AND path < ?))",
+                (version, key, *_prefix_range(key + '/')),
+            )
+
+    def compact(self):
+        """
+        Remove the tombstones of removed values, making providers that read an older version read every value again
+        """
+        with self._change() as version:
+            self.connection.execute("DELETE FROM entries WHERE value IS NULL")
+            self.connection.execute("UPDATE counters SET value = ? WHERE name = 'compacted'", (version,))
+
+    def close(self):
+        """
+        Close the connection to the database
+        """
+        self.connection.close()
+
+    def __enter__(self) -> 'SqliteWriter':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def sqlite(file: str, must_exist: bool = True):
+    """
+    Configure a provider that reads from a SQLite database written by SqliteWriter
+
+    :param file:                        the path to the database
+    :param must_exist:                  whether or not the database must exist
+    """
+    return Sqlite(file, must_exist)
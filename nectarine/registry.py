@@ -0,0 +1,95 @@
+"""
+Module providing a registry of the available providers, which are only imported when they are first requested
+"""
+
+from importlib import import_module
+from typing import Callable, Dict, List
+
+from nectarine.configuration_provider import ConfigurationProvider
+
+ENTRY_POINT_GROUP = "nectarine.providers"
+
+ProviderFactory = Callable[..., ConfigurationProvider]
+
+# Providers shipped with Nectarine, as "module:attribute" references that are resolved on first use
+BUILTIN_PROVIDERS = {
+    "arguments": "nectarine.providers.arguments:arguments",
+    "bundle": "nectarine.providers.bundle:bundle",
+    "compiled": "nectarine.providers.compiled:compiled",
+    "dictionary": "nectarine.providers.dictionary:dictionary",
+    "directory": "nectarine.providers.directory:directory",
+    "env": "nectarine.providers.env:env",
+    "http": "nectarine.providers.http:http",
+    "json": "nectarine.providers.json:json",
+    "sqlite": "nectarine.providers.sqlite:sqlite",
+    "yaml": "nectarine.extensions.yaml:yaml",
+}
+
+_loaded: Dict[str, ProviderFactory] = {}
+
+
+def _resolve(reference: str):
+    module_name, _, attribute = reference.partition(':')
+    return getattr(import_module(module_name), attribute)
+
+
+def _entry_points() -> List:
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        # The current Python version does not support importlib.metadata, only built-in providers are available
+        return []
+    eps = entry_points()
+    if hasattr(eps, "select"):
+        return list(eps.select(group=ENTRY_POINT_GROUP))
+    return list(eps.get(ENTRY_POINT_GROUP, ()))
+
+
+def _find_entry_point(name: str):
+    for entry_point in _entry_points():
+        if entry_point.name == name:
+            return entry_point
+    return None
+
+
+def available_providers() -> List[str]:
+    """
+    Retrieve the names of the available providers, including the ones registered through entry points
+    """
+    names = set(BUILTIN_PROVIDERS)
+    names.update(entry_point.name for entry_point in _entry_points())
+    return sorted(names)
+
+
+def get_provider(name: str) -> ProviderFactory:
+    """
+    Retrieve the factory of a provider by name, importing its module if needed
+
+    Built-in providers are looked up first, then providers registered under the "nectarine.providers" entry point
+    group.
+
+    :param name:                        the name of the provider
+    """
+    factory = _loaded.get(name)
+    if factory is not None:
+        return factory
+    reference = BUILTIN_PROVIDERS.get(name)
+    if reference is not None:
+        factory = _resolve(reference)
+    else:
+        entry_point = _find_entry_point(name)
+        if entry_point is None:
+            raise LookupError(f"unknown provider '{name}'")
+        factory = entry_point.load()
+    _loaded[name] = factory
+    return factory
+
+
+def register_provider(name: str, factory: ProviderFactory):
+    """
+    Register a provider factory under a given name, taking precedence over built-in and entry point providers
+
+    :param name:                        the name of the provider
+    :param factory:                     the factory used to configure the provider
+    """
+    _loaded[name] = factory
@@ -0,0 +1,105 @@
+"""
+Module providing a way to reload a configuration while reusing the parts of the previous instance that did not change
+"""
+
+from dataclasses import dataclass, fields
+from typing import Any, List
+
+from nectarine import load
+from nectarine.configuration_provider import ConfigurationProvider, Path
+from nectarine.deduplication import Deduplicator
+from nectarine.merging import MergeStrategies
+from nectarine.typing import is_dataclass
+
+
+@dataclass
+class ReloadResult:
+    """
+    Class representing the result of a reload
+    """
+
+    config: Any
+    changes: List[Path]
+
+    def has_changed(self, path: Path = ()) -> bool:
+        """
+        Check whether the value at a given path changed, i.e. a change happened at, below or above that path
+
+        :param path:                    the path to check (default is the root of the configuration)
+        """
+        path = tuple(path)
+        for change in self.changes:
+            length = min(len(change), len(path))
+            if change[:length] == path[:length]:
+                return True
+        return False
+
+
+def _share(old, new, path: Path, changes: List[Path]):
+    """
+    Compare two values, recording the paths that differ and returning the value to use in the new configuration
+
+    Unchanged values are taken from the previous configuration, so that identity checks can be used by consumers.
+    Since the new configuration was just created and is not visible to anyone yet, it is updated in place.
+    """
+    if old is new:
+        return old
+    if type(old) is not type(new):
+        changes.append(path)
+        return new
+    if is_dataclass(type(new)):
+        unchanged = True
+        for field in fields(new):
+            old_value = getattr(old, field.name)
+            value = _share(old_value, getattr(new, field.name), (*path, field.name), changes)
+            object.__setattr__(new, field.name, value)
+            unchanged = unchanged and value is old_value
+        return old if unchanged else new
+    if isinstance(new, dict):
+        unchanged = len(old) == len(new)
+        for key, value in new.items():
+            if key in old:
+                new[key] = _share(old[key], value, (*path, key), changes)
+                unchanged = unchanged and new[key] is old[key]
+            else:
+                changes.append((*path, key))
+                unchanged = False
+        changes.extend((*path, key) for key in old if key not in new)
+        return old if unchanged else new
+    if isinstance(new, list) and len(old) == len(new):
+        item_changes = []
+        for i, value in enumerate(new):
+            new[i] = _share(old[i], value, path, item_changes)
+        if not item_changes:
+            return old
+        changes.append(path)
+        return new
+    if old == new:
+        return old
+    changes.append(path)
+    return new
+
+
+def reload(
+        previous,
+        providers: List[ConfigurationProvider],
+        strict: bool = False,
+        deduplicator: Deduplicator = None,
+        merge: MergeStrategies = None,
+) -> ReloadResult:
+    """
+    Load a new instance of a configuration, reusing the unchanged parts of the previous one
+
+    The returned result holds the new configuration, in which every unchanged sub-object is the one from the previous
+    configuration, and the list of paths whose value changed.
+
+    :param previous:                    the previously loaded configuration
+    :param providers:                   the list of providers to use, in order of priority
+    :param strict:                      activate strict mode (reject extra values, ...)
+    :param deduplicator:                the deduplicator used to share repeated values (or None to disable sharing)
+    :param merge:                       the merge strategies (see load)
+    """
+    config = load(type(previous), providers, strict=strict, deduplicator=deduplicator, merge=merge)
+    changes = []
+    config = _share(previous, config, (), changes)
+    return ReloadResult(config=config, changes=changes)
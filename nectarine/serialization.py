@@ -0,0 +1,223 @@
+"""
+Module providing the reverse of loading: dumping a configuration back to the formats read by providers
+
+Each output round-trips through the matching provider: to_dict through dictionary, to_json through json, to_env
+through env and to_argv through arguments. Values of custom types are dumped with the "dump" function of their
+converter (see nectarine.converters).
+"""
+
+import json as _json
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+from nectarine.columnar import Columnar
+from nectarine.configuration_provider import Path
+from nectarine.converters import converters, find_converter
+from nectarine.dataclasses import Field, get_fields, get_paths
+from nectarine.providers.arguments import is_supported_type as is_argument_type, path_to_flag_name
+from nectarine.providers.env import Env, path_to_variable_name
+from nectarine.typing import get_generic_args, get_origin, is_columnar, is_dataclass, is_generic_collection, \
+    is_literal, is_optional, is_primitive, is_tuple, is_tuple_of_unknown_length, is_union
+from nectarine._utils import cached_per_hint
+
+Dumper = Callable[[Any], Any]
+
+_SCALARS = (str, int, float, bool, type(None))
+
+
+def _dump_any(value):
+    """
+    Dump a value according to its actual type, for values whose type hint does not say enough (Any, Union, ...)
+    """
+    type_ = type(value)
+    if type_ in _SCALARS:
+        return value
+    if isinstance(value, dict):
+        return {_dump_any(k): _dump_any(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return type_(map(_dump_any, value))
+    if isinstance(value, Columnar):
+        dump_row = compile_dumper(value.row_type)
+        return [dump_row(row) for row in value]
+    return compile_dumper(type_)(value)
+
+
+@cached_per_hint
+def compile_dumper(hint: Type) -> Dumper:
+    """
+    Retrieve a function converting values of a given type to plain Python values (dictionaries, lists, strings, ...)
+
+    The type is only interpreted once: the resulting function is cached, and so are the ones it is built from.
+
+    :param hint:                        the type of the values
+    """
+    if hint is Any or (is_union(hint) and not is_optional(hint)):
+        return _dump_any
+    if is_optional(hint):
+        dump = compile_dumper(get_generic_args(hint)[0])
+        return lambda value: None if value is None else dump(value)
+    if is_dataclass(hint):
+        return _compile_dataclass_dumper(hint)
+    if is_columnar(hint):
+        dump_row = compile_dumper(get_generic_args(hint)[0])
+        return lambda value: [dump_row(row) for row in value]
+    if is_generic_collection(hint):
+        origin = get_origin(hint)
+        args = get_generic_args(hint)
+        if issubclass(origin, dict):
+            dump_key, dump_value = compile_dumper(args[0]), compile_dumper(args[1])
+            return lambda value: {dump_key(k): dump_value(v) for k, v in value.items()}
+        if is_tuple(hint) and not is_tuple_of_unknown_length(hint):
+            dumps = tuple(compile_dumper(arg) for arg in args)
+            return lambda value: tuple(dump(v) for dump, v in zip(dumps, value))
+        dump_item = compile_dumper(args[0])
+        return lambda value: type(value)(map(dump_item, value))
+    if is_literal(hint) or is_primitive(hint):
+        return lambda value: value
+    converter = find_converter(hint)
+    if converter is not None:
+        return converter.dump
+    return _dump_any if hint in (dict, list, tuple, set, frozenset) else lambda value: value
+
+
+converters.on_change(compile_dumper.cache_clear)
+
+
+def _compile_dataclass_dumper(type_: Type) -> Dumper:
+    # Fields are only inspected on first use, so that recursive dataclasses do not lead to an infinite recursion
+    fields: List[Tuple[str, Dumper]] = []
+    compiled = False
+
+    def dump_dataclass(value):
+        nonlocal compiled
+        if not compiled:
+            fields.extend((field.name, compile_dumper(field.type)) for field in get_fields(type_))
+            compiled = True
+        return {name: dump(getattr(value, name)) for name, dump in fields}
+
+    return dump_dataclass
+
+
+def to_dict(config) -> Dict[str, Any]:
+    """
+    Convert a configuration to a dictionary of plain values, which can be loaded back with the dictionary provider
+
+    :param config:                      the configuration, as returned by load
+    """
+    return compile_dumper(type(config))(config)
+
+
+def _json_default(value):
+    # Called by the JSON encoder for the values it does not support natively, dumping them one level at a time
+    if is_dataclass(type(value)):
+        return {field.name: getattr(value, field.name) for field in get_fields(type(value))}
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, Columnar):
+        return [row._asdict() for row in value]
+    converter = find_converter(type(value))
+    if converter is not None:
+        return converter.dump(value)
+    raise TypeError(f"cannot dump a value of type '{type(value).__name__}' to JSON")
+
+
+def to_json(config) -> bytes:
+    """
+    Convert a configuration to a JSON document, which can be loaded back with the json provider
+
+    The configuration is encoded in a single pass, nested values being handed to the encoder as they are.
+
+    :param config:                      the configuration, as returned by load
+    """
+    return _json.dumps(config, default=_json_default, separators=(',', ':')).encode()
+
+
+def _get_at_path(config, path: Path):
+    value = config
+    for name in path:
+        if value is None:
+            return None
+        value = getattr(value, name)
+    return value
+
+
+@cached_per_hint
+def _leaf_paths(type_: Type) -> Tuple[Tuple[Path, Field], ...]:
+    return tuple((path, field) for path, field in get_paths(type_) if not is_dataclass(field.type))
+
+
+def _format(value, type_: Type) -> str:
+    if type_ is bool or type(value) is bool:
+        return "true" if value else "false"
+    if is_primitive(type(value)):
+        return str(value)
+    dump = compile_dumper(type_)(value)
+    return dump if isinstance(dump, str) else str(dump)
+
+
+def to_env(
+        config,
+        prefix: str = None,
+        allow_lists: bool = False,
+        list_separator: str = ',',
+        variable_name_converter: Callable[[Path], str] = None,
+) -> Dict[str, str]:
+    """
+    Convert a configuration to environment variables, which can be loaded back with the env provider configured with
+    the same parameters (only the values of the types supported by the env provider are converted)
+
+    :param config:                      the configuration, as returned by load
+    :param prefix:                      the prefix to use for each environment variable name (or None for no prefix)
+    :param allow_lists:                 whether or not lists should be converted to environment variables
+    :param list_separator:              the separator to use to join values when converting lists
+    :param variable_name_converter:     the function used to generate variable names from paths
+    """
+    provider = Env(allow_lists=allow_lists)
+    variable_name_converter = variable_name_converter or path_to_variable_name
+    result = {}
+    for path, field in _leaf_paths(type(config)):
+        if not provider.is_supported_type(field.type):
+            continue
+        value = _get_at_path(config, path)
+        if value is None:
+            continue
+        if is_generic_collection(field.type):
+            args = get_generic_args(field.type)
+            types = [args[0]] * len(value) if len(args) == 1 or is_tuple_of_unknown_length(field.type) else args
+            text = list_separator.join(_format(v, t) for v, t in zip(value, types))
+        else:
+            text = _format(value, field.type)
+        name = variable_name_converter(path)
+        result[prefix + name if prefix is not None else name] = text
+    return result
+
+
+def to_argv(config, flag_name_converter: Callable[[Path], str] = None) -> List[str]:
+    """
+    Convert a configuration to program arguments, which can be loaded back with the arguments provider (only the values
+    of the types supported by the arguments provider are converted, and false booleans are left out since flags can
+    only set them)
+
+    :param config:                      the configuration, as returned by load
+    :param flag_name_converter:         the function used to generate flag names from paths
+    """
+    flag_name_converter = flag_name_converter or path_to_flag_name
+    argv = []
+    for path, field in _leaf_paths(type(config)):
+        if not is_argument_type(field.type):
+            continue
+        value = _get_at_path(config, path)
+        if value is None or value is False:
+            continue
+        flag = f"--{flag_name_converter(path)}"
+        if field.type is bool:
+            argv.append(flag)
+        elif is_tuple(field.type) and not is_tuple_of_unknown_length(field.type):
+            argv.append(flag)
+            argv.extend(_format(v, t) for v, t in zip(value, get_generic_args(field.type)))
+        elif is_generic_collection(field.type):
+            item_type = get_generic_args(field.type)[0]
+            for item in value:
+                argv.extend((flag, _format(item, item_type)))
+        else:
+            argv.extend((flag, _format(value, field.type)))
+    return argv
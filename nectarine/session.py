@@ -0,0 +1,79 @@
+"""
+Module providing sessions, which load several target types from the same providers while reading each source once
+"""
+
+from typing import Any, Dict, List, Type
+
+from nectarine import load
+from nectarine.configuration_provider import ConfigurationProvider
+from nectarine.deduplication import Deduplicator
+from nectarine.errors import NectarineLateRegistrationError
+from nectarine.merging import MergeStrategies
+
+
+class Session:
+    """
+    Class loading several target types from a shared snapshot of the providers' data
+
+    Sources are captured on the first load, for every registered target type at once: the program arguments, for
+    example, are parsed a single time with the flags of all the targets. Target types must therefore be registered
+    before that first load.
+    """
+
+    def __init__(
+            self,
+            providers: List[ConfigurationProvider],
+            strict: bool = False,
+            deduplicator: Deduplicator = None,
+            merge: MergeStrategies = None,
+    ):
+        self.providers = providers
+        self.strict = strict
+        self.deduplicator = deduplicator
+        self.merge = merge
+        self.targets: List[Type] = []
+        self._snapshots = None
+        self._configs: Dict[Type, Any] = {}
+
+    def register(self, *targets: Type) -> 'Session':
+        """
+        Register target types to be loaded from the session
+
+        :param targets:                 the target dataclass types
+        """
+        for target in targets:
+            if target in self.targets:
+                continue
+            if self._snapshots is not None:
+                raise NectarineLateRegistrationError(target)
+            self.targets.append(target)
+        return self
+
+    def snapshot(self) -> List[ConfigurationProvider]:
+        """
+        Capture the data of every provider, if not done already, and retrieve the resulting providers
+        """
+        if self._snapshots is None:
+            self._snapshots = [provider.snapshot(self.targets) for provider in self.providers]
+        return self._snapshots
+
+    def load(self, target: Type):
+        """
+        Load an instance of a target type, registering the type first if needed
+
+        Instances are cached, so loading the same type twice returns the same instance.
+
+        :param target:                  the target dataclass type
+        """
+        config = self._configs.get(target)
+        if config is None:
+            self.register(target)
+            config = load(
+                target,
+                self.snapshot(),
+                strict=self.strict,
+                deduplicator=self.deduplicator,
+                merge=self.merge,
+            )
+            self._configs[target] = config
+        return config
@@ -0,0 +1,95 @@
+"""
+Module providing a way to load a stream of records (JSON Lines, multi-document YAML) one record at a time
+"""
+
+from dataclasses import dataclass
+import json as _json
+from typing import IO, Any, Dict, Iterable, Iterator, List, Literal, Type, Union
+
+from nectarine.dataclasses import dataclass_from_dict, get_paths
+from nectarine.deduplication import Deduplicator
+from nectarine.errors import NectarineError, NectarineInvalidValueError
+from nectarine.providers.dictionary import extract_configuration
+
+
+@dataclass
+class RecordError:
+    """
+    Class representing an error that occurred while loading a record of a stream
+    """
+
+    index: int
+    error: Exception
+
+
+def _jsonl_records(stream: Iterable[Union[str, bytes]]) -> Iterator[Any]:
+    for line in stream:
+        if line.strip():
+            try:
+                yield _json.loads(line)
+            except ValueError as e:  # Yielded in place of the record, so that the stream can go on
+                yield e
+
+
+def _yaml_records(stream: Union[IO, str]) -> Iterator[Any]:
+    import yaml  # Only needed for YAML streams, and an optional dependency
+
+    try:
+        yield from yaml.safe_load_all(stream)
+    except yaml.YAMLError as e:  # Yielded in place of the record, the parser cannot resume after it
+        yield e
+
+
+_READERS = {
+    "jsonl": _jsonl_records,
+    "yaml": _yaml_records,
+}
+
+
+def iter_load(
+        target: Type,
+        stream: Union[IO, Iterable[str]],
+        format: Literal["jsonl", "yaml"] = "jsonl",
+        strict: bool = False,
+        deduplicator: Deduplicator = None,
+        errors: List[RecordError] = None,
+) -> Iterator[Any]:
+    """
+    Load dataclass instances from a stream of records, yielding them one at a time
+
+    Records are read and validated lazily, so that memory use does not depend on the length of the stream. By default,
+    the first invalid record raises an error; when a list is given as errors, invalid records are recorded in it and
+    skipped instead (a malformed YAML document is recorded too, but it ends the stream since the parser cannot resume
+    after it).
+
+    :param target:                      the target dataclass type
+    :param stream:                      the stream to read, e.g. an open file (JSON Lines can also be any iterable of
+                                        lines)
+    :param format:                      the format of the stream: "jsonl" (one JSON document per line) or "yaml"
+                                        (documents separated by "---")
+    :param strict:                      activate strict mode (reject extra values, ...)
+    :param deduplicator:                the deduplicator used to share repeated values (or None to disable sharing)
+    :param errors:                      the list to record invalid records in (or None to raise on the first one)
+    """
+    try:
+        read = _READERS[format]
+    except KeyError:
+        raise ValueError(f"unsupported stream format '{format}', expected one of {', '.join(_READERS)}") from None
+    paths = dict(get_paths(target))  # Analyzed once for the whole stream
+    for index, record in enumerate(read(stream)):
+        if isinstance(record, Exception):  # The record could not be parsed
+            if errors is None:
+                raise record
+            errors.append(RecordError(index, record))
+            continue
+        try:
+            if not isinstance(record, dict):
+                raise NectarineInvalidValueError(target, record)
+            value: Dict[str, Any] = extract_configuration(paths, record, strict)
+            config = dataclass_from_dict(target, value, deduplicator)
+        except (NectarineError, ValueError, TypeError, KeyError, AttributeError) as e:  # Raised by custom converters
+            if errors is None:
+                raise
+            errors.append(RecordError(index, e))
+            continue
+        yield config
@@ -2,8 +2,9 @@
 Module providing typing utilities on top of those from the typing module
 """
 
-from inspect import getattr_static
-from typing import Any, Collection, Dict, FrozenSet, List, Literal, Mapping, Set, Tuple, Type, Union
+from typing import Any, Callable, Collection, Dict, FrozenSet, List, Literal, Mapping, Set, Tuple, Type, Union
+
+from nectarine._utils import cached_per_hint
 
 try:
     from typing import get_args, get_origin
@@ -152,14 +153,29 @@ def is_literal(type_: Type) -> bool:
     return is_generic(type_) and get_origin(type_) is Literal
 
 
+def is_columnar(type_: Type) -> bool:
+    """
+    Check whether a type is a columnar container, i.e. it is of the form Columnar[T] (see nectarine.columnar)
+
+    :param type_:                       the type to check
+    """
+    return is_generic(type_) and getattr(get_origin(type_), '__columnar__', False) is True
+
+
+def _find_converter(type_: Type):
+    from nectarine.converters import find_converter  # Imported on first use, to keep importing this module cheap
+
+    return find_converter(type_)
+
+
 def is_parsable(type_: Type) -> bool:
     """
-    Check whether a type is parsable from a string, i.e. it has a static "parse" method
+    Check whether a type can be converted from a raw value, i.e. it has a static "parse" method or a registered
+    converter (see nectarine.converters)
 
     :param type_:                       the type to check
     """
-    parse = getattr_static(type_, "parse", None)
-    return isinstance(parse, staticmethod)
+    return _find_converter(type_) is not None
 
 
 def is_conform_to_hint(value, hint: Type) -> bool:
@@ -167,42 +183,78 @@ def is_conform_to_hint(value, hint: Type) -> bool:
     Check whether a value can satisfy a given type hint
 
     :param value:                       the value
+    :param hint:                        the type hint
+    """
+    return compile_validator(hint)(value)
+
+
+Validator = Callable[[Any], bool]
+
+
+@cached_per_hint
+def compile_validator(hint: Type) -> Validator:
+    """
+    Retrieve a function checking whether a value can satisfy a given type hint
+
+    The hint is only interpreted once: the resulting function is cached, and so are the ones it is built from.
+
     :param hint:                        the type hint
     """
     if hint is Any:
-        return True
+        return lambda value: True
     if is_optional(hint):
-        arg = get_generic_args(hint)[0]
-        return value is None or is_conform_to_hint(value, arg)
+        check = compile_validator(get_generic_args(hint)[0])
+        return lambda value: value is None or check(value)
     if is_union(hint):
-        allowed_types = get_generic_args(hint)
-        return any(is_conform_to_hint(value, allowed_type) for allowed_type in allowed_types)
+        checks = tuple(compile_validator(allowed_type) for allowed_type in get_generic_args(hint))
+        return lambda value: any(check(value) for check in checks)
+    if is_columnar(hint):  # Columnar containers are loaded from lists
+        check = compile_validator(get_generic_args(hint)[0])
+        return lambda value: isinstance(value, list) and all(map(check, value))
     if is_generic_collection(hint):
         origin = get_origin(hint)
-        if not isinstance(value, origin):
-            return False
         args = get_generic_args(hint)
         if issubclass(origin, Mapping):
-            key_type = args[0]
-            value_type = args[1]
-            return all(is_conform_to_hint(k, key_type) and is_conform_to_hint(v, value_type) for k, v in value.items())
+            check_key = compile_validator(args[0])
+            check_value = compile_validator(args[1])
+            return lambda value: isinstance(value, origin) and \
+                all(check_key(k) and check_value(v) for k, v in value.items())
         if origin is tuple:
             if is_tuple_of_unknown_length(hint):
-                value_type = args[1]
-                return all(is_conform_to_hint(v, value_type) for v in value)
-            else:
-                return len(args) == len(value) and all(is_conform_to_hint(v, h) for v, h in zip(value, args))
+                check = compile_validator(args[0])
+                return lambda value: isinstance(value, tuple) and all(map(check, value))
+            checks = tuple(compile_validator(arg) for arg in args)
+            return lambda value: isinstance(value, tuple) and len(value) == len(checks) and \
+                all(check(v) for check, v in zip(checks, value))
         assert len(args) == 1
-        value_type = args[0]
-        return all(is_conform_to_hint(v, value_type) for v in value)
+        check = compile_validator(args[0])
+        return lambda value: isinstance(value, origin) and all(map(check, value))
     if is_literal(hint):
-        args = get_generic_args(hint)
-        return value in args
+        return _compile_literal_validator(get_generic_args(hint))
     if hint is float:
-        return isinstance(value, (int, float))
-    if is_dataclass(hint) and isinstance(value, dict):
-        return True
-    return isinstance(value, hint)
+        return lambda value: isinstance(value, (int, float))
+    if is_dataclass(hint):
+        return lambda value: isinstance(value, (dict, hint))
+    converter = _find_converter(hint)
+    if converter is not None:  # Raw values are accepted, they are converted when building the configuration
+        accepted = (hint, *converter.accepts)
+        return lambda value: isinstance(value, accepted)
+    return lambda value: isinstance(value, hint)
+
+
+def _compile_literal_validator(allowed_values: Tuple) -> Validator:
+    try:
+        allowed_set = frozenset(allowed_values)
+    except TypeError:  # Some allowed values are not hashable, fall back to a linear scan
+        return lambda value: value in allowed_values
+
+    def check(value) -> bool:
+        try:
+            return value in allowed_set
+        except TypeError:  # Unhashable values cannot be equal to any of the (hashable) allowed values
+            return False
+
+    return check
 
 
 def hintify(type_: Type) -> Type:
@@ -23,6 +23,9 @@ setuptools.setup(
     extras_require={
         "yaml": yaml_dependencies,
     },
+    entry_points={
+        "console_scripts": ["nectarine = nectarine.__main__:main"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
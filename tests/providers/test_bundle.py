@@ -0,0 +1,118 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+import io
+import json
+import os
+import tarfile
+import zipfile
+
+import pytest
+
+from nectarine.errors import NectarineStrictLoadingError
+from nectarine.providers import bundle as bundle_module
+from nectarine.providers.bundle import bundle
+
+
+@dataclass
+class Database:
+    host: str
+    port: int
+
+
+@dataclass
+class Config:
+    database: Database
+    debug: bool
+
+
+def write_zip(path, members):
+    with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+
+
+def write_tar(path, members):
+    with tarfile.open(path, 'w:gz') as archive:
+        for name, content in members.items():
+            data = content.encode()
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+
+
+MEMBERS = {
+    "database.yaml": "host: localhost\nport: 5432\n",
+    "debug.json": "true",
+    "unrelated.json": "not even json",
+}
+
+
+@pytest.mark.parametrize("write", [write_zip, write_tar])
+def test_sections(tmp_path, write):
+    write(tmp_path / "bundle", MEMBERS)
+    provider = bundle(str(tmp_path / "bundle"))
+
+    assert provider.load_configuration(Config) == {"database": {"host": "localhost", "port": 5432}, "debug": True}
+
+
+def test_root(tmp_path):
+    write_zip(tmp_path / "bundle.zip", {
+        "v2/database.json": json.dumps({"host": "db", "port": 1}),
+        "database.json": json.dumps({"host": "other", "port": 2}),
+    })
+    provider = bundle(str(tmp_path / "bundle.zip"), root="v2")
+
+    assert provider.load_configuration(Config) == {"database": {"host": "db", "port": 1}}
+
+
+def test_strict(tmp_path):
+    write_zip(tmp_path / "bundle.zip", MEMBERS)
+    provider = bundle(str(tmp_path / "bundle.zip"))
+
+    with pytest.raises(NectarineStrictLoadingError):
+        provider.load_configuration(Config, strict=True)
+
+
+def test_only_needed_members_are_parsed(tmp_path, monkeypatch):
+    monkeypatch.setattr(bundle_module, "_parsed", OrderedDict())  # Bundles parsed by other tests
+    write_zip(tmp_path / "bundle.zip", MEMBERS)
+    parsed = []
+    parse = bundle_module.Bundle._parse
+    monkeypatch.setattr(bundle_module.Bundle, "_parse", lambda self, archive, name: parsed.append(name) or parse(
+        self, archive, name))
+    provider = bundle(str(tmp_path / "bundle.zip"))
+    provider.load_configuration(Config)
+
+    assert sorted(parsed) == ["database.yaml", "debug.json"]
+
+    # An identical bundle deployed again is not parsed again, even by another provider
+    write_zip(tmp_path / "copy.zip", MEMBERS)
+    os.replace(tmp_path / "copy.zip", tmp_path / "bundle.zip")
+    parsed.clear()
+    assert bundle(str(tmp_path / "bundle.zip")).load_configuration(Config)["debug"] is True
+    assert parsed == []
+
+
+def test_changed_bundle(tmp_path):
+    write_zip(tmp_path / "bundle.zip", MEMBERS)
+    provider = bundle(str(tmp_path / "bundle.zip"))
+    fingerprint = provider.fingerprint(Config)
+    provider.load_configuration(Config)
+    write_zip(tmp_path / "bundle.zip", {**MEMBERS, "debug.json": "false"})
+
+    assert provider.load_configuration(Config)["debug"] is False
+    assert provider.fingerprint(Config) != fingerprint
+
+
+def test_missing_bundle(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        bundle(str(tmp_path / "missing.zip"))
+    assert bundle(str(tmp_path / "missing.zip"), must_exist=False).load_configuration(Config) == {}
+
+
+def test_section(tmp_path, monkeypatch):
+    monkeypatch.setattr(bundle_module, "_parsed", OrderedDict())
+    write_zip(tmp_path / "bundle.zip", {**MEMBERS, "debug.json": "not even json"})
+    provider = bundle(str(tmp_path / "bundle.zip"))
+
+    assert provider.load_section(Config, ("database",)) == {"host": "localhost", "port": 5432}
@@ -0,0 +1,81 @@
+from dataclasses import dataclass
+import os
+from typing import List
+
+from nectarine import ConfigCache
+from nectarine.providers.directory import directory
+
+
+@dataclass
+class SimpleDataclass:
+    option_a: str
+    option_b: int
+
+
+@dataclass
+class NestedDataclass:
+    nested: SimpleDataclass
+    values: List[int]
+
+
+def write_volume(root, version, files):
+    """
+    Write files the way Kubernetes does for mounted ConfigMaps, by swapping a "..data" symbolic link
+    """
+    data_dir = root / f"..{version}"
+    data_dir.mkdir()
+    for name, content in files.items():
+        (data_dir / name).write_text(content)
+    os.symlink(data_dir.name, root / "..data_tmp")
+    os.replace(root / "..data_tmp", root / "..data")
+    for name in files:
+        if not (root / name).is_symlink():
+            os.symlink(f"..data/{name}", root / name)
+
+
+def test_simple_dataclass(tmp_path):
+    (tmp_path / "option_a").write_text("test\n")
+    (tmp_path / "option_b").write_text("123")
+    (tmp_path / "unrelated").write_text("nope")
+    provider = directory(str(tmp_path))
+    config = provider.load_configuration(SimpleDataclass)
+
+    assert config == {"option_a": "test", "option_b": 123}
+
+
+def test_nested_dataclass(tmp_path):
+    (tmp_path / "app.nested.option_a").write_text("test")
+    (tmp_path / "app.values").write_text("1,2,3")
+    provider = directory(str(tmp_path), prefix="app.", allow_lists=True)
+    config = provider.load_configuration(NestedDataclass)
+
+    assert config == {"nested": {"option_a": "test"}, "values": [1, 2, 3]}
+
+
+def test_missing_directory(tmp_path):
+    provider = directory(str(tmp_path / "missing"), must_exist=False)
+    assert provider.load_configuration(SimpleDataclass) == {}
+
+
+def test_data_link_swap(tmp_path):
+    write_volume(tmp_path, 1, {"option_a": "test", "option_b": "123"})
+    provider = directory(str(tmp_path))
+    first = provider.load_configuration(SimpleDataclass)
+    assert first == {"option_a": "test", "option_b": 123}
+    cached_a = provider._files["option_a"]
+
+    write_volume(tmp_path, 2, {"option_a": "test", "option_b": "456"})
+    second = provider.load_configuration(SimpleDataclass)
+    assert second == {"option_a": "test", "option_b": 456}
+    assert provider._files["option_a"] is cached_a
+
+
+def test_fingerprint_depends_on_the_prefix(tmp_path):
+    write_volume(tmp_path, 1, {"a.option_a": "one", "b.option_a": "two", "option_b": "1"})
+    first, second = directory(str(tmp_path), prefix="a."), directory(str(tmp_path), prefix="b.")
+    assert first.fingerprint(SimpleDataclass) != second.fingerprint(SimpleDataclass)
+
+    cache = ConfigCache()
+    names = [cache.get(SimpleDataclass, [directory(str(tmp_path), prefix=prefix), directory(str(tmp_path))]).option_a
+             for prefix in ("a.", "b.")]
+    assert names == ["one", "two"]
@@ -1,8 +1,11 @@
 from contextlib import contextmanager
 from dataclasses import dataclass
 import os
-from typing import List, Tuple
+from typing import List, Literal, Tuple
 
+import pytest
+
+from nectarine.errors import NectarineInvalidValueError
 from nectarine.providers.env import env
 
 
@@ -73,3 +76,21 @@ def test_dataclass_with_list_without_allowing():
         config = provider.load_configuration(DataclassWithList)
         assert len(config) == 1  # lists are ignored
         assert config["opt"] == 1
+
+
+@dataclass
+class DataclassWithLiterals:
+    region: Literal["eu-west-1", "us-east-1"]
+    level: Literal[1, 2, 3]
+
+
+def test_dataclass_with_literals():
+    with push_env(REGION="us-east-1", LEVEL="02"):
+        provider = env()
+        config = provider.load_configuration(DataclassWithLiterals)
+        assert config["region"] == "us-east-1"
+        assert config["level"] == 2
+
+    with push_env(REGION="eu-west-2", LEVEL="1"):
+        with pytest.raises(NectarineInvalidValueError):
+            env().load_configuration(DataclassWithLiterals)
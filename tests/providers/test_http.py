@@ -0,0 +1,131 @@
+from dataclasses import dataclass
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+from typing import List
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from nectarine.errors import NectarineInvalidValueError
+from nectarine.providers.http import http
+
+
+class KeyValueStore(ThreadingHTTPServer):
+    def __init__(self, values):
+        super().__init__(("127.0.0.1", 0), KeyValueHandler)
+        self.values = values
+        self.version = 1
+        self.requests = []
+        self.datacenters = []
+        self.statuses = []
+        self.connections = set()
+
+
+class KeyValueHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        query = parse_qs(urlsplit(self.path).query)
+        keys = query["key"]
+        self.server.requests.append(keys)
+        self.server.datacenters.append(query.get("dc"))
+        self.server.connections.add(self.client_address)
+        etag = f'"{self.server.version}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.server.statuses.append(304)
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps({k: self.server.values[k] for k in keys if k in self.server.values}).encode()
+        self.server.statuses.append(200)
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def store():
+    server = KeyValueStore({})
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@dataclass
+class SimpleDataclass:
+    option_a: str
+    option_b: int
+
+
+@dataclass
+class NestedDataclass:
+    nested: SimpleDataclass
+    values: List[int]
+
+
+def test_simple_dataclass(store):
+    store.values.update({"option_a": "test", "option_b": 123, "unrelated": "nope"})
+    provider = http(f"http://127.0.0.1:{store.server_port}/kv")
+    config = provider.load_configuration(SimpleDataclass)
+
+    assert config == {"option_a": "test", "option_b": 123}
+    assert store.requests == [["option_a", "option_b"]]
+
+
+def test_nested_dataclass(store):
+    store.values.update({"app/nested/option_a": "test", "app/values": [1, 2, 3]})
+    provider = http(f"http://127.0.0.1:{store.server_port}/kv", prefix="app/")
+    config = provider.load_configuration(NestedDataclass)
+
+    assert config == {"nested": {"option_a": "test"}, "values": [1, 2, 3]}
+
+
+def test_batches_and_keep_alive(store):
+    store.values.update({"option_a": "test", "option_b": 123})
+    provider = http(f"http://127.0.0.1:{store.server_port}/kv", max_url_length=20)
+    config = provider.load_configuration(SimpleDataclass)
+
+    assert config == {"option_a": "test", "option_b": 123}
+    assert store.requests == [["option_a"], ["option_b"]]
+    assert len(store.connections) == 1
+
+
+def test_url_parameters_are_kept(store):
+    store.values.update({"option_a": "test", "option_b": 123})
+    provider = http(f"http://127.0.0.1:{store.server_port}/kv?dc=eu", max_url_length=30)
+
+    assert provider.load_configuration(SimpleDataclass) == {"option_a": "test", "option_b": 123}
+    assert store.requests == [["option_a"], ["option_b"]]
+    assert store.datacenters == [["eu"], ["eu"]]
+
+
+def test_conditional_requests(store):
+    store.values.update({"nested/option_a": "test", "nested/option_b": 123, "values": [1, 2, 3]})
+    provider = http(f"http://127.0.0.1:{store.server_port}/kv")
+    first = provider.load_configuration(NestedDataclass)
+    second = provider.load_configuration(NestedDataclass)
+    assert first == second == {"nested": {"option_a": "test", "option_b": 123}, "values": [1, 2, 3]}
+    assert store.statuses == [200, 304]
+    assert second["values"] is first["values"]  # Unchanged values are neither parsed nor validated again
+
+    store.values["values"] = [4]
+    store.version += 1
+    third = provider.load_configuration(NestedDataclass)
+    assert third == {"nested": {"option_a": "test", "option_b": 123}, "values": [4]}
+    assert store.statuses == [200, 304, 200]
+
+
+def test_invalid_value(store):
+    store.values.update({"option_a": "test", "option_b": "not a number"})
+    provider = http(f"http://127.0.0.1:{store.server_port}/kv")
+    with pytest.raises(NectarineInvalidValueError):
+        provider.load_configuration(SimpleDataclass)
@@ -0,0 +1,115 @@
+from dataclasses import dataclass, field
+import json
+from typing import Dict, List
+
+import pytest
+
+from nectarine.providers.sqlite import SqliteWriter, sqlite
+
+
+@dataclass
+class Route:
+    backend: str
+    weight: int = 1
+
+
+@dataclass
+class Database:
+    host: str
+    port: int
+
+
+@dataclass
+class Config:
+    database: Database
+    routes: Dict[str, Route]
+    hosts: List[str] = field(default_factory=list)
+
+
+VALUE = {
+    "database": {"host": "localhost", "port": 5432},
+    "routes": {"/api": {"backend": "api"}, "/static/": {"backend": "cdn", "weight": 2}},
+    "hosts": ["a", "b"],
+}
+
+
+@pytest.fixture
+def database(tmp_path):
+    file = str(tmp_path / "config.db")
+    with SqliteWriter(file) as writer:
+        writer.import_dict(Config, VALUE)
+    return file
+
+
+def test_load(database):
+    provider = sqlite(database)
+
+    assert provider.load_configuration(Config) == VALUE
+    provider.close()
+
+
+def test_rows(database):
+    with SqliteWriter(database) as writer:
+        keys = [key for key, in writer.connection.execute("SELECT path FROM entries ORDER BY path")]
+
+    assert keys == ["database/host", "database/port", "hosts", "routes//api", "routes//static/"]
+
+
+def test_incremental_reload(database):
+    provider = sqlite(database)
+    provider.load_configuration(Config)
+    fingerprint = provider.fingerprint(Config)
+    with SqliteWriter(database) as writer:
+        writer.set(("routes", "/new"), {"backend": "new"})
+        writer.delete(("routes", "/api"))
+        writer.set(("database", "port"), 6543)
+
+    statements = []
+    provider._connection.set_trace_callback(statements.append)
+    config = provider.load_configuration(Config)
+
+    assert config["routes"] == {"/static/": {"backend": "cdn", "weight": 2}, "/new": {"backend": "new"}}
+    assert config["database"] == {"host": "localhost", "port": 6543}
+    assert provider.fingerprint(Config) != fingerprint
+    # Only the changed rows were read, the values were not fetched again
+    assert not any("IN (" in statement or "path >=" in statement for statement in statements)
+
+
+def test_unchanged_rows_are_not_rewritten(database):
+    with SqliteWriter(database) as writer:
+        writer.import_dict(Config, {**VALUE, "hosts": ["c"]})
+        versions = dict(writer.connection.execute("SELECT path, version FROM entries"))
+
+    assert versions["hosts"] == 2
+    assert versions["database/host"] == 1
+
+
+def test_replace_and_compact(database, tmp_path):
+    (tmp_path / "config.json").write_text(json.dumps({**VALUE, "routes": {"/api": {"backend": "api"}}}))
+    provider = sqlite(database)
+    provider.load_configuration(Config)
+    with SqliteWriter(database) as writer:
+        writer.import_json(Config, str(tmp_path / "config.json"), replace=True)
+        writer.compact()
+
+    assert provider.load_configuration(Config)["routes"] == {"/api": {"backend": "api"}}
+
+
+def test_empty_dict(tmp_path):
+    file = str(tmp_path / "config.db")
+    with SqliteWriter(file) as writer:
+        writer.import_dict(Config, {**VALUE, "routes": {}})
+
+    assert sqlite(file).load_configuration(Config)["routes"] == {}
+
+
+def test_missing_database(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        sqlite(str(tmp_path / "missing.db"))
+    assert sqlite(str(tmp_path / "missing.db"), must_exist=False).load_configuration(Config) == {}
+
+
+def test_section(database):
+    provider = sqlite(database)
+
+    assert provider.load_section(Config, ("database",)) == VALUE["database"]
@@ -0,0 +1,118 @@
+from dataclasses import dataclass
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Type
+
+from nectarine import ConfigCache
+from nectarine.configuration_provider import ConfigurationProvider
+from nectarine.providers.arguments import arguments
+from nectarine.providers.dictionary import dictionary
+from nectarine.providers.env import env
+from nectarine.providers.json import json as json_provider
+
+
+@dataclass
+class Tenant:
+    name: str
+    limit: int = 10
+
+
+class SlowProvider(ConfigurationProvider):
+    def __init__(self):
+        self.calls = 0
+
+    def load_configuration(self, target_type: Type, strict=False) -> Dict[str, Any]:
+        self.calls += 1
+        time.sleep(0.05)
+        return {"name": "slow"}
+
+    def fingerprint(self, target_type: Type):
+        return "slow"
+
+
+def test_hits_and_misses():
+    cache = ConfigCache()
+    value = {"name": "a"}
+    first = cache.get(Tenant, [env(environ={}), dictionary(value)])
+    second = cache.get(Tenant, [env(environ={}), dictionary(value)])
+    third = cache.get(Tenant, [env(environ={"LIMIT": "5"}), dictionary(value)])
+
+    assert first is second
+    assert third.limit == 5
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_file_changes_are_detected(tmp_path):
+    path = tmp_path / "tenant.json"
+    path.write_text(json.dumps({"name": "a"}))
+    cache = ConfigCache()
+    assert cache.get(Tenant, [json_provider(str(path))]).name == "a"
+    assert cache.get(Tenant, [json_provider(str(path))]).name == "a"
+
+    path.write_text(json.dumps({"name": "bb"}))
+    os.utime(path, ns=(0, 0))
+    assert cache.get(Tenant, [json_provider(str(path))]).name == "bb"
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_least_recently_used_entries_are_evicted():
+    values = [{"name": str(i)} for i in range(3)]
+    cache = ConfigCache(max_entries=2)
+    cache.get(Tenant, [dictionary(values[0])])
+    cache.get(Tenant, [dictionary(values[1])])
+    cache.get(Tenant, [dictionary(values[0])])
+    cache.get(Tenant, [dictionary(values[2])])
+
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    cache.get(Tenant, [dictionary(values[0])])
+    assert cache.hits == 2
+
+
+def test_memory_bound():
+    cache = ConfigCache(max_bytes=1)
+    cache.get(Tenant, [dictionary({"name": "a"})])
+
+    assert len(cache) == 0
+    assert cache.size == 0
+    assert cache.evictions == 1
+
+
+def test_time_to_live():
+    now = [0.]
+    cache = ConfigCache(ttl=10, clock=lambda: now[0])
+    value = {"name": "a"}
+    first = cache.get(Tenant, [dictionary(value)])
+    now[0] = 11
+    assert cache.get(Tenant, [dictionary(value)]) is not first
+    assert cache.evictions == 1
+
+
+def test_uncacheable_providers():
+    class Opaque(SlowProvider):
+        def fingerprint(self, target_type: Type):
+            return None
+
+    provider = Opaque()
+    cache = ConfigCache()
+    cache.get(Tenant, [provider])
+    cache.get(Tenant, [provider, arguments([])])
+    assert provider.calls == 2
+    assert len(cache) == 0
+
+
+def test_concurrent_misses_load_once():
+    provider = SlowProvider()
+    cache = ConfigCache()
+    results: List[Tenant] = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get(Tenant, [provider]))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert provider.calls == 1
+    assert len(results) == 8
+    assert all(result is results[0] for result in results)
@@ -0,0 +1,67 @@
+from array import array
+from dataclasses import dataclass
+from typing import Literal, Optional
+
+import pytest
+
+from nectarine import dictionary, env, load
+from nectarine.columnar import Columnar, StringColumn
+from nectarine.errors import NectarineInvalidValueError, NectarineMissingValueError
+
+
+@dataclass
+class Rule:
+    source: str
+    port: int
+    weight: float
+    enabled: bool
+    action: Literal["allow", "deny"] = "allow"
+    comment: Optional[str] = None
+
+
+@dataclass
+class Firewall:
+    rules: Columnar[Rule]
+
+
+RULES = [
+    {"source": "10.0.0.0/8", "port": 80, "weight": 1.5, "enabled": True},
+    {"source": "10.0.0.0/8", "port": 443, "weight": 2, "enabled": False, "action": "deny", "comment": "tls"},
+    {"source": "192.168.0.0/16", "port": 22, "weight": 0.5, "enabled": True},
+]
+
+
+def test_columnar_rows():
+    config = load(Firewall, [dictionary({"rules": RULES})])
+
+    assert len(config.rules) == 3
+    assert config.rules[1].port == 443
+    assert config.rules[1].enabled is False
+    assert config.rules[-1].source == "192.168.0.0/16"
+    assert config.rules[0] == Rule("10.0.0.0/8", 80, 1.5, True)
+    assert config.rules[1]._asdataclass() == Rule("10.0.0.0/8", 443, 2., False, "deny", "tls")
+    assert [rule.action for rule in config.rules] == ["allow", "deny", "allow"]
+
+
+def test_columnar_columns():
+    config = load(Firewall, [dictionary({"rules": RULES})])
+
+    ports = config.rules.column("port")
+    assert isinstance(ports, array) and list(ports) == [80, 443, 22]
+    assert list(config.rules.column("weight")) == [1.5, 2., 0.5]
+    sources = config.rules.column("source")
+    assert isinstance(sources, StringColumn)
+    assert sources.table == ["10.0.0.0/8", "192.168.0.0/16"]
+    assert list(sources) == ["10.0.0.0/8", "10.0.0.0/8", "192.168.0.0/16"]
+    assert config.rules.column("comment") == [None, "tls", None]
+
+
+def test_columnar_validation():
+    with pytest.raises(NectarineInvalidValueError):
+        load(Firewall, [dictionary({"rules": [{**RULES[0], "port": "80"}]})])
+    with pytest.raises(NectarineMissingValueError):
+        load(Firewall, [dictionary({"rules": [{"source": "10.0.0.0/8"}]})])
+
+
+def test_columnar_is_ignored_by_env():
+    assert env(allow_lists=True, environ={"RULES": "1,2"}).load_configuration(Firewall) == {}
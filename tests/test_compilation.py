@@ -0,0 +1,117 @@
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Dict, FrozenSet, List, Literal, Optional, Tuple
+
+import pytest
+
+from nectarine import dictionary, load
+from nectarine.__main__ import main
+from nectarine.compilation import compile_config, materialize, open_compiled
+from nectarine.errors import NectarineSchemaMismatchError
+from nectarine.providers.compiled import compiled
+
+
+@dataclass
+class Endpoint:
+    host: str
+    port: int
+
+
+@dataclass
+class Configuration:
+    primary: Endpoint
+    backup: Optional[Endpoint]
+    replicas: List[Endpoint]
+    weights: Tuple[float, float]
+    tags: FrozenSet[str]
+    limits: Dict[str, int]
+    mode: Literal["fast", "safe"]
+    big: int = 2 ** 70
+    enabled: bool = True
+
+
+@dataclass
+class OtherConfiguration:
+    primary: Endpoint
+    mode: str
+
+
+VALUE = {
+    "primary": {"host": "localhost", "port": 80},
+    "backup": None,
+    "replicas": [{"host": "replica", "port": 81}, {"host": "replica", "port": 82}],
+    "weights": [0.5, 1.5],
+    "tags": frozenset({"a", "b"}),
+    "limits": {"requests": 10},
+    "mode": "safe",
+}
+
+
+@pytest.fixture
+def compiled_file(tmp_path):
+    path = str(tmp_path / "config.nconf")
+    compile_config(Configuration, [dictionary(VALUE)], path)
+    return path
+
+
+def test_round_trip(compiled_file):
+    expected = load(Configuration, [dictionary(VALUE)])
+    assert load(Configuration, [compiled(compiled_file)]) == expected
+    assert materialize(open_compiled(Configuration, compiled_file)) == expected
+
+
+def test_lazy_view(compiled_file):
+    view = open_compiled(Configuration, compiled_file)
+
+    assert view.primary.host == "localhost"
+    assert view.backup is None
+    assert view.replicas == [Endpoint("replica", 81), Endpoint("replica", 82)]
+    assert view.weights == (0.5, 1.5)
+    assert view.big == 2 ** 70
+    assert view.enabled is True
+    assert "primary" in vars(view) and "limits" not in vars(view)
+
+
+def test_schema_mismatch(compiled_file):
+    with pytest.raises(NectarineSchemaMismatchError):
+        open_compiled(OtherConfiguration, compiled_file)
+
+    # The provider falls back to validating the data against the target
+    config = load(OtherConfiguration, [compiled(compiled_file)])
+    assert config == OtherConfiguration(primary=Endpoint("localhost", 80), mode="safe")
+
+
+def test_command_line(tmp_path, monkeypatch):
+    (tmp_path / "conf.json").write_text('{"host": "localhost", "port": 80}')
+    monkeypatch.setenv("APP_PORT", "81")
+    output = str(tmp_path / "endpoint.nconf")
+
+    assert main(["compile-config", f"{__name__}:Endpoint", "-o", output,
+                 "-s", "env:APP_", "-s", f"json:{tmp_path / 'conf.json'}"]) == 0
+    assert materialize(open_compiled(Endpoint, output)) == Endpoint("localhost", 81)
+
+
+class Mode(Enum):
+    FAST = "fast"
+    SAFE = "safe"
+
+
+@dataclass
+class Schedule:
+    start: datetime
+    mode: Mode
+    budget: Decimal
+    end: Optional[datetime] = None
+
+
+def test_values_of_registered_types(tmp_path):
+    path = str(tmp_path / "schedule.nconf")
+    value = {"start": "2024-01-02T03:04:05", "mode": "safe", "budget": "12.50"}
+    compile_config(Schedule, [dictionary(value)], path)
+
+    expected = Schedule(datetime(2024, 1, 2, 3, 4, 5), Mode.SAFE, Decimal("12.50"))
+    assert load(Schedule, [compiled(path)]) == expected
+    assert materialize(open_compiled(Schedule, path)) == expected
+    assert open_compiled(Schedule, path).start == expected.start
@@ -0,0 +1,175 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from enum import Enum
+from ipaddress import IPv4Network, IPv6Address
+from pathlib import Path
+import subprocess
+import sys
+from typing import Dict, List, Optional, Union
+from uuid import UUID
+
+import pytest
+
+from nectarine import load
+from nectarine.converters import ConverterRegistry, convert, find_converter, register_converter
+from nectarine.errors import NectarineInvalidValueError
+from nectarine.providers.arguments import arguments
+from nectarine.providers.dictionary import dictionary
+from nectarine.providers.env import env
+from nectarine.typing import compile_validator, is_parsable
+
+
+class Color(Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+class Level(Enum):
+    LOW = 1
+    HIGH = 2
+
+
+@dataclass
+class Network:
+    allowed: List[IPv4Network]
+    gateway: Optional[IPv6Address] = None
+    root: Path = Path("/")
+    timeout: timedelta = timedelta(seconds=30)
+    price: Decimal = Decimal("0")
+    color: Color = Color.RED
+    level: Level = Level.LOW
+    since: date = date(2000, 1, 1)
+    ids: Dict[str, UUID] = field(default_factory=dict)
+
+
+def test_standard_types_from_dictionary():
+    config = load(Network, [dictionary({
+        "allowed": ["10.0.0.0/8", "192.168.0.0/16"],
+        "gateway": "::1",
+        "root": "/etc",
+        "timeout": 1.5,
+        "price": 0.1,
+        "color": "GREEN",
+        "level": 2,
+        "since": "2021-03-04",
+        "ids": {"a": "12345678-1234-5678-1234-567812345678"},
+    })])
+
+    assert config.allowed == [IPv4Network("10.0.0.0/8"), IPv4Network("192.168.0.0/16")]
+    assert config.gateway == IPv6Address("::1")
+    assert config.root == Path("/etc")
+    assert config.timeout == timedelta(seconds=1.5)
+    assert config.price == Decimal("0.1")
+    assert config.color is Color.GREEN
+    assert config.level is Level.HIGH
+    assert config.since == date(2021, 3, 4)
+    assert config.ids == {"a": UUID("12345678-1234-5678-1234-567812345678")}
+
+
+def test_standard_types_from_env():
+    provider = env(allow_lists=True, environ={
+        "ALLOWED": "10.0.0.0/8,172.16.0.0/12",
+        "TIMEOUT": "1:02:03",
+        "COLOR": "red",
+        "LEVEL": "2",
+    })
+    config = load(Network, [provider])
+
+    assert config.allowed == [IPv4Network("10.0.0.0/8"), IPv4Network("172.16.0.0/12")]
+    assert config.timeout == timedelta(hours=1, minutes=2, seconds=3)
+    assert config.color is Color.RED
+    assert config.level is Level.HIGH
+
+
+def test_standard_types_from_arguments():
+    argv = ["--allowed", "10.0.0.0/8", "--allowed", "127.0.0.0/8", "--since", "2020-02-02", "--root", "/tmp"]
+    config = load(Network, [arguments(argv)])
+
+    assert config.allowed == [IPv4Network("10.0.0.0/8"), IPv4Network("127.0.0.0/8")]
+    assert config.since == date(2020, 2, 2)
+    assert config.root == Path("/tmp")
+
+
+def test_invalid_values_are_rejected():
+    with pytest.raises(NectarineInvalidValueError):
+        load(Network, [dictionary({"allowed": ["10.0.0.1/8"]})])
+    with pytest.raises(NectarineInvalidValueError):
+        load(Network, [dictionary({"allowed": [], "color": "blue"})])
+    with pytest.raises(NectarineInvalidValueError):
+        load(Network, [env(environ={"PRICE": "cheap"})])
+
+
+def test_lookup_follows_the_method_resolution_order():
+    assert find_converter(datetime) is not find_converter(date)
+    assert find_converter(Color) is find_converter(Enum)
+    assert find_converter(type(Path("/"))) is find_converter(Path)
+    assert find_converter(int) is None
+    assert find_converter(List[int]) is None
+
+
+def test_static_parse_method():
+    class Version:
+        def __init__(self, parts):
+            self.parts = parts
+
+        @staticmethod
+        def parse(value: str):
+            return Version(tuple(int(p) for p in value.split('.')))
+
+    class Release(Version):
+        pass
+
+    assert is_parsable(Version)
+    assert is_parsable(Release)
+    assert convert(Version, "1.2").parts == (1, 2)
+
+
+def test_registration():
+    class Celsius(float):
+        pass
+
+    registry = ConverterRegistry()
+    registry.register(Celsius, lambda t, v: t(v.rstrip("C")))
+    assert registry.convert(Celsius, "21.5C") == 21.5
+    with pytest.raises(NectarineInvalidValueError):
+        registry.convert(Celsius, 21.5)
+
+
+def test_registration_clears_compiled_validators():
+    class Hostname:
+        def __init__(self, name):
+            self.name = name
+
+    check = compile_validator(Hostname)
+    assert not check("localhost")
+    register_converter(Hostname, lambda t, v: t(v))
+    assert compile_validator(Hostname)("localhost")
+
+    @dataclass
+    class Server:
+        host: Hostname
+
+    assert load(Server, [dictionary({"host": "localhost"})]).host.name == "localhost"
+
+
+def test_invalid_values_in_unions_are_rejected():
+    @dataclass
+    class Unions:
+        when: Optional[datetime] = None
+        network: Union[IPv4Network, int] = 0
+
+    config = load(Unions, [dictionary({"when": "2021-03-04T05:06:07", "network": "10.0.0.0/8"})])
+    assert config == Unions(datetime(2021, 3, 4, 5, 6, 7), IPv4Network("10.0.0.0/8"))
+    assert load(Unions, [dictionary({"network": 3})]).network == 3
+
+    with pytest.raises(NectarineInvalidValueError):
+        load(Unions, [dictionary({"when": "not a date"})])
+    with pytest.raises(NectarineInvalidValueError):
+        load(Unions, [dictionary({"network": "garbage"})])
+
+
+def test_standard_types_are_imported_lazily():
+    code = "import sys, nectarine; " \
+           "assert not {'datetime', 'decimal', 'ipaddress', 'pathlib', 'uuid'} & set(sys.modules), sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from nectarine import load, dictionary
+from nectarine.deduplication import Deduplicator
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    host: str
+    port: int
+
+
+@dataclass
+class Service:
+    endpoints: List[Endpoint]
+    regions: List[str]
+    weights: List[Tuple[int, ...]]
+
+
+def test_strings_are_shared():
+    deduplicator = Deduplicator()
+    regions = ["".join(["eu", "-west-", str(i % 2)]) for i in range(4)]
+    config = load(Service, [dictionary({"endpoints": [], "regions": regions, "weights": []})],
+                  deduplicator=deduplicator)
+
+    assert config.regions == regions
+    assert config.regions[0] is config.regions[2]
+    assert config.regions[1] is config.regions[3]
+    assert deduplicator.shared_values == 2
+    assert deduplicator.saved_bytes > 0
+
+
+def test_frozen_dataclasses_and_tuples_are_shared():
+    deduplicator = Deduplicator()
+    value = {
+        "endpoints": [{"host": "localhost", "port": 80}, {"host": "localhost", "port": 80}],
+        "regions": [],
+        "weights": [tuple([1, 2]), tuple([1, 2])],
+    }
+    config = load(Service, [dictionary(value)], deduplicator=deduplicator)
+
+    assert config.endpoints[0] is config.endpoints[1]
+    assert config.weights[0] is config.weights[1]
+
+
+def test_equal_values_of_different_types_are_not_shared():
+    deduplicator = Deduplicator()
+    assert deduplicator.deduplicate((1,)) == (1,)
+    assert type(deduplicator.deduplicate((True,))[0]) is bool
+    assert type(deduplicator.deduplicate((1.0,))[0]) is float
+    assert deduplicator.shared_values == 0
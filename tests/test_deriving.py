@@ -0,0 +1,87 @@
+from dataclasses import dataclass, field
+from ipaddress import IPv4Network
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from nectarine import derive, load
+from nectarine.errors import NectarineInvalidValueError, NectarineMissingValueError, NectarineStrictLoadingError
+from nectarine.providers.dictionary import dictionary
+
+
+@dataclass(frozen=True)
+class Limits:
+    requests: int
+    burst: int = 10
+
+
+@dataclass
+class Features:
+    beta: bool = False
+    rollout: float = 0.
+
+
+@dataclass
+class Configuration:
+    features: Features
+    limits: Dict[str, Limits]
+    networks: List[IPv4Network] = field(default_factory=list)
+    window: Tuple[int, int] = (0, 0)
+    fallback: Optional[Features] = None
+
+
+@pytest.fixture
+def base():
+    return load(Configuration, [dictionary({
+        "features": {"beta": False},
+        "limits": {"a": {"requests": 1}, "b": {"requests": 2}},
+        "networks": ["10.0.0.0/8"],
+    })])
+
+
+def test_untouched_values_are_shared(base):
+    derived = derive(base, {("features", "beta"): True, ("limits", "a", "burst"): 20})
+
+    assert derived.features.beta is True
+    assert derived.limits["a"] == Limits(requests=1, burst=20)
+    assert derived.limits["b"] is base.limits["b"]
+    assert derived.networks is base.networks
+    assert base.features.beta is False
+    assert base.limits["a"].burst == 10
+
+
+def test_overrides_are_validated_and_converted(base):
+    derived = derive(base, {
+        ("limits", "c"): {"requests": 3},
+        ("networks", 0): "192.168.0.0/16",
+        "window": [1, 2],
+    })
+
+    assert derived.limits["c"] == Limits(requests=3)
+    assert derived.networks == [IPv4Network("192.168.0.0/16")]
+    assert derived.window == (1, 2)
+    with pytest.raises(NectarineInvalidValueError):
+        derive(base, {("features", "rollout"): "high"})
+    with pytest.raises(NectarineStrictLoadingError):
+        derive(base, {("features", "unknown"): 1})
+    with pytest.raises(NectarineMissingValueError):
+        derive(base, {("fallback", "beta"): True})
+
+
+def test_nested_dataclass_overrides_are_validated(base):
+    with pytest.raises(NectarineInvalidValueError):
+        derive(base, {"features": {"beta": "yes", "rollout": "x"}})
+    with pytest.raises(NectarineInvalidValueError):
+        derive(base, {"fallback": {"rollout": "x"}})
+    with pytest.raises(NectarineInvalidValueError):
+        derive(base, {("limits", "c"): {"requests": "many"}})
+    with pytest.raises(NectarineStrictLoadingError):
+        derive(base, {"features": {"gamma": True}})
+    assert derive(base, {"features": {"rollout": 1}}).features == Features(rollout=1)
+
+
+def test_nested_overrides(base):
+    derived = derive(base, {"fallback": {}, ("fallback", "beta"): True})
+
+    assert derived.fallback == Features(beta=True)
+    assert derive(base, {}) is base
@@ -0,0 +1,80 @@
+import copy
+from dataclasses import asdict, dataclass
+import os
+import pickle
+
+import pytest
+
+from nectarine import load
+from nectarine.errors import NectarineInvalidValueError
+from nectarine.fileref import FileRef
+from nectarine.providers.dictionary import dictionary
+from nectarine.providers.env import env
+
+
+@dataclass
+class Tls:
+    certificate: FileRef
+
+
+def test_resolution_does_not_read_the_file(tmp_path):
+    path = tmp_path / "cert.pem"
+    path.write_bytes(b"-----BEGIN CERTIFICATE-----")
+    config = load(Tls, [dictionary({"certificate": str(path)})])
+
+    assert config.certificate == FileRef(str(path))
+    assert config.certificate.size == 27
+    assert config.certificate._content is None
+    assert os.fspath(config.certificate) == str(path)
+    assert load(Tls, [env(environ={"CERTIFICATE": str(path)})]).certificate.path == str(path)
+
+
+def test_missing_file(tmp_path):
+    with pytest.raises(NectarineInvalidValueError):
+        load(Tls, [dictionary({"certificate": str(tmp_path / "missing.pem")})])
+
+
+def test_content_is_cached_until_the_file_changes(tmp_path):
+    path = tmp_path / "template.txt"
+    path.write_text("first")
+    ref = FileRef(str(path))
+
+    content = ref.read_bytes()
+    assert content == b"first"
+    assert ref.read_bytes() is content
+    assert ref.mmap()[:] == b"first"
+
+    path.write_text("second")
+    os.utime(path, ns=(0, 0))
+    assert ref.read_text() == "second"
+    assert ref.mmap()[:] == b"second"
+    assert ref.size == 6
+
+
+def test_copies(tmp_path):
+    path = tmp_path / "cert.pem"
+    path.write_bytes(b"-----BEGIN CERTIFICATE-----")
+    config = load(Tls, [dictionary({"certificate": str(path)})])
+    config.certificate.read_bytes()
+    config.certificate.mmap()
+
+    copied = copy.deepcopy(config)
+    assert copied == config
+    assert copied.certificate is not config.certificate
+    assert copied.certificate._content is None
+    assert copied.certificate.read_bytes() == b"-----BEGIN CERTIFICATE-----"
+    assert asdict(config) == {"certificate": config.certificate}
+    assert pickle.loads(pickle.dumps(config.certificate)).read_text() == "-----BEGIN CERTIFICATE-----"
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    ref = FileRef(str(path))
+
+    assert ref.read_bytes() == b""
+    assert ref.mmap()[:] == b""
+
+    path.write_text("content")
+    os.utime(path, ns=(0, 0))
+    assert ref.mmap()[:] == b"content"
@@ -0,0 +1,84 @@
+from dataclasses import dataclass
+import threading
+
+from nectarine import LiveConfig, dictionary
+
+
+@dataclass
+class Database:
+    host: str
+    port: int
+
+
+@dataclass
+class Configuration:
+    database: Database
+    workers: int
+
+
+class MutableProvider:
+    def __init__(self, value):
+        self.value = value
+        self.error = None
+
+    def load_configuration(self, target_type, strict=False):
+        if self.error is not None:
+            raise self.error
+        return dictionary(self.value).load_configuration(target_type, strict=strict)
+
+
+def make_live():
+    provider = MutableProvider({"database": {"host": "localhost", "port": 5432}, "workers": 4})
+    return provider, LiveConfig(Configuration, [provider])
+
+
+def test_reload_publishes_new_snapshot():
+    provider, live = make_live()
+    pinned = live.snapshot()
+
+    assert not live.reload(), "Nothing changed"
+    assert live.snapshot() is pinned
+
+    provider.value = {**provider.value, "workers": 8}
+    assert live.reload()
+    assert live.version == 2
+    assert live.config.workers == 8
+    assert live.config.database is pinned.config.database
+    assert pinned.config.workers == 4 and pinned.version == 1
+
+
+def test_failed_reload_keeps_last_snapshot():
+    provider, live = make_live()
+    provider.error = ValueError("unreachable")
+
+    assert not live.reload()
+    assert isinstance(live.last_error, ValueError)
+    assert live.config.workers == 4
+
+
+def test_subscribers():
+    provider, live = make_live()
+    database_changes = []
+    workers_changes = []
+    live.subscribe(lambda snapshot, result: database_changes.append(snapshot.version), ("database",))
+    live.subscribe(lambda snapshot, result: workers_changes.append(snapshot.version), ("workers",))
+
+    provider.value = {**provider.value, "workers": 8}
+    live.reload()
+
+    assert database_changes == []
+    assert workers_changes == [2]
+
+
+def test_background_reload():
+    provider, live = make_live()
+    reloaded = threading.Event()
+    live.subscribe(lambda snapshot, result: reloaded.set())
+
+    live.start(interval=0.01)
+    try:
+        provider.value = {**provider.value, "workers": 8}
+        assert reloaded.wait(timeout=5)
+    finally:
+        live.stop()
+    assert live.config.workers == 8
@@ -0,0 +1,101 @@
+from dataclasses import dataclass, field
+import copy
+from typing import Dict, List, Optional, Set
+
+from nectarine import dictionary, load
+from nectarine.merging import append, keyed, replace, union
+
+
+@dataclass
+class Server:
+    id: str
+    weight: int = 1
+
+
+@dataclass
+class Configuration:
+    servers: List[Server] = field(default_factory=list)
+    tags: List[str] = field(default_factory=list)
+    limits: Dict[str, int] = field(default_factory=dict)
+    groups: Set[str] = field(default_factory=set)
+
+
+LOW = {
+    "servers": [{"id": "a", "weight": 1}, {"id": "b"}],
+    "tags": ["x", "y"],
+    "limits": {"requests": 10, "connections": 5},
+    "groups": {"admin"},
+}
+HIGH = {
+    "servers": [{"id": "a", "weight": 3}, {"id": "c"}],
+    "tags": ["y", "z"],
+    "limits": {"requests": 20},
+    "groups": {"users"},
+}
+
+
+def test_default_merge():
+    config = load(Configuration, [dictionary(HIGH), dictionary(LOW)])
+
+    assert [s.id for s in config.servers] == ["a", "b", "a", "c"]
+    assert config.tags == ["x", "y", "y", "z"]
+    assert config.limits == {"requests": 20, "connections": 5}
+    assert config.groups == {"users"}
+
+
+def test_merge_by_path():
+    merge = {("servers",): keyed("id"), ("tags",): union, ("limits",): replace}
+    config = load(Configuration, [dictionary(HIGH), dictionary(LOW)], merge=merge)
+
+    assert config.servers == [Server("a", 3), Server("b"), Server("c")]
+    assert config.tags == ["x", "y", "z"]
+    assert config.limits == {"requests": 20}
+
+
+def test_merge_by_type():
+    config = load(Configuration, [dictionary(HIGH), dictionary(LOW)], merge={Set[str]: union, List[str]: replace})
+
+    assert config.groups == {"admin", "users"}
+    assert config.tags == ["y", "z"]
+    assert len(config.servers) == 4
+
+
+def test_single_strategy():
+    config = load(Configuration, [dictionary(HIGH), dictionary(LOW)], merge=replace)
+
+    assert config.tags == ["y", "z"]
+    assert config.limits == {"requests": 20, "connections": 5}, "Dictionaries are still merged"
+
+
+def test_provider_results_are_not_modified():
+    class CachingProvider:
+        def __init__(self, value):
+            self.value = value
+
+        def load_configuration(self, target_type, strict=False):
+            return self.value
+
+    low = CachingProvider(copy.deepcopy(LOW))
+    high = CachingProvider(copy.deepcopy(HIGH))
+    load(Configuration, [high, low], merge=append)
+    load(Configuration, [high, low], merge={("servers",): keyed("id")})
+
+    assert low.value == LOW
+    assert high.value == HIGH
+
+
+def test_lower_priority_none_is_replaced():
+    @dataclass
+    class Nullable:
+        tags: Optional[List[str]] = None
+        limits: Optional[Dict[str, int]] = None
+
+    layers = [dictionary({"tags": ["b"], "limits": {"a": 1}}), dictionary({"tags": ["a"], "limits": {"b": 2}}),
+              dictionary({"tags": None, "limits": None})]
+    config = load(Nullable, layers)
+
+    assert config.tags == ["a", "b"]
+    assert config.limits == {"a": 1, "b": 2}
+    assert load(Nullable, layers, merge={("tags",): union}).tags == ["a", "b"]
+    assert load(Nullable, [dictionary({"tags": ["b"]}), dictionary({"tags": None}),
+                           dictionary({"tags": ["a"]})]).tags == ["b"], "None replaces lower priority values"
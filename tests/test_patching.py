@@ -0,0 +1,130 @@
+from dataclasses import dataclass, field
+from ipaddress import IPv4Network
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from nectarine import apply_patch, load
+from nectarine.errors import NectarineInvalidValueError, NectarineMissingValueError, NectarinePatchError, \
+    NectarineStrictLoadingError
+from nectarine.providers.dictionary import dictionary
+
+
+@dataclass(frozen=True)
+class Limits:
+    requests: int
+    burst: int = 10
+
+
+@dataclass
+class Features:
+    beta: bool = False
+    rollout: float = 0.
+
+
+@dataclass
+class Configuration:
+    features: Features
+    limits: Dict[str, Limits]
+    networks: List[IPv4Network] = field(default_factory=list)
+    window: Tuple[int, int] = (0, 0)
+    fallback: Optional[Features] = None
+
+
+@pytest.fixture
+def base():
+    return load(Configuration, [dictionary({
+        "features": {"beta": False},
+        "limits": {"a": {"requests": 1}, "b": {"requests": 2}},
+        "networks": ["10.0.0.0/8"],
+    })])
+
+
+def test_merge_patch(base):
+    patched = apply_patch(base, {"features": {"rollout": 0.5}, "limits": {"a": {"burst": 20}, "c": {"requests": 3}}})
+
+    assert patched.features == Features(beta=False, rollout=0.5)
+    assert patched.limits == {"a": Limits(1, 20), "b": Limits(2), "c": Limits(3)}
+    assert patched.limits["b"] is base.limits["b"]
+    assert base.limits["a"] == Limits(1) and base.features.rollout == 0.
+
+
+def test_merge_patch_nulls(base):
+    patched = apply_patch(base, '{"limits": {"b": null}, "networks": null, "fallback": {"beta": true, "rollout": null}}')
+
+    assert patched.limits == {"a": Limits(1)}
+    assert patched.networks == []
+    assert patched.fallback == Features(beta=True)
+
+
+def test_merge_patch_converts(base):
+    patched = apply_patch(base, {"networks": ["192.168.0.0/16"], "window": [1, 2]})
+
+    assert patched.networks == [IPv4Network("192.168.0.0/16")]
+    assert patched.window == (1, 2)
+
+
+def test_json_patch(base):
+    patched = apply_patch(base, [
+        {"op": "test", "path": "/limits/a/requests", "value": 1},
+        {"op": "replace", "path": "/limits/a/requests", "value": 5},
+        {"op": "add", "path": "/limits/c", "value": {"requests": 3}},
+        {"op": "remove", "path": "/limits/b"},
+        {"op": "add", "path": "/networks/-", "value": "172.16.0.0/12"},
+        {"op": "add", "path": "/networks/0", "value": "192.168.0.0/16"},
+        {"op": "replace", "path": "/window/1", "value": 9},
+        {"op": "remove", "path": "/features/beta"},
+    ])
+
+    assert patched.limits == {"a": Limits(5), "c": Limits(3)}
+    assert patched.networks == [IPv4Network(n) for n in ("192.168.0.0/16", "10.0.0.0/8", "172.16.0.0/12")]
+    assert patched.window == (0, 9)
+    assert patched.features is not base.features
+    assert base.limits.keys() == {"a", "b"} and base.networks == [IPv4Network("10.0.0.0/8")]
+
+
+def test_move_and_copy(base):
+    patched = apply_patch(base, [
+        {"op": "copy", "from": "/limits/a", "path": "/limits/c"},
+        {"op": "move", "from": "/limits/b", "path": "/limits/d"},
+    ])
+
+    assert patched.limits == {"a": Limits(1), "c": Limits(1), "d": Limits(2)}
+
+
+def test_escaped_pointers(base):
+    patched = apply_patch(base, [{"op": "add", "path": "/limits/a~1b~0", "value": {"requests": 1}}])
+
+    assert "a/b~" in patched.limits
+
+
+def test_failed_patch(base):
+    with pytest.raises(NectarinePatchError):
+        apply_patch(base, [
+            {"op": "remove", "path": "/limits/a"},
+            {"op": "test", "path": "/limits/b/requests", "value": 3},
+        ])
+    assert base.limits.keys() == {"a", "b"}
+
+
+def test_errors(base):
+    with pytest.raises(NectarineInvalidValueError):
+        apply_patch(base, {"limits": {"a": {"requests": "many"}}})
+    with pytest.raises(NectarineStrictLoadingError):
+        apply_patch(base, [{"op": "replace", "path": "/features/gamma", "value": True}])
+    with pytest.raises(NectarineMissingValueError):
+        apply_patch(base, [{"op": "replace", "path": "/limits/z", "value": {"requests": 1}}])
+    with pytest.raises(NectarinePatchError):
+        apply_patch(base, [{"op": "remove", "path": "/limits/a/requests"}])
+    with pytest.raises(NectarinePatchError):
+        apply_patch(base, [{"op": "increment", "path": "/window/0"}])
+    with pytest.raises(NectarineInvalidValueError):
+        apply_patch(base, [{"op": "replace", "path": "/features", "value": {"beta": "yes"}}])
+    with pytest.raises(NectarineInvalidValueError):
+        apply_patch(base, [{"op": "add", "path": "/limits/c", "value": {"requests": "many"}}])
+    with pytest.raises(NectarineInvalidValueError):
+        apply_patch(base, {"fallback": {"rollout": "x"}})
+
+
+def test_empty_patch(base):
+    assert apply_patch(base, {}) is base
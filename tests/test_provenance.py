@@ -0,0 +1,79 @@
+from dataclasses import dataclass, field
+import gc
+from typing import Dict, List
+
+import pytest
+
+from nectarine import explain, load
+from nectarine.errors import NectarineMissingProvenanceError
+from nectarine import provenance
+from nectarine.provenance import _provenances
+from nectarine.providers.dictionary import dictionary
+from nectarine.providers.env import env
+
+
+@dataclass
+class Database:
+    host: str
+    port: int = 5432
+
+
+@dataclass
+class Configuration:
+    database: Database
+    tags: List[str] = field(default_factory=list)
+    limits: Dict[str, int] = field(default_factory=dict)
+
+
+def test_explain():
+    environment = env(environ={"DATABASE_HOST": "db.local"})
+    defaults = dictionary({"database": {"host": "localhost"}, "tags": ["a"], "limits": {"cpu": 2, "memory": 512}})
+    overrides = dictionary({"tags": ["b"], "limits": {"cpu": 4}})
+    config = load(Configuration, [environment, overrides, defaults], provenance=True)
+
+    assert explain(config, ("database", "host")).provider is environment
+    assert explain(config, ("database", "host")).indexes == (0, 2)
+    assert explain(config, ("database", "port")).is_default
+    assert explain(config, ("limits", "cpu")).provider is overrides
+    assert explain(config, ("limits", "memory")).provider is defaults
+    assert explain(config, ("tags",)).providers == (overrides, defaults)
+    assert explain(config, ("tags", 0)).providers == (overrides, defaults)
+    assert str(explain(config, ("limits", "memory"))) == "limits.memory: Dictionary (provider 2)"
+    assert str(explain(config, ("database", "port"))) == "database.port: default value"
+
+
+def test_provenance_is_opt_in_and_released_with_the_configuration():
+    config = load(Configuration, [dictionary({"database": {"host": "localhost"}})])
+    with pytest.raises(NectarineMissingProvenanceError):
+        explain(config, ("database", "host"))
+
+    count = len(_provenances)
+    config = load(Configuration, [dictionary({"database": {"host": "localhost"}})], provenance=True)
+    assert len(_provenances) == count + 1
+    del config
+    gc.collect()
+    assert len(_provenances) == count
+
+
+@dataclass
+class SlottedDatabase:
+    __slots__ = ('host', 'port')
+    host: str
+    port: int
+
+
+def test_configurations_without_weak_references():
+    config = load(SlottedDatabase, [dictionary({"host": "localhost"}), dictionary({"port": 1})], provenance=True)
+
+    assert explain(config, ("host",)).indexes == (0,)
+    assert explain(config, ("port",)).indexes == (1,)
+
+
+def test_recorded_provenances_are_capped(monkeypatch):
+    monkeypatch.setattr(provenance, "_MAX_PROVENANCES", 2)
+    configs = [load(Database, [dictionary({"host": f"host-{i}"})], provenance=True) for i in range(3)]
+
+    assert len(_provenances) <= 2
+    with pytest.raises(NectarineMissingProvenanceError):
+        explain(configs[0], ("host",))
+    assert [explain(config, ("host",)).indexes for config in configs[1:]] == [(0,), (0,)]
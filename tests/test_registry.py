@@ -0,0 +1,36 @@
+import subprocess
+import sys
+
+import pytest
+
+import nectarine
+from nectarine.providers.dictionary import dictionary
+from nectarine import registry
+from nectarine.registry import get_provider, register_provider
+
+
+def test_providers_are_imported_lazily():
+    code = "import sys, nectarine; assert 'nectarine.providers.arguments' not in sys.modules; nectarine.arguments; " \
+           "assert 'nectarine.providers.arguments' in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_builtin_providers():
+    assert nectarine.dictionary is dictionary
+    assert get_provider("dictionary") is dictionary
+
+
+def test_registered_provider(monkeypatch):
+    def custom():
+        return dictionary({})
+
+    monkeypatch.setattr(registry, "_loaded", dict(registry._loaded))  # Restored once the test is done
+    register_provider("custom", custom)
+    assert nectarine.custom is custom
+
+
+def test_unknown_provider():
+    with pytest.raises(LookupError):
+        get_provider("unknown")
+    with pytest.raises(AttributeError):
+        nectarine.unknown
@@ -0,0 +1,62 @@
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from nectarine import dictionary, load, reload
+
+
+@dataclass
+class Database:
+    host: str
+    port: int
+
+
+@dataclass
+class Cache:
+    servers: List[str]
+
+
+@dataclass
+class Configuration:
+    database: Database
+    cache: Cache
+    limits: Dict[str, int] = field(default_factory=dict)
+
+
+VALUE = {
+    "database": {"host": "localhost", "port": 5432},
+    "cache": {"servers": ["a", "b"]},
+    "limits": {"requests": 10, "connections": 5},
+}
+
+
+def test_unchanged_reload():
+    previous = load(Configuration, [dictionary(VALUE)])
+    result = reload(previous, [dictionary(VALUE)])
+
+    assert result.config is previous
+    assert result.changes == []
+    assert not result.has_changed()
+
+
+def test_changed_reload_reuses_unchanged_subtrees():
+    previous = load(Configuration, [dictionary(VALUE)])
+    result = reload(previous, [dictionary({"database": {"port": 5433}}), dictionary(VALUE)])
+
+    assert result.config is not previous
+    assert result.config.database.port == 5433
+    assert result.config.cache is previous.cache
+    assert result.config.limits is previous.limits
+    assert result.changes == [("database", "port")]
+    assert result.has_changed(("database",))
+    assert result.has_changed(("database", "port"))
+    assert not result.has_changed(("database", "host"))
+    assert not result.has_changed(("cache",))
+
+
+def test_changed_mapping_keys():
+    previous = load(Configuration, [dictionary(VALUE)])
+    value = {**VALUE, "limits": {"requests": 10, "timeout": 3}}
+    result = reload(previous, [dictionary(value)])
+
+    assert sorted(result.changes) == [("limits", "connections"), ("limits", "timeout")]
+    assert result.config.database is previous.database
@@ -0,0 +1,109 @@
+from dataclasses import dataclass, field
+import json
+from typing import Dict, List
+
+import pytest
+
+from nectarine import load
+from nectarine.compilation import compile_config
+from nectarine.errors import NectarineStrictLoadingError
+from nectarine.merging import replace
+from nectarine.providers.arguments import arguments
+from nectarine.providers.compiled import compiled
+from nectarine.providers.dictionary import dictionary
+from nectarine.providers.env import env
+from nectarine.providers.json import json as json_provider
+
+
+@dataclass
+class Pool:
+    size: int = 4
+    timeout: float = 1.
+
+
+@dataclass
+class Database:
+    host: str
+    pool: Pool
+    replicas: List[str] = field(default_factory=list)
+
+
+@dataclass
+class Server:
+    port: int
+
+
+@dataclass
+class Configuration:
+    database: Database
+    server: Server
+    labels: Dict[str, str] = field(default_factory=dict)
+
+
+VALUE = {
+    "database": {"host": "localhost", "pool": {"size": 8}, "replicas": ["a"]},
+    "server": {"port": 80},
+}
+
+
+def test_section():
+    database = load(Configuration, [dictionary(VALUE)], path=("database",))
+
+    assert database == Database(host="localhost", pool=Pool(size=8), replicas=["a"])
+
+
+def test_nested_section():
+    assert load(Configuration, [dictionary(VALUE)], path=("database", "pool")) == Pool(size=8)
+
+
+def test_names_match_full_load():
+    providers = [
+        arguments(["--database-pool-size", "16", "--server-port", "8080"]),
+        env(prefix="APP_", environ={"APP_DATABASE_HOST": "db", "APP_SERVER_PORT": "not a port"}),
+        dictionary(VALUE),
+    ]
+    database = load(Configuration, providers, path=("database",))
+
+    assert database == Database(host="db", pool=Pool(size=16), replicas=["a"])
+
+
+def test_other_sections_are_not_read():
+    # The server port is invalid, which only matters when loading the server section
+    providers = [dictionary({**VALUE, "server": {"port": "not a port"}})]
+
+    assert load(Configuration, providers, path=("database",)).host == "localhost"
+
+
+def test_unknown_flags():
+    with pytest.raises(NectarineStrictLoadingError):
+        load(Configuration, [arguments(["--unknown", "1"]), dictionary(VALUE)], path=("database",))
+
+
+def test_strict_keys_are_full_paths():
+    providers = [dictionary({**VALUE, "database": {**VALUE["database"], "extra": 1}})]
+
+    with pytest.raises(NectarineStrictLoadingError) as e:
+        load(Configuration, providers, strict=True, path=("database",))
+    assert e.value.offending_keys == [("database", "extra")]
+
+
+def test_merge_by_path():
+    providers = [dictionary({"database": {"replicas": ["b"]}}), dictionary(VALUE)]
+    database = load(Configuration, providers, merge={("database", "replicas"): replace}, path=("database",))
+
+    assert database.replicas == ["b"]
+
+
+def test_files(tmp_path):
+    (tmp_path / "config.json").write_text(json.dumps(VALUE))
+    compile_config(Configuration, [dictionary(VALUE)], str(tmp_path / "config.bin"))
+
+    assert load(Configuration, [json_provider(str(tmp_path / "config.json"))], path=("server",)) == Server(port=80)
+    assert load(Configuration, [compiled(str(tmp_path / "config.bin"))], path=("server",)) == Server(port=80)
+
+
+def test_invalid_paths():
+    with pytest.raises(NectarineStrictLoadingError):
+        load(Configuration, [dictionary(VALUE)], path=("cache",))
+    with pytest.raises(TypeError):
+        load(Configuration, [dictionary(VALUE)], path=("labels",))
@@ -0,0 +1,147 @@
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from enum import Enum
+from ipaddress import IPv4Network
+import json
+from typing import Dict, FrozenSet, List, Literal, Optional, Set, Tuple
+
+from nectarine import load
+from nectarine.columnar import Columnar
+from nectarine.providers.arguments import arguments
+from nectarine.providers.dictionary import dictionary
+from nectarine.providers.env import env
+from nectarine.providers.json import json as json_provider
+from nectarine.serialization import to_argv, to_dict, to_env, to_json
+
+
+class Mode(Enum):
+    FAST = "fast"
+    SAFE = "safe"
+
+
+@dataclass
+class Endpoint:
+    host: str
+    port: int = 80
+
+
+@dataclass
+class Route:
+    path: str
+    weight: float
+
+
+@dataclass
+class Configuration:
+    endpoint: Endpoint
+    debug: bool = False
+    ratio: float = 0.5
+    level: Literal["low", "high"] = "low"
+    mode: Mode = Mode.SAFE
+    started: datetime = datetime(2020, 1, 1, 12, 30)
+    timeout: timedelta = timedelta(seconds=5)
+    networks: List[IPv4Network] = field(default_factory=list)
+    ports: List[int] = field(default_factory=list)
+    size: Tuple[int, int] = (1, 2)
+    names: Set[str] = field(default_factory=set)
+    labels: Dict[str, str] = field(default_factory=dict)
+    routes: Optional[Columnar[Route]] = None
+    comment: Optional[str] = None
+
+
+CONFIG = Configuration(
+    endpoint=Endpoint(host="example.com", port=8080),
+    debug=True,
+    ratio=0.25,
+    level="high",
+    mode=Mode.FAST,
+    started=datetime(2021, 5, 6, 7, 8, 9),
+    timeout=timedelta(minutes=2),
+    networks=[IPv4Network("10.0.0.0/8")],
+    ports=[1, 2],
+    size=(3, 4),
+    names={"a"},
+    labels={"team": "core"},
+)
+
+
+def test_to_dict():
+    value = to_dict(CONFIG)
+
+    assert value["endpoint"] == {"host": "example.com", "port": 8080}
+    assert value["mode"] == "FAST"
+    assert value["networks"] == ["10.0.0.0/8"]
+    assert value["size"] == (3, 4)
+    assert load(Configuration, [dictionary(value)]) == CONFIG
+
+
+def test_to_json(tmp_path):
+    document = to_json(CONFIG)
+    (tmp_path / "config.json").write_bytes(document)
+
+    assert isinstance(document, bytes)
+    assert load(Configuration, [json_provider(str(tmp_path / "config.json"))]) == CONFIG
+
+
+def test_columnar_to_dict_and_json():
+    config = load(Configuration, [dictionary({"endpoint": {"host": "h"}, "routes": [{"path": "/", "weight": 1.5}]})])
+
+    assert to_dict(config)["routes"] == [{"path": "/", "weight": 1.5}]
+    assert json.loads(to_json(config))["routes"] == [{"path": "/", "weight": 1.5}]
+    assert load(Configuration, [dictionary(to_dict(config))]) == config
+
+
+def test_to_env():
+    variables = to_env(CONFIG, prefix="APP_", allow_lists=True)
+
+    assert variables["APP_ENDPOINT_HOST"] == "example.com"
+    assert variables["APP_DEBUG"] == "true"
+    assert variables["APP_PORTS"] == "1,2"
+    assert "APP_COMMENT" not in variables
+    config = load(Configuration, [env(prefix="APP_", allow_lists=True, environ=variables)])
+    assert config == replace(CONFIG, labels={})  # Dictionaries cannot be read from the environment
+
+
+def test_to_argv():
+    argv = to_argv(CONFIG)
+
+    assert argv[:4] == ["--endpoint-host", "example.com", "--endpoint-port", "8080"]
+    assert argv.count("--ports") == 2
+    config = load(Configuration, [arguments(argv)])
+    assert config.endpoint == CONFIG.endpoint
+    assert config.debug is True
+    assert config.ratio == CONFIG.ratio
+    assert config.started == CONFIG.started
+    assert config.timeout == CONFIG.timeout
+    assert config.networks == CONFIG.networks
+    assert config.ports == CONFIG.ports
+    assert tuple(config.size) == CONFIG.size
+
+
+def test_boolean_items_to_argv():
+    @dataclass
+    class Switches:
+        enabled: Tuple[bool, ...]
+        pair: Tuple[bool, int]
+
+    config = Switches(enabled=(True, False), pair=(False, 1))
+    argv = to_argv(config)
+
+    assert argv == ["--enabled", "true", "--enabled", "false", "--pair", "false", "1"]
+    assert load(Switches, [arguments(argv)]) == config
+
+
+def test_number_keys_and_sets(tmp_path):
+    @dataclass
+    class Shards:
+        owners: Dict[int, str]
+        weights: Dict[float, int]
+        ids: Set[int]
+        zones: FrozenSet[str]
+
+    config = Shards(owners={1: "a", 2: "b"}, weights={0.5: 1}, ids={3, 4}, zones=frozenset({"eu"}))
+    (tmp_path / "shards.json").write_bytes(to_json(config))
+
+    assert load(Shards, [json_provider(str(tmp_path / "shards.json"))]) == config
+    loaded = load(Shards, [arguments(to_argv(config)), dictionary({"owners": {}, "weights": {}})])
+    assert (loaded.ids, loaded.zones) == (config.ids, config.zones)
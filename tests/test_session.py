@@ -0,0 +1,55 @@
+from dataclasses import dataclass
+
+import pytest
+
+from nectarine import Session, arguments, dictionary, env
+from nectarine.errors import NectarineLateRegistrationError, NectarineStrictLoadingError
+
+
+@dataclass
+class Database:
+    host: str
+    port: int = 5432
+
+
+@dataclass
+class Server:
+    port: int
+    workers: int = 1
+
+
+@dataclass
+class Unregistered:
+    value: int = 0
+
+
+def test_session_loads_several_targets():
+    environ = {"PORT": "8080"}
+    session = Session([
+        arguments(argv=["--host", "db", "--workers", "4"]),
+        env(environ=environ),
+        dictionary({"port": 5433}),
+    ])
+    session.register(Database, Server)
+
+    database = session.load(Database)
+    environ["PORT"] = "9090"  # The environment was captured by the first load
+    server = session.load(Server)
+
+    assert database == Database(host="db", port=8080)
+    assert server == Server(port=8080, workers=4)
+    assert session.load(Database) is database
+
+
+def test_session_unknown_arguments():
+    session = Session([arguments(argv=["--host", "db", "--unknown", "1"])])
+    session.register(Database, Server)
+    with pytest.raises(NectarineStrictLoadingError):
+        session.load(Database)
+
+
+def test_session_registration_after_load():
+    session = Session([dictionary({"host": "db", "port": 1})])
+    session.load(Database)
+    with pytest.raises(NectarineLateRegistrationError):
+        session.load(Unregistered)
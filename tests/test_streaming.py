@@ -0,0 +1,88 @@
+from dataclasses import dataclass
+import io
+import re
+from typing import List, Optional
+
+import pytest
+
+from nectarine import iter_load
+from nectarine.errors import NectarineInvalidValueError, NectarineMissingValueError
+
+
+@dataclass
+class Spec:
+    name: str
+    retries: int = 3
+    tags: Optional[List[str]] = None
+
+
+def test_jsonl():
+    stream = io.StringIO('{"name": "a"}\n\n{"name": "b", "retries": 5, "tags": ["x"]}\n')
+    specs = list(iter_load(Spec, stream))
+
+    assert specs == [Spec(name="a"), Spec(name="b", retries=5, tags=["x"])]
+
+
+def test_yaml():
+    pytest.importorskip("yaml")
+    stream = io.StringIO("name: a\n---\nname: b\nretries: 5\n")
+    specs = list(iter_load(Spec, stream, format="yaml"))
+
+    assert specs == [Spec(name="a"), Spec(name="b", retries=5)]
+
+
+def test_records_are_loaded_lazily():
+    def lines():
+        yield '{"name": "a"}'
+        yield '{"name": 1}'
+
+    specs = iter_load(Spec, lines())
+    assert next(specs) == Spec(name="a")
+    with pytest.raises(NectarineInvalidValueError):
+        next(specs)
+
+
+def test_errors_are_collected():
+    stream = io.StringIO('{"name": "a"}\n{"retries": 1}\nnot json\n[1]\n{"name": "b", "retries": "x"}\n{"name": "c"}\n')
+    errors = []
+    specs = list(iter_load(Spec, stream, errors=errors))
+
+    assert specs == [Spec(name="a"), Spec(name="c")]
+    assert [e.index for e in errors] == [1, 2, 3, 4]
+    assert isinstance(errors[0].error, NectarineMissingValueError)
+    assert isinstance(errors[1].error, ValueError)
+    assert isinstance(errors[2].error, NectarineInvalidValueError)
+
+
+class Version:
+    def __init__(self, parts):
+        self.parts = parts
+
+    @staticmethod
+    def parse(value):
+        return Version(list(re.fullmatch(r"(\d+)\.(\d+)", value).groups()))  # AttributeError if it does not match
+
+
+@dataclass
+class Release:
+    version: Version
+
+
+def test_errors_of_custom_types_and_yaml_are_collected():
+    errors = []
+    stream = io.StringIO('{"version": "1.2"}\n{"version": "latest"}\n{"version": "2.0"}\n')
+    releases = list(iter_load(Release, stream, errors=errors))
+
+    assert [r.version.parts for r in releases] == [["1", "2"], ["2", "0"]]
+    assert [e.index for e in errors] == [1]
+
+    pytest.importorskip("yaml")
+    errors = []
+    specs = list(iter_load(Spec, io.StringIO("name: a\n---\nname: [b\n---\nname: c\n"), format="yaml", errors=errors))
+    assert specs == [Spec(name="a")]
+    assert [e.index for e in errors] == [1]
+
+
+def test_unsupported_format():
+    with pytest.raises(ValueError):
+        list(iter_load(Spec, io.StringIO(""), format="xml"))
@@ -134,3 +134,19 @@ def test_is_conform_to_hint():
     assert not is_conform_to_hint(1, str)
     assert not is_conform_to_hint(None, str)
     assert not is_conform_to_hint("abc", Union[float, int])
+
+
+def test_is_conform_to_literal_hint():
+    assert is_conform_to_hint("eu-west-1", Literal["eu-west-1", "us-east-1"])
+    assert is_conform_to_hint(["eu-west-1"] * 3, List[Literal["eu-west-1", "us-east-1"]])
+    assert is_conform_to_hint((1, "a"), Tuple[Literal[1, 2], str])
+
+    assert not is_conform_to_hint("eu-west-2", Literal["eu-west-1", "us-east-1"])
+    assert not is_conform_to_hint(["eu-west-1"], Literal["eu-west-1", "us-east-1"])
+
+
+def test_compile_validator_is_cached():
+    hint = List[Literal["a", "b"]]
+    assert compile_validator(hint) is compile_validator(hint)
+    assert compile_validator(hint)(["a", "b"])
+    assert not compile_validator(hint)(["c"])